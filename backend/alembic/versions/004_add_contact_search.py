@@ -0,0 +1,148 @@
+"""add contact search
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-17
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "004"
+down_revision = "003"
+branch_labels = None
+depends_on = None
+
+# Rows backfilled per statement (each its own transaction)
+BACKFILL_BATCH_SIZE = 5000
+
+
+def search_vector_sql(row: str = "") -> str:
+    """The contact's weighted search vector, over the columns of ``row``."""
+    return (
+        f"setweight(to_tsvector('es_unaccent'::regconfig, {row}nombre_completo), 'A') || "
+        f"setweight(to_tsvector('es_unaccent'::regconfig, {row}email), 'B') || "
+        "setweight(to_tsvector('es_unaccent'::regconfig, "
+        f"{row}telefono || ' ' || coalesce({row}cedula, '')), 'C')"
+    )
+
+
+SEARCH_DOCUMENT_SQL = (
+    "f_unaccent(lower(nombre_completo || ' ' || email || ' ' || telefono"
+    " || ' ' || coalesce(cedula, '')))"
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+
+    # unaccent() is only STABLE because its dictionary can change; pinning the
+    # dictionary in an IMMUTABLE wrapper lets it be used in index expressions
+    op.execute("""
+        CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+        AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$
+        """)
+
+    # Spanish stemming on accent-folded words, so "gomez" finds "Gómez"
+    op.execute(
+        "CREATE TEXT SEARCH CONFIGURATION es_unaccent (COPY = pg_catalog.spanish)"
+    )
+    op.execute(
+        "ALTER TEXT SEARCH CONFIGURATION es_unaccent "
+        "ALTER MAPPING FOR hword, hword_part, word WITH public.unaccent, spanish_stem"
+    )
+
+    # Ranked word search. A STORED generated column would rewrite the whole
+    # table under an ACCESS EXCLUSIVE lock; a plain nullable column is added
+    # without touching the rows, kept current by a trigger and backfilled below
+    op.add_column("contacts", sa.Column("search_vector", postgresql.TSVECTOR()))
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION contacts_search_vector() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            NEW.search_vector := {search_vector_sql("NEW.")};
+            RETURN NEW;
+        END
+        $$
+        """)
+    op.execute("""
+        CREATE TRIGGER contacts_search_vector
+        BEFORE INSERT OR UPDATE OF nombre_completo, email, telefono, cedula
+        ON contacts FOR EACH ROW EXECUTE FUNCTION contacts_search_vector()
+        """)
+
+    # Outside the migration's transaction: the trigger is committed (and covers
+    # rows written from now on) before the backfill starts, each batch only
+    # locks its own rows, and CREATE INDEX CONCURRENTLY does not block writes
+    with op.get_context().autocommit_block():
+        _backfill_search_vector()
+
+        op.create_index(
+            "ix_contacts_search_vector",
+            "contacts",
+            ["search_vector"],
+            postgresql_using="gin",
+            postgresql_where=sa.text("is_deleted = false"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+        # Substring search (partial names, emails, phone and cedula fragments)
+        op.create_index(
+            "ix_contacts_search_trgm",
+            "contacts",
+            [sa.text(f"({SEARCH_DOCUMENT_SQL}) gin_trgm_ops")],
+            postgresql_using="gin",
+            postgresql_where=sa.text("is_deleted = false"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def _backfill_search_vector() -> None:
+    """Fill ``search_vector`` for existing rows, walking the primary key."""
+    bind = op.get_bind()
+    last_id = None
+    while True:
+        after = "WHERE id > :last_id" if last_id is not None else ""
+        last_id = bind.execute(
+            sa.text(f"""
+                WITH batch AS (
+                    SELECT id FROM contacts {after} ORDER BY id LIMIT :batch_size
+                ), filled AS (
+                    UPDATE contacts SET search_vector = {search_vector_sql()}
+                    WHERE id IN (SELECT id FROM batch) AND search_vector IS NULL
+                )
+                SELECT id FROM batch ORDER BY id DESC LIMIT 1
+                """),
+            {"last_id": last_id, "batch_size": BACKFILL_BATCH_SIZE},
+        ).scalar()
+        if last_id is None:
+            return
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_contacts_search_trgm",
+            table_name="contacts",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_contacts_search_vector",
+            table_name="contacts",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.execute("DROP TRIGGER IF EXISTS contacts_search_vector ON contacts")
+    op.execute("DROP FUNCTION IF EXISTS contacts_search_vector()")
+    op.drop_column("contacts", "search_vector")
+
+    op.execute("DROP TEXT SEARCH CONFIGURATION IF EXISTS es_unaccent")
+    op.execute("DROP FUNCTION IF EXISTS f_unaccent(text)")
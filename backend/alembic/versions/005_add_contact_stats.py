@@ -0,0 +1,151 @@
+"""add contact stats
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-17
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "005"
+down_revision = "004"
+branch_labels = None
+depends_on = None
+
+# Also used by the reconcile job in app.crud.contact_stats
+STATS_KEYS_SQL = """
+CREATE OR REPLACE FUNCTION contact_stats_keys(
+    estado text, ciudad text, pais text, created_at timestamp
+) RETURNS TABLE (dimension text, key text)
+LANGUAGE sql STABLE PARALLEL SAFE
+AS $$
+    VALUES
+        ('total', ''),
+        ('estado', estado),
+        ('ciudad', coalesce(ciudad, '')),
+        ('pais', coalesce(pais, '')),
+        ('created_day', to_char(created_at, 'YYYY-MM-DD'))
+$$
+"""
+
+
+def _changes(table: str, sign: int) -> str:
+    return (
+        f"SELECT k.dimension, k.key, {sign} AS delta FROM {table} r, "
+        "contact_stats_keys(r.estado::text, r.ciudad, r.pais, r.created_at) k "
+        "WHERE NOT r.is_deleted"
+    )
+
+
+def _apply(*sources: str) -> str:
+    # Keys are upserted in a fixed order so concurrent writers cannot deadlock
+    return f"""
+        INSERT INTO contact_stats AS s (dimension, key, count)
+        SELECT dimension, key, sum(delta) FROM ({" UNION ALL ".join(sources)}) AS c
+        GROUP BY dimension, key
+        HAVING sum(delta) <> 0
+        ORDER BY dimension, key
+        ON CONFLICT (dimension, key) DO UPDATE SET count = s.count + EXCLUDED.count;
+    """
+
+
+# One run per statement over its transition tables, so a COPY merge or a bulk
+# update costs one upsert per touched key rather than one per row
+TRACK_SQL = f"""
+CREATE OR REPLACE FUNCTION contact_stats_track() RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        {_apply(_changes("new_rows", 1))}
+    ELSIF TG_OP = 'UPDATE' THEN
+        {_apply(_changes("new_rows", 1), _changes("old_rows", -1))}
+    ELSE
+        {_apply(_changes("old_rows", -1))}
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+
+BACKFILL_SQL = """
+SELECT k.dimension, k.key, count(*) FROM contacts r,
+    contact_stats_keys(r.estado::text, r.ciudad, r.pais, r.created_at) k
+WHERE NOT r.is_deleted
+GROUP BY k.dimension, k.key
+"""
+
+# In the triggers' key order, so it cannot deadlock with them
+MERGE_BACKFILL_SQL = """
+INSERT INTO contact_stats AS s (dimension, key, count)
+SELECT * FROM unnest(
+    CAST(:dimensions AS text[]), CAST(:keys AS text[]), CAST(:counts AS bigint[])
+)
+ORDER BY 1, 2
+ON CONFLICT (dimension, key) DO UPDATE SET count = s.count + EXCLUDED.count
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "contact_stats",
+        sa.Column("dimension", sa.String(), nullable=False),
+        sa.Column("key", sa.String(), nullable=False),
+        sa.Column("count", sa.BigInteger(), server_default="0", nullable=False),
+        sa.PrimaryKeyConstraint("dimension", "key"),
+    )
+    op.execute(STATS_KEYS_SQL)
+    op.execute(TRACK_SQL)
+    op.execute(
+        "CREATE TRIGGER contact_stats_insert AFTER INSERT ON contacts "
+        "REFERENCING NEW TABLE AS new_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION contact_stats_track()"
+    )
+    op.execute(
+        "CREATE TRIGGER contact_stats_update AFTER UPDATE ON contacts "
+        "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION contact_stats_track()"
+    )
+    op.execute(
+        "CREATE TRIGGER contact_stats_delete AFTER DELETE ON contacts "
+        "REFERENCING OLD TABLE AS old_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION contact_stats_track()"
+    )
+
+    # Backfill from the existing rows. CREATE TRIGGER holds SHARE ROW EXCLUSIVE
+    # on contacts until the migration's transaction commits, blocking every
+    # contact write, so the full scan must not run in it. This transaction's
+    # snapshot, taken once the lock is held, is exactly the table the triggers
+    # start counting from; a second connection imports it and counts the rows
+    # after the commit without blocking anyone. Its counts are then added to
+    # whatever the triggers recorded meanwhile
+    bind = op.get_bind()
+    snapshot = bind.execute(sa.text("SELECT pg_export_snapshot()")).scalar()
+    with bind.engine.connect() as counter:
+        counter.execution_options(isolation_level="REPEATABLE READ")
+        counter.begin()
+        counter.execute(sa.text(f"SET TRANSACTION SNAPSHOT '{snapshot}'"))
+        with op.get_context().autocommit_block():
+            rows = counter.execute(sa.text(BACKFILL_SQL)).all()
+            counter.rollback()
+            if rows:
+                dimensions, keys, counts = (list(column) for column in zip(*rows))
+                bind.execute(
+                    sa.text(MERGE_BACKFILL_SQL),
+                    {"dimensions": dimensions, "keys": keys, "counts": counts},
+                )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS contact_stats_delete ON contacts")
+    op.execute("DROP TRIGGER IF EXISTS contact_stats_update ON contacts")
+    op.execute("DROP TRIGGER IF EXISTS contact_stats_insert ON contacts")
+    op.execute("DROP FUNCTION IF EXISTS contact_stats_track()")
+    op.execute(
+        "DROP FUNCTION IF EXISTS contact_stats_keys(text, text, text, timestamp)"
+    )
+    op.drop_table("contact_stats")
@@ -0,0 +1,71 @@
+"""add contact sort indexes
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-17
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "006"
+down_revision = "005"
+branch_labels = None
+depends_on = None
+
+# Must match app.crud.contact.SORTABLE_FIELDS
+SORTABLE_FIELDS = (
+    "apellidos",
+    "nombres",
+    "nombre_completo",
+    "email",
+    "estado",
+    "ciudad",
+    "created_at",
+    "updated_at",
+)
+
+LIVE = sa.text("is_deleted = false")
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction, and avoids
+    # blocking writes to contacts while each index is built
+    with op.get_context().autocommit_block():
+        for field in SORTABLE_FIELDS:
+            op.create_index(
+                f"ix_contacts_live_{field}",
+                "contacts",
+                [field, "id"],
+                postgresql_where=LIVE,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        # The default listing filtered by estado
+        op.create_index(
+            "ix_contacts_live_estado_apellidos",
+            "contacts",
+            ["estado", "apellidos", "id"],
+            postgresql_where=LIVE,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_contacts_live_estado_apellidos",
+            table_name="contacts",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        for field in reversed(SORTABLE_FIELDS):
+            op.drop_index(
+                f"ix_contacts_live_{field}",
+                table_name="contacts",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,122 @@
+"""add archive tables
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-17
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "007"
+down_revision = "006"
+branch_labels = None
+depends_on = None
+
+# Must match app.models.archive
+CONTACT_COLUMNS = (
+    "id, created_at, updated_at, nombres, apellidos, nombre_completo, email, "
+    "telefono, estado, cedula, ciudad, pais, notas"
+)
+USER_COLUMNS = (
+    "id, created_at, updated_at, email, hashed_password, nombres, apellidos, "
+    "is_active, is_superuser, theme_preference"
+)
+
+
+def _timestamps() -> list:
+    return [
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+    ]
+
+
+def _archived_at() -> sa.Column:
+    return sa.Column(
+        "archived_at",
+        sa.DateTime(),
+        server_default=sa.text("timezone('utc', now())"),
+        nullable=False,
+    )
+
+
+def upgrade() -> None:
+    op.create_table(
+        "contacts_archive",
+        *_timestamps(),
+        sa.Column("nombres", sa.String(), nullable=False),
+        sa.Column("apellidos", sa.String(), nullable=False),
+        sa.Column("nombre_completo", sa.String(), nullable=False),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("telefono", sa.String(), nullable=False),
+        sa.Column(
+            "estado",
+            postgresql.ENUM(name="contactstatus", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("cedula", sa.String(), nullable=True),
+        sa.Column("ciudad", sa.String(), nullable=True),
+        sa.Column("pais", sa.String(), nullable=True),
+        sa.Column("notas", sa.String(), nullable=True),
+        _archived_at(),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_contacts_archive_archived_at", "contacts_archive", ["archived_at"]
+    )
+
+    op.create_table(
+        "users_archive",
+        *_timestamps(),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("hashed_password", sa.String(), nullable=False),
+        sa.Column("nombres", sa.String(), nullable=False),
+        sa.Column("apellidos", sa.String(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("is_superuser", sa.Boolean(), nullable=False),
+        sa.Column("theme_preference", sa.String(), nullable=False),
+        _archived_at(),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_users_archive_archived_at", "users_archive", ["archived_at"])
+
+    # The archive job's scan: only soft-deleted contacts, so the index stays
+    # small; users are few enough to scan
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_contacts_deleted_updated_at",
+            "contacts",
+            ["updated_at"],
+            postgresql_where=sa.text("is_deleted = true"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_contacts_deleted_updated_at",
+            table_name="contacts",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+    # Archived rows go back as soft-deleted rather than being lost; rows whose
+    # email was taken again in the meantime cannot
+    op.execute(
+        f"INSERT INTO users ({USER_COLUMNS}, is_deleted) "
+        f"SELECT {USER_COLUMNS}, true FROM users_archive ON CONFLICT DO NOTHING"
+    )
+    op.execute(
+        f"INSERT INTO contacts ({CONTACT_COLUMNS}, is_deleted) "
+        f"SELECT {CONTACT_COLUMNS}, true FROM contacts_archive ON CONFLICT DO NOTHING"
+    )
+    op.drop_index("ix_users_archive_archived_at", table_name="users_archive")
+    op.drop_table("users_archive")
+    op.drop_index("ix_contacts_archive_archived_at", table_name="contacts_archive")
+    op.drop_table("contacts_archive")
@@ -0,0 +1,104 @@
+"""shard contact stats
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-17
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "008"
+down_revision = "007"
+branch_labels = None
+depends_on = None
+
+# Every write used to upsert the same ("total", "") row (and the estado and
+# today's created_day rows), so concurrent contact writes queued on its row
+# lock until each other committed. Each backend now adds its deltas to its own
+# shard of every key; readers sum the shards
+STATS_SHARDS = 16
+
+
+def _changes(table: str, sign: int) -> str:
+    return (
+        f"SELECT k.dimension, k.key, {sign} AS delta FROM {table} r, "
+        "contact_stats_keys(r.estado::text, r.ciudad, r.pais, r.created_at) k "
+        "WHERE NOT r.is_deleted"
+    )
+
+
+def _apply(sources: list, sharded: bool) -> str:
+    # Keys are upserted in a fixed order so concurrent writers cannot deadlock
+    if sharded:
+        columns, shard, conflict = (
+            "dimension, key, shard, count",
+            f"pg_backend_pid() % {STATS_SHARDS}, ",
+            "dimension, key, shard",
+        )
+    else:
+        columns, shard, conflict = "dimension, key, count", "", "dimension, key"
+    return f"""
+        INSERT INTO contact_stats AS s ({columns})
+        SELECT dimension, key, {shard}sum(delta)
+        FROM ({" UNION ALL ".join(sources)}) AS c
+        GROUP BY dimension, key
+        HAVING sum(delta) <> 0
+        ORDER BY dimension, key
+        ON CONFLICT ({conflict}) DO UPDATE SET count = s.count + EXCLUDED.count;
+    """
+
+
+def _track_sql(sharded: bool) -> str:
+    inserted = _apply([_changes("new_rows", 1)], sharded)
+    updated = _apply([_changes("new_rows", 1), _changes("old_rows", -1)], sharded)
+    deleted = _apply([_changes("old_rows", -1)], sharded)
+    return f"""
+        CREATE OR REPLACE FUNCTION contact_stats_track() RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                {inserted}
+            ELSIF TG_OP = 'UPDATE' THEN
+                {updated}
+            ELSE
+                {deleted}
+            END IF;
+            RETURN NULL;
+        END
+        $$
+        """
+
+
+def upgrade() -> None:
+    # contact_stats holds one row per key, so rebuilding its key is quick
+    op.add_column(
+        "contact_stats",
+        sa.Column("shard", sa.SmallInteger(), server_default="0", nullable=False),
+    )
+    op.drop_constraint("contact_stats_pkey", "contact_stats", type_="primary")
+    op.create_primary_key(
+        "contact_stats_pkey", "contact_stats", ["dimension", "key", "shard"]
+    )
+    op.execute(_track_sql(sharded=True))
+
+
+def downgrade() -> None:
+    op.execute("LOCK TABLE contact_stats IN EXCLUSIVE MODE")
+    op.execute("""
+        WITH folded AS (
+            DELETE FROM contact_stats WHERE shard <> 0
+            RETURNING dimension, key, count
+        )
+        INSERT INTO contact_stats AS s (dimension, key, shard, count)
+        SELECT dimension, key, 0, sum(count) FROM folded GROUP BY dimension, key
+        ON CONFLICT (dimension, key, shard) DO UPDATE
+        SET count = s.count + EXCLUDED.count
+        """)
+    op.execute(_track_sql(sharded=False))
+    op.drop_constraint("contact_stats_pkey", "contact_stats", type_="primary")
+    op.create_primary_key("contact_stats_pkey", "contact_stats", ["dimension", "key"])
+    op.drop_column("contact_stats", "shard")
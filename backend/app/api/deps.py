@@ -1,61 +1,178 @@
-from typing import Generator
-from fastapi import Depends, HTTPException, status
+from typing import AsyncGenerator, Callable, Generator, Optional
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app import crud, models, schemas
+from app import crud, schemas
 from app.core import security
 from app.core.config import settings
-from app.database import SessionLocal
+from app.core.replicas import SAFE_METHODS, Replica, is_sticky
+from app.crud.user import principal_cache
+from app.database import AsyncSessionLocal, SessionLocal, replicas, statement_timeout
+from app.models.user import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_PREFIX}/auth/login")
 
 
-def get_db() -> Generator:
+def _read_replica(request: Request) -> Optional[Replica]:
+    """A healthy replica for a safe request, unless the client just wrote."""
+    if request.method not in SAFE_METHODS or not replicas:
+        return None
+    if is_sticky(request):
+        return None
+    return replicas.pick()
+
+
+def get_session_factory(request: Request) -> Callable[[], Session]:
+    """``get_db``'s choice of database, for sessions opened later.
+
+    Streamed responses run after the request's dependencies are torn down,
+    so they open their session themselves through this factory.
+    """
+    replica = _read_replica(request)
+    return replica.session if replica else SessionLocal
+
+
+def get_db(request: Request) -> Generator:
+    """Session for the request: a read replica for GETs, else the primary."""
+    db = get_session_factory(request)()
     try:
-        db = SessionLocal()
         yield db
     finally:
         db.close()
 
 
-def get_current_user(
-    db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
-) -> models.User:
-    credentials_exception = HTTPException(
+async def get_async_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    replica = _read_replica(request)
+    async with (replica.async_session if replica else AsyncSessionLocal)() as db:
+        yield db
+
+
+# Async so the value is set in the request's context, where the sync routes'
+# threads pick it up; a sync dependency would set it in a throwaway copy
+async def short_statement_timeout() -> None:
+    statement_timeout.set(settings.DB_STATEMENT_TIMEOUT_MS)
+
+
+async def long_statement_timeout() -> None:
+    """For routes that legitimately run long: exports, imports, bulk writes."""
+    statement_timeout.set(settings.DB_LONG_STATEMENT_TIMEOUT_MS)
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+def _token_subject(token: str) -> str:
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
         )
         token_data = schemas.TokenPayload(**payload)
     except (JWTError, ValidationError):
-        raise credentials_exception
+        raise _credentials_exception()
+    return token_data.sub
+
 
-    user = crud.user.get(db, id=token_data.sub)
+def get_current_user(
+    db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
+) -> schemas.User:
+    """Resolve the bearer token to a principal.
+
+    The principal is a ``schemas.User`` snapshot served from the in-process
+    principal cache when possible, so a hit costs no database round trip.
+    Endpoints that need to modify the row must load it through ``crud.user``.
+    """
+    subject = _token_subject(token)
+    principal = principal_cache.get(subject)
+    if principal is None:
+        user = crud.user.get(db, id=subject)
+        if not user:
+            raise _credentials_exception()
+        principal = schemas.User.model_validate(user)
+        principal_cache.set(subject, principal)
+    return principal
+
+
+async def get_current_user_async(
+    db: AsyncSession = Depends(get_async_db), token: str = Depends(oauth2_scheme)
+) -> schemas.User:
+    """``get_current_user`` for async routes; shares the principal cache."""
+    subject = _token_subject(token)
+    principal = principal_cache.get(subject)
+    if principal is None:
+        user = await crud.async_user.get(db, id=subject)
+        if not user:
+            raise _credentials_exception()
+        principal = schemas.User.model_validate(user)
+        principal_cache.set(subject, principal)
+    return principal
+
+
+def get_current_user_row(
+    db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
+) -> User:
+    """The active current user's row, for endpoints that modify it.
+
+    Loads the row once and refreshes the principal cache from it, rather than
+    resolving the principal first and fetching the same row again.
+    """
+    subject = _token_subject(token)
+    user = crud.user.get(db, id=subject)
     if not user:
-        raise credentials_exception
+        raise _credentials_exception()
+    principal = schemas.User.model_validate(user)
+    principal_cache.set(subject, principal)
+    get_current_active_user(principal)
+    return user
+
+
+async def get_current_user_row_async(
+    db: AsyncSession = Depends(get_async_db), token: str = Depends(oauth2_scheme)
+) -> User:
+    """``get_current_user_row`` for async routes."""
+    subject = _token_subject(token)
+    user = await crud.async_user.get(db, id=subject)
+    if not user:
+        raise _credentials_exception()
+    principal = schemas.User.model_validate(user)
+    principal_cache.set(subject, principal)
+    get_current_active_user(principal)
     return user
 
 
 def get_current_active_user(
-    current_user: models.User = Depends(get_current_user),
-) -> models.User:
+    current_user: schemas.User = Depends(get_current_user),
+) -> schemas.User:
     if not crud.user.is_active(current_user):
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
 
 
 def get_current_active_superuser(
-    current_user: models.User = Depends(get_current_user),
-) -> models.User:
+    current_user: schemas.User = Depends(get_current_user),
+) -> schemas.User:
     if not crud.user.is_superuser(current_user):
         raise HTTPException(
             status_code=400, detail="The user doesn't have enough privileges"
         )
     return current_user
+
+
+async def get_current_active_user_async(
+    current_user: schemas.User = Depends(get_current_user_async),
+) -> schemas.User:
+    return get_current_active_user(current_user)
+
+
+async def get_current_active_superuser_async(
+    current_user: schemas.User = Depends(get_current_user_async),
+) -> schemas.User:
+    return get_current_active_superuser(current_user)
@@ -0,0 +1,31 @@
+from typing import Any
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from app.health import readiness
+
+router = APIRouter()
+
+
+@router.get("/health")
+def health_check():
+    return {"status": "ok"}
+
+
+@router.get("/health/live")
+def liveness() -> Any:
+    """The process is up and serving; touches no dependency"""
+    return {"status": "ok"}
+
+
+@router.get("/health/ready")
+def read_readiness() -> Any:
+    """Whether to send traffic here: the database answers at the migration head
+
+    503 while it does not. The body lists each check plus the pool state.
+    """
+    ready, checks = readiness()
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"status": "ready" if ready else "unavailable", "checks": checks},
+    )
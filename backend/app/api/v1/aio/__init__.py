@@ -0,0 +1 @@
+# Async (AsyncSession) versions of the v1 routes, used when DB_MODE=async
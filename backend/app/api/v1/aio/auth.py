@@ -0,0 +1,101 @@
+from datetime import timedelta
+from typing import Any
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud, schemas
+from app.api import deps
+from app.core import security
+from app.core.config import settings
+from app.models.user import User
+
+router = APIRouter()
+
+
+@router.post("/login", response_model=schemas.Token)
+async def login(
+    db: AsyncSession = Depends(deps.get_async_db),
+    form_data: OAuth2PasswordRequestForm = Depends(),
+) -> Any:
+    """OAuth2 compatible token login"""
+    user = await crud.async_user.authenticate(
+        db, email=form_data.username, password=form_data.password
+    )
+    if not user:
+        raise HTTPException(status_code=400, detail="Incorrect email or password")
+    elif not crud.async_user.is_active(user):
+        raise HTTPException(status_code=400, detail="Inactive user")
+
+    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    return {
+        "access_token": security.create_access_token(
+            user.id, expires_delta=access_token_expires
+        ),
+        "token_type": "bearer",
+    }
+
+
+@router.get("/me", response_model=schemas.User)
+async def read_users_me(
+    current_user: schemas.User = Depends(deps.get_current_active_user_async),
+) -> Any:
+    """Get current user"""
+    return current_user
+
+
+@router.post("/password-reset/request")
+async def request_password_reset(
+    password_reset: schemas.PasswordResetRequest,
+    db: AsyncSession = Depends(deps.get_async_db),
+) -> Any:
+    """Request password reset token"""
+    token = await crud.async_user.create_password_reset_token(
+        db, email=password_reset.email
+    )
+
+    # Always return success to prevent email enumeration
+    # In production, send email with token here
+    return {
+        "message": "Si el email existe, recibirás un enlace para restablecer tu contraseña"
+    }
+
+
+@router.post("/password-reset/confirm")
+async def confirm_password_reset(
+    password_reset: schemas.PasswordResetConfirm,
+    db: AsyncSession = Depends(deps.get_async_db),
+) -> Any:
+    """Reset password with token"""
+    user = await crud.async_user.verify_password_reset_token(
+        db, token=password_reset.token
+    )
+
+    if not user:
+        raise HTTPException(status_code=400, detail="Token inválido o expirado")
+
+    await crud.async_user.reset_password(
+        db, user=user, new_password=password_reset.new_password
+    )
+
+    return {"message": "Contraseña restablecida exitosamente"}
+
+
+@router.post("/password-change")
+async def change_password(
+    password_change: schemas.PasswordChange,
+    db: AsyncSession = Depends(deps.get_async_db),
+    db_user: User = Depends(deps.get_current_user_row_async),
+) -> Any:
+    """Change password for current user"""
+    user = await crud.async_user.change_password(
+        db,
+        user=db_user,
+        current_password=password_change.current_password,
+        new_password=password_change.new_password,
+    )
+
+    if not user:
+        raise HTTPException(status_code=400, detail="Contraseña actual incorrecta")
+
+    return {"message": "Contraseña cambiada exitosamente"}
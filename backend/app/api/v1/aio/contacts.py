@@ -0,0 +1,192 @@
+from typing import Any, Union
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud, schemas
+from app.api import deps
+from app.api.v1.contact_params import ContactListParams, fill_nombre_completo
+from app.core.conditional import (
+    is_not_modified,
+    not_modified,
+    resource_etag,
+    set_validators,
+)
+from app.core.pagination import InvalidCursorError
+from app.core.result_cache import result_cache
+from app.crud.contact_stats import get_stats_async
+
+router = APIRouter()
+
+
+@router.get(
+    "/",
+    response_model=Union[
+        schemas.PaginatedResponse[schemas.Contact],
+        schemas.CursorPaginatedResponse[schemas.Contact],
+    ],
+)
+async def read_contacts(
+    response: Response,
+    params: ContactListParams = Depends(),
+    db: AsyncSession = Depends(deps.get_async_db),
+    current_user: schemas.User = Depends(deps.get_current_active_user_async),
+) -> Any:
+    """Retrieve contacts with pagination, filters and sorting
+
+    With ``pagination=cursor`` (implied when ``cursor`` is sent) the response
+    carries opaque ``next_cursor``/``prev_cursor`` tokens instead of a page
+    number and total, and deep pages cost the same as the first one.
+
+    ``q`` searches names, email, phone and cedula ignoring case and accents;
+    without an explicit ``sort`` offset pages are ordered by relevance. Sorting
+    or filtering by a field that is not indexed for it is rejected with 400.
+
+    Responses carry an ``ETag`` over the page's ids, versions and total (over the
+    cached page, when offset pages come from the result cache); send it back in
+    ``If-None-Match`` to get ``304 Not Modified`` while nothing changed.
+
+    ``fields`` (comma separated, e.g. ``nombreCompleto,email,estado``) limits the
+    columns read and returned; ``id`` is always included. Without it every field
+    but ``notas`` is returned.
+    """
+    try:
+        if params.use_cursor:
+            signature = await crud.async_contact.keyset_signature(
+                db, limit=params.limit, cursor=params.cursor, **params.query_args
+            )
+            if not_modified := params.revalidate(response, *signature):
+                return not_modified
+            items, next_cursor, prev_cursor = await crud.async_contact.get_multi_keyset(
+                db,
+                limit=params.limit,
+                cursor=params.cursor,
+                fields=params.fields,
+                **params.query_args,
+            )
+            return params.cursor_page(response, items, next_cursor, prev_cursor)
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    if result_cache.enabled:
+        # The body may be a cached copy that lags the database, so the ETag is
+        # taken from that copy rather than from the live rows
+        items, total, digest = await crud.async_contact.get_cached_page(
+            db,
+            skip=params.skip,
+            limit=params.limit,
+            fields=params.fields,
+            **params.query_args,
+        )
+        if not_modified := params.revalidate(response, digest):
+            return not_modified
+        return params.offset_page(response, items, total)
+
+    total = await crud.async_contact.count_filtered(
+        db, estados=params.estados, search=params.search
+    )
+    signature = await crud.async_contact.page_signature(
+        db, skip=params.skip, limit=params.limit, **params.query_args
+    )
+    if not_modified := params.revalidate(response, total.total, *signature):
+        return not_modified
+    items, total = await crud.async_contact.get_multi_filtered(
+        db,
+        skip=params.skip,
+        limit=params.limit,
+        total=total,
+        fields=params.fields,
+        **params.query_args,
+    )
+    return params.offset_page(response, items, total)
+
+
+@router.post("/", response_model=schemas.Contact)
+async def create_contact(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    contact_in: schemas.ContactCreate,
+    current_user: schemas.User = Depends(deps.get_current_active_user_async),
+) -> Any:
+    """Create new contact"""
+    fill_nombre_completo(contact_in)
+    return await crud.async_contact.create(db=db, obj_in=contact_in)
+
+
+@router.get("/stats", response_model=schemas.ContactStats)
+async def read_contact_stats(
+    db: AsyncSession = Depends(deps.get_async_db),
+    days: int = Query(30, ge=1, le=366),
+    top: int = Query(20, ge=1, le=200),
+    current_user: schemas.User = Depends(deps.get_current_active_user_async),
+) -> Any:
+    """Contact counts by estado, ciudad, pais and creation day
+
+    Read from a summary table kept current by triggers, so the cost does not
+    depend on the number of contacts. ``days`` bounds ``createdPerDay``; cities
+    and countries are limited to the ``top`` largest.
+    """
+    return await get_stats_async(db, days=days, top=top)
+
+
+# ``{id:uuid}`` keeps these routes from shadowing sync-only paths under /contactos
+@router.get("/{id:uuid}", response_model=schemas.Contact)
+async def read_contact(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    id: UUID,
+    request: Request,
+    response: Response,
+    current_user: schemas.User = Depends(deps.get_current_active_user_async),
+) -> Any:
+    """Get contact by ID
+
+    Supports ``If-None-Match`` and ``If-Modified-Since`` (``304 Not Modified``).
+    """
+    version = await crud.async_contact.get_version(db, id=id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Contact not found")
+    etag = resource_etag(id, version)
+    if is_not_modified(request, etag, version):
+        return not_modified(etag, version)
+
+    contact = await crud.async_contact.get(db=db, id=id)
+    if not contact:
+        raise HTTPException(status_code=404, detail="Contact not found")
+    set_validators(
+        response, resource_etag(contact.id, contact.updated_at), contact.updated_at
+    )
+    return contact
+
+
+@router.put("/{id:uuid}", response_model=schemas.Contact)
+async def update_contact(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    id: UUID,
+    contact_in: schemas.ContactUpdate,
+    current_user: schemas.User = Depends(deps.get_current_active_user_async),
+) -> Any:
+    """Update contact"""
+    contact = await crud.async_contact.get(db=db, id=id)
+    if not contact:
+        raise HTTPException(status_code=404, detail="Contact not found")
+
+    fill_nombre_completo(contact_in, contact)
+    contact = await crud.async_contact.update(db=db, db_obj=contact, obj_in=contact_in)
+    return contact
+
+
+@router.delete("/{id:uuid}", response_model=schemas.Contact)
+async def delete_contact(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    id: UUID,
+    current_user: schemas.User = Depends(deps.get_current_active_user_async),
+) -> Any:
+    """Delete contact"""
+    contact = await crud.async_contact.get(db=db, id=id)
+    if not contact:
+        raise HTTPException(status_code=404, detail="Contact not found")
+    contact = await crud.async_contact.remove(db=db, id=id)
+    return contact
@@ -0,0 +1,154 @@
+from typing import Any, Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud, schemas
+from app.api import deps
+from app.core.conditional import (
+    is_not_modified,
+    make_etag,
+    not_modified,
+    resource_etag,
+    set_validators,
+)
+from app.core.serialization import json_response, page_adapter
+from app.models.user import User
+
+router = APIRouter()
+
+
+@router.get("/", response_model=schemas.PaginatedResponse[schemas.User])
+async def read_users(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_db),
+    skip: int = Query(0, alias="page", ge=0),
+    limit: int = Query(10, alias="size", ge=1, le=100),
+    fields: Optional[str] = Query(None),
+    current_user: schemas.User = Depends(deps.get_current_active_superuser_async),
+) -> Any:
+    """Retrieve users (admin only)
+
+    ``fields`` (comma separated API names) limits the columns read and returned;
+    ``id`` is always included.
+    """
+    try:
+        selected = schemas.select_fields(schemas.User, fields)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    # Convert page to skip (page is 1-indexed from frontend)
+    actual_skip = (skip - 1) * limit if skip > 0 else 0
+
+    total = await crud.async_user.count(db)
+    signature = await crud.async_user.multi_signature(db, skip=actual_skip, limit=limit)
+    etag = make_etag(request.url.query, total.total, *signature)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    set_validators(response, etag)
+
+    users, total = await crud.async_user.get_multi(
+        db, skip=actual_skip, limit=limit, total=total, fields=selected
+    )
+    return json_response(
+        page_adapter(schemas.sparse_model(schemas.User, selected)),
+        {
+            "items": users,
+            "total": total.total,
+            "total_exact": total.exact,
+            "page": skip,
+            "size": limit,
+        },
+        headers=response.headers,
+    )
+
+
+@router.post("/", response_model=schemas.User)
+async def create_user(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    user_in: schemas.UserCreate,
+    current_user: schemas.User = Depends(deps.get_current_active_superuser_async),
+) -> Any:
+    """Create new user (admin only)"""
+    user = await crud.async_user.get_by_email(db, email=user_in.email)
+    if user:
+        raise HTTPException(
+            status_code=400,
+            detail="A user with this email already exists",
+        )
+    user = await crud.async_user.create(db, obj_in=user_in)
+    return user
+
+
+# ``{id:uuid}`` keeps these routes from shadowing sync-only paths under /users
+@router.get("/{id:uuid}", response_model=schemas.User)
+async def read_user_by_id(
+    id: UUID,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_db),
+    current_user: schemas.User = Depends(deps.get_current_active_superuser_async),
+) -> Any:
+    """Get user by ID (admin only)"""
+    version = await crud.async_user.get_version(db, id=id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    etag = resource_etag(id, version)
+    if is_not_modified(request, etag, version):
+        return not_modified(etag, version)
+
+    user = await crud.async_user.get(db, id=id)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    set_validators(response, resource_etag(user.id, user.updated_at), user.updated_at)
+    return user
+
+
+@router.put("/{id:uuid}", response_model=schemas.User)
+async def update_user(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    id: UUID,
+    user_in: schemas.UserUpdate,
+    current_user: schemas.User = Depends(deps.get_current_active_superuser_async),
+) -> Any:
+    """Update user (admin only)"""
+    user = await crud.async_user.get(db, id=id)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    user = await crud.async_user.update(db, db_obj=user, obj_in=user_in)
+    return user
+
+
+@router.delete("/{id:uuid}", response_model=schemas.User)
+async def delete_user(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    id: UUID,
+    current_user: schemas.User = Depends(deps.get_current_active_superuser_async),
+) -> Any:
+    """Delete user (admin only)"""
+    user = await crud.async_user.get(db, id=id)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    if user.id == current_user.id:
+        raise HTTPException(status_code=400, detail="Cannot delete yourself")
+    user = await crud.async_user.remove(db, id=id)
+    return user
+
+
+@router.put("/me/settings", response_model=schemas.User)
+async def update_current_user_settings(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    user_in: schemas.UserUpdate,
+    db_user: User = Depends(deps.get_current_user_row_async),
+) -> Any:
+    """Update current user settings (theme preference, etc.)"""
+    # Only allow updating theme_preference for now, not sensitive fields
+    allowed_updates = schemas.UserUpdate(theme_preference=user_in.theme_preference)
+
+    user = await crud.async_user.update(db, db_obj=db_user, obj_in=allowed_updates)
+    return user
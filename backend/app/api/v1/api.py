@@ -1,8 +1,50 @@
 from fastapi import APIRouter
-from app.api.v1 import auth, contacts, users
+from app.api.v1 import auth, contacts, system, users
+from app.core.config import settings
 
 api_router = APIRouter()
 
-api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
-api_router.include_router(contacts.router, prefix="/contactos", tags=["contactos"])
-api_router.include_router(users.router, prefix="/users", tags=["users"])
+
+def _without_ported(sync_router: APIRouter, async_router: APIRouter) -> APIRouter:
+    """Routes of ``sync_router`` that have no async port in ``async_router``."""
+    ported = {
+        (route.path_format, method)
+        for route in async_router.routes
+        for method in route.methods
+    }
+    remaining = APIRouter()
+    remaining.routes = [
+        route
+        for route in sync_router.routes
+        if not any((route.path_format, method) in ported for method in route.methods)
+    ]
+    return remaining
+
+
+if settings.DB_MODE == "async":
+    from app.api.v1.aio import auth as async_auth
+    from app.api.v1.aio import contacts as async_contacts
+    from app.api.v1.aio import users as async_users
+
+    # Endpoints without an async port keep running as sync routes
+    auth_routers = [async_auth.router, _without_ported(auth.router, async_auth.router)]
+    contacts_routers = [
+        async_contacts.router,
+        _without_ported(contacts.router, async_contacts.router),
+    ]
+    users_routers = [
+        async_users.router,
+        _without_ported(users.router, async_users.router),
+    ]
+else:
+    auth_routers = [auth.router]
+    contacts_routers = [contacts.router]
+    users_routers = [users.router]
+
+for router in auth_routers:
+    api_router.include_router(router, prefix="/auth", tags=["auth"])
+for router in contacts_routers:
+    api_router.include_router(router, prefix="/contactos", tags=["contactos"])
+for router in users_routers:
+    api_router.include_router(router, prefix="/users", tags=["users"])
+api_router.include_router(system.router, prefix="/system", tags=["system"])
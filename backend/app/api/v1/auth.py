@@ -8,6 +8,7 @@ from app import crud, schemas
 from app.api import deps
 from app.core import security
 from app.core.config import settings
+from app.models.user import User
 
 router = APIRouter()
 
@@ -77,14 +78,9 @@ def confirm_password_reset(
 def change_password(
     password_change: schemas.PasswordChange,
     db: Session = Depends(deps.get_db),
-    current_user: schemas.User = Depends(deps.get_current_active_user),
+    db_user: User = Depends(deps.get_current_user_row),
 ) -> Any:
     """Change password for current user"""
-    # Get the full user object from database
-    db_user = crud.user.get(db, id=current_user.id)
-    if not db_user:
-        raise HTTPException(status_code=404, detail="Usuario no encontrado")
-
     user = crud.user.change_password(
         db,
         user=db_user,
@@ -0,0 +1,145 @@
+"""Request handling shared by the sync and async contact routers.
+
+Both routers declare their listing and export parameters through these
+dependencies and build their responses with them, so the two cannot drift;
+only the CRUD calls (awaited or not) differ between them.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+from fastapi import HTTPException, Query, Request, Response
+
+from app import crud, schemas
+from app.core.conditional import (
+    is_not_modified,
+    make_etag,
+    not_modified,
+    set_validators,
+)
+from app.core.serialization import cursor_page_adapter, json_response, page_adapter
+from app.models.contact import ContactStatus
+
+
+class ContactFilters:
+    """``filter_estado``, ``q``, ``sort`` and ``order`` of the listing and export.
+
+    Unknown ``filter_*`` parameters are rejected with 400 rather than ignored.
+    """
+
+    def __init__(
+        self,
+        request: Request,
+        estado: Optional[List[ContactStatus]] = Query(None, alias="filter_estado"),
+        q: Optional[str] = Query(None, min_length=1, max_length=200),
+        sort: Optional[str] = Query(None),
+        order: Optional[str] = Query("asc"),
+    ):
+        crud.contact.check_filters(
+            key.removeprefix("filter_")
+            for key in request.query_params
+            if key.startswith("filter_")
+        )
+        self.request = request
+        self.estados = estado
+        self.search = q
+        self.sort_field = sort
+        self.sort_order = order
+
+    @property
+    def query_args(self) -> Dict[str, Any]:
+        """Keyword arguments of the ``crud.contact`` listing methods."""
+        return {
+            "estados": self.estados,
+            "search": self.search,
+            "sort_field": self.sort_field,
+            "sort_order": self.sort_order,
+        }
+
+
+class ContactListParams(ContactFilters):
+    """Everything ``GET /contactos/`` accepts, validated."""
+
+    def __init__(
+        self,
+        request: Request,
+        estado: Optional[List[ContactStatus]] = Query(None, alias="filter_estado"),
+        q: Optional[str] = Query(None, min_length=1, max_length=200),
+        sort: Optional[str] = Query(None),
+        order: Optional[str] = Query("asc"),
+        page: int = Query(0, ge=0),
+        size: int = Query(10, ge=1, le=100),
+        pagination: str = Query("offset", pattern="^(offset|cursor)$"),
+        cursor: Optional[str] = Query(None),
+        fields: Optional[str] = Query(None),
+    ):
+        super().__init__(request, estado, q, sort, order)
+        try:
+            self.fields: Sequence[str] = schemas.select_fields(
+                schemas.Contact, fields, default=schemas.CONTACT_LIST_FIELDS
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+        self.item_model = schemas.sparse_model(schemas.Contact, self.fields)
+        self.use_cursor = pagination == "cursor" or bool(cursor)
+        self.cursor = cursor
+        self.page = page
+        self.limit = size
+        self.skip = page * size
+
+    def revalidate(self, response: Response, *parts: Any) -> Optional[Response]:
+        """``304`` when the client's copy matches ``parts``, else sets the ETag."""
+        etag = make_etag(self.request.url.query, *parts)
+        if is_not_modified(self.request, etag):
+            return not_modified(etag)
+        set_validators(response, etag)
+        return None
+
+    def cursor_page(
+        self,
+        response: Response,
+        items: Sequence[Any],
+        next_cursor: Optional[str],
+        prev_cursor: Optional[str],
+    ) -> Response:
+        return json_response(
+            cursor_page_adapter(self.item_model),
+            {
+                "items": items,
+                "size": self.limit,
+                "next_cursor": next_cursor,
+                "prev_cursor": prev_cursor,
+            },
+            headers=response.headers,
+        )
+
+    def offset_page(
+        self, response: Response, items: Sequence[Any], total: Any
+    ) -> Response:
+        page = {
+            "items": items,
+            "total": total.total,
+            "total_exact": total.exact,
+            "page": self.page,
+            "size": self.limit,
+        }
+        return json_response(
+            page_adapter(self.item_model), page, headers=response.headers
+        )
+
+
+def fill_nombre_completo(
+    contact_in: schemas.ContactCreate | schemas.ContactUpdate,
+    current: Optional[Any] = None,
+) -> None:
+    """Derive ``nombre_completo`` from the names, as create and update expect.
+
+    On create it is filled when not sent; on update (``current`` is the stored
+    contact) it follows any change to ``nombres`` or ``apellidos``.
+    """
+    if current is None:
+        if not contact_in.nombre_completo:
+            contact_in.nombre_completo = f"{contact_in.nombres} {contact_in.apellidos}"
+    elif contact_in.nombres or contact_in.apellidos:
+        nombres = contact_in.nombres or current.nombres
+        apellidos = contact_in.apellidos or current.apellidos
+        contact_in.nombre_completo = f"{nombres} {apellidos}"
@@ -1,38 +1,121 @@
-from typing import Any, List, Optional
+import csv
+from typing import Any, Callable, Optional, Union
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from app import crud, models, schemas
+from app import crud, schemas
 from app.api import deps
-from app.models.contact import ContactStatus
+from app.api.v1.contact_params import (
+    ContactFilters,
+    ContactListParams,
+    fill_nombre_completo,
+)
+from app.core.conditional import (
+    is_not_modified,
+    not_modified,
+    resource_etag,
+    set_validators,
+)
+from app.core.pagination import InvalidCursorError
+from app.core.result_cache import result_cache
+from app.crud.contact_export import EXPORT_FORMATS, ExportUnavailable, stream_export
+from app.crud.contact_import import import_contacts
+from app.crud.contact_stats import get_stats
 
 router = APIRouter()
 
 
-@router.get("/", response_model=schemas.PaginatedResponse[schemas.Contact])
+@router.get(
+    "/",
+    response_model=Union[
+        schemas.PaginatedResponse[schemas.Contact],
+        schemas.CursorPaginatedResponse[schemas.Contact],
+    ],
+)
 def read_contacts(
+    response: Response,
+    params: ContactListParams = Depends(),
     db: Session = Depends(deps.get_db),
-    skip: int = Query(0, alias="page", ge=0),
-    limit: int = Query(10, alias="size", ge=1, le=100),
-    estado: Optional[List[ContactStatus]] = Query(None, alias="filter_estado"),
-    sort: Optional[str] = Query(None),
-    order: Optional[str] = Query("asc"),
-    current_user: models.User = Depends(deps.get_current_active_user),
+    current_user: schemas.User = Depends(deps.get_current_active_user),
 ) -> Any:
-    """Retrieve contacts with pagination, filters and sorting"""
-    # Convert page to skip
-    skip = skip * limit if skip > 0 else 0
+    """Retrieve contacts with pagination, filters and sorting
 
+    With ``pagination=cursor`` (implied when ``cursor`` is sent) the response
+    carries opaque ``next_cursor``/``prev_cursor`` tokens instead of a page
+    number and total, and deep pages cost the same as the first one.
+
+    ``q`` searches names, email, phone and cedula ignoring case and accents;
+    without an explicit ``sort`` offset pages are ordered by relevance. Sorting
+    or filtering by a field that is not indexed for it is rejected with 400.
+
+    Responses carry an ``ETag`` over the page's ids, versions and total (over the
+    cached page, when offset pages come from the result cache); send it back in
+    ``If-None-Match`` to get ``304 Not Modified`` while nothing changed.
+
+    ``fields`` (comma separated, e.g. ``nombreCompleto,email,estado``) limits the
+    columns read and returned; ``id`` is always included. Without it every field
+    but ``notas`` is returned.
+    """
+    try:
+        if params.use_cursor:
+            signature = crud.contact.keyset_signature(
+                db, limit=params.limit, cursor=params.cursor, **params.query_args
+            )
+            if not_modified := params.revalidate(response, *signature):
+                return not_modified
+            items, next_cursor, prev_cursor = crud.contact.get_multi_keyset(
+                db,
+                limit=params.limit,
+                cursor=params.cursor,
+                fields=params.fields,
+                **params.query_args,
+            )
+            return params.cursor_page(response, items, next_cursor, prev_cursor)
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    if result_cache.enabled:
+        # The body may be a cached copy that lags the database, so the ETag is
+        # taken from that copy rather than from the live rows
+        items, total, digest = crud.contact.get_cached_page(
+            db,
+            skip=params.skip,
+            limit=params.limit,
+            fields=params.fields,
+            **params.query_args,
+        )
+        if not_modified := params.revalidate(response, digest):
+            return not_modified
+        return params.offset_page(response, items, total)
+
+    total = crud.contact.count_filtered(
+        db, estados=params.estados, search=params.search
+    )
+    signature = crud.contact.page_signature(
+        db, skip=params.skip, limit=params.limit, **params.query_args
+    )
+    if not_modified := params.revalidate(response, total.total, *signature):
+        return not_modified
     items, total = crud.contact.get_multi_filtered(
-        db, skip=skip, limit=limit, estados=estado, sort_field=sort, sort_order=order
+        db,
+        skip=params.skip,
+        limit=params.limit,
+        total=total,
+        fields=params.fields,
+        **params.query_args,
     )
-    return {
-        "items": items,
-        "total": total,
-        "page": skip // limit if limit > 0 else 0,
-        "size": limit,
-    }
+    return params.offset_page(response, items, total)
 
 
 @router.post("/", response_model=schemas.Contact)
@@ -40,27 +123,148 @@ def create_contact(
     *,
     db: Session = Depends(deps.get_db),
     contact_in: schemas.ContactCreate,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    current_user: schemas.User = Depends(deps.get_current_active_user),
 ) -> Any:
     """Create new contact"""
-    # Auto-generate nombreCompleto if not provided
-    if not contact_in.nombre_completo:
-        contact_in.nombre_completo = f"{contact_in.nombres} {contact_in.apellidos}"
-
+    fill_nombre_completo(contact_in)
     return crud.contact.create(db=db, obj_in=contact_in)
 
 
+@router.post(
+    "/import",
+    response_model=schemas.ContactImportReport,
+    dependencies=[Depends(deps.long_statement_timeout)],
+)
+def import_contacts_file(
+    *,
+    db: Session = Depends(deps.get_db),
+    file: UploadFile = File(...),
+    format: Optional[str] = Query(None, pattern="^(csv|ndjson)$"),
+    current_user: schemas.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """Bulk import contacts from a CSV (with header) or NDJSON file
+
+    Rows are upserted by email in chunks; invalid rows are skipped and listed
+    in the report with their line number. The format defaults to the file
+    extension (``.ndjson``/``.jsonl``, otherwise CSV).
+    """
+    if format is None:
+        filename = (file.filename or "").lower()
+        format = "ndjson" if filename.endswith((".ndjson", ".jsonl")) else "csv"
+    try:
+        return import_contacts(db, file.file, fmt=format)
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="El archivo debe estar en UTF-8")
+    except csv.Error as exc:
+        raise HTTPException(status_code=400, detail=f"CSV inválido: {exc}")
+
+
+@router.get("/export", dependencies=[Depends(deps.long_statement_timeout)])
+def export_contacts(
+    filters: ContactFilters = Depends(),
+    format: str = Query("csv", pattern="^(csv|ndjson|parquet)$"),
+    session_factory: Callable[[], Session] = Depends(deps.get_session_factory),
+    current_user: schemas.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """Stream every contact matching the listing filters as CSV, NDJSON or Parquet
+
+    Accepts the same ``filter_estado``, ``q``, ``sort`` and ``order`` as the
+    listing. Rows are read through a server-side cursor and sent as they are
+    fetched, so the export size does not affect memory or time to first byte.
+    """
+    try:
+        content = stream_export(format, session_factory, **filters.query_args)
+    except ExportUnavailable as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return StreamingResponse(
+        content,
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="contactos.{format}"'},
+    )
+
+
+@router.post(
+    "/bulk-update",
+    response_model=schemas.ContactBulkResult,
+    dependencies=[Depends(deps.long_statement_timeout)],
+)
+def bulk_update_contacts(
+    *,
+    db: Session = Depends(deps.get_db),
+    bulk_in: schemas.ContactBulkUpdate,
+    current_user: schemas.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """Apply the same changes to the contacts selected by ``ids`` and/or filters"""
+    affected = crud.contact.bulk_update(
+        db,
+        obj_in=bulk_in.patch,
+        ids=bulk_in.ids,
+        estados=bulk_in.estado,
+        search=bulk_in.q,
+    )
+    return {"affected": affected}
+
+
+@router.post(
+    "/bulk-delete",
+    response_model=schemas.ContactBulkResult,
+    dependencies=[Depends(deps.long_statement_timeout)],
+)
+def bulk_delete_contacts(
+    *,
+    db: Session = Depends(deps.get_db),
+    selection: schemas.ContactSelection,
+    current_user: schemas.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """Soft delete the contacts selected by ``ids`` and/or filters"""
+    affected = crud.contact.bulk_remove(
+        db, ids=selection.ids, estados=selection.estado, search=selection.q
+    )
+    return {"affected": affected}
+
+
+@router.get("/stats", response_model=schemas.ContactStats)
+def read_contact_stats(
+    db: Session = Depends(deps.get_db),
+    days: int = Query(30, ge=1, le=366),
+    top: int = Query(20, ge=1, le=200),
+    current_user: schemas.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """Contact counts by estado, ciudad, pais and creation day
+
+    Read from a summary table kept current by triggers, so the cost does not
+    depend on the number of contacts. ``days`` bounds ``createdPerDay``; cities
+    and countries are limited to the ``top`` largest.
+    """
+    return get_stats(db, days=days, top=top)
+
+
 @router.get("/{id}", response_model=schemas.Contact)
 def read_contact(
     *,
     db: Session = Depends(deps.get_db),
     id: UUID,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    request: Request,
+    response: Response,
+    current_user: schemas.User = Depends(deps.get_current_active_user),
 ) -> Any:
-    """Get contact by ID"""
+    """Get contact by ID
+
+    Supports ``If-None-Match`` and ``If-Modified-Since`` (``304 Not Modified``).
+    """
+    version = crud.contact.get_version(db, id=id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Contact not found")
+    etag = resource_etag(id, version)
+    if is_not_modified(request, etag, version):
+        return not_modified(etag, version)
+
     contact = crud.contact.get(db=db, id=id)
     if not contact:
         raise HTTPException(status_code=404, detail="Contact not found")
+    set_validators(
+        response, resource_etag(contact.id, contact.updated_at), contact.updated_at
+    )
     return contact
 
 
@@ -70,19 +274,14 @@ def update_contact(
     db: Session = Depends(deps.get_db),
     id: UUID,
     contact_in: schemas.ContactUpdate,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    current_user: schemas.User = Depends(deps.get_current_active_user),
 ) -> Any:
     """Update contact"""
     contact = crud.contact.get(db=db, id=id)
     if not contact:
         raise HTTPException(status_code=404, detail="Contact not found")
 
-    # Auto-update nombreCompleto if nombres or apellidos changed
-    if contact_in.nombres or contact_in.apellidos:
-        nombres = contact_in.nombres or contact.nombres
-        apellidos = contact_in.apellidos or contact.apellidos
-        contact_in.nombre_completo = f"{nombres} {apellidos}"
-
+    fill_nombre_completo(contact_in, contact)
     contact = crud.contact.update(db=db, db_obj=contact, obj_in=contact_in)
     return contact
 
@@ -92,7 +291,7 @@ def delete_contact(
     *,
     db: Session = Depends(deps.get_db),
     id: UUID,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    current_user: schemas.User = Depends(deps.get_current_active_user),
 ) -> Any:
     """Delete contact"""
     contact = crud.contact.get(db=db, id=id)
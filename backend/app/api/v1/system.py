@@ -0,0 +1,52 @@
+from typing import Any
+from fastapi import APIRouter, Depends
+
+from app import schemas
+from app.api import deps
+from app.core.hashing import hash_pool
+from app.core.metrics import pool_stats
+from app.core.result_cache import result_cache
+from app.crud.count import count_cache
+from app.crud.user import principal_cache
+from app.database import async_engine, engine, replicas
+
+router = APIRouter()
+
+
+@router.get("/caches")
+def read_cache_stats(
+    current_user: schemas.User = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """Hit/miss counters of the in-process caches (admin only)"""
+    return {
+        "principal": principal_cache.stats(),
+        "count": count_cache.stats(),
+        "results": result_cache.stats(),
+    }
+
+
+@router.get("/hashing")
+def read_hashing_stats(
+    current_user: schemas.User = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """Queue wait and hash time of the password hashing pool (admin only)"""
+    return hash_pool.stats()
+
+
+@router.get("/pool")
+def read_pool_stats(
+    current_user: schemas.User = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """Occupancy, saturation and checkout waits of the connection pools (admin only)"""
+    stats = {"sync": pool_stats(engine.pool)}
+    if async_engine is not None:
+        stats["async"] = pool_stats(async_engine.pool)
+    return stats
+
+
+@router.get("/replicas")
+def read_replica_stats(
+    current_user: schemas.User = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """Health and replication lag of the read replicas (admin only)"""
+    return replicas.stats()
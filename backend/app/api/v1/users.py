@@ -1,32 +1,67 @@
-from typing import Any, List
+from typing import Any, List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 
-from app import crud, models, schemas
+from app import crud, schemas
 from app.api import deps
+from app.core.conditional import (
+    is_not_modified,
+    make_etag,
+    not_modified,
+    resource_etag,
+    set_validators,
+)
+from app.core.serialization import json_response, page_adapter
+from app.models.user import User
 
 router = APIRouter()
 
 
 @router.get("/", response_model=schemas.PaginatedResponse[schemas.User])
 def read_users(
+    request: Request,
+    response: Response,
     db: Session = Depends(deps.get_db),
     skip: int = Query(0, alias="page", ge=0),
     limit: int = Query(10, alias="size", ge=1, le=100),
-    current_user: models.User = Depends(deps.get_current_active_superuser),
+    fields: Optional[str] = Query(None),
+    current_user: schemas.User = Depends(deps.get_current_active_superuser),
 ) -> Any:
-    """Retrieve users (admin only)"""
+    """Retrieve users (admin only)
+
+    ``fields`` (comma separated API names) limits the columns read and returned;
+    ``id`` is always included.
+    """
+    try:
+        selected = schemas.select_fields(schemas.User, fields)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
     # Convert page to skip (page is 1-indexed from frontend)
     actual_skip = (skip - 1) * limit if skip > 0 else 0
 
-    users, total = crud.user.get_multi(db, skip=actual_skip, limit=limit)
-    return {
-        "items": users,
-        "total": total,
-        "page": skip,
-        "size": limit,
-    }
+    total = crud.user.count(db)
+    signature = crud.user.multi_signature(db, skip=actual_skip, limit=limit)
+    etag = make_etag(request.url.query, total.total, *signature)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    set_validators(response, etag)
+
+    users, total = crud.user.get_multi(
+        db, skip=actual_skip, limit=limit, total=total, fields=selected
+    )
+    return json_response(
+        page_adapter(schemas.sparse_model(schemas.User, selected)),
+        {
+            "items": users,
+            "total": total.total,
+            "total_exact": total.exact,
+            "page": skip,
+            "size": limit,
+        },
+        headers=response.headers,
+    )
 
 
 @router.post("/", response_model=schemas.User)
@@ -34,7 +69,7 @@ def create_user(
     *,
     db: Session = Depends(deps.get_db),
     user_in: schemas.UserCreate,
-    current_user: models.User = Depends(deps.get_current_active_superuser),
+    current_user: schemas.User = Depends(deps.get_current_active_superuser),
 ) -> Any:
     """Create new user (admin only)"""
     user = crud.user.get_by_email(db, email=user_in.email)
@@ -50,13 +85,23 @@ def create_user(
 @router.get("/{id}", response_model=schemas.User)
 def read_user_by_id(
     id: UUID,
+    request: Request,
+    response: Response,
     db: Session = Depends(deps.get_db),
-    current_user: models.User = Depends(deps.get_current_active_superuser),
+    current_user: schemas.User = Depends(deps.get_current_active_superuser),
 ) -> Any:
     """Get user by ID (admin only)"""
+    version = crud.user.get_version(db, id=id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    etag = resource_etag(id, version)
+    if is_not_modified(request, etag, version):
+        return not_modified(etag, version)
+
     user = crud.user.get(db, id=id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
+    set_validators(response, resource_etag(user.id, user.updated_at), user.updated_at)
     return user
 
 
@@ -66,7 +111,7 @@ def update_user(
     db: Session = Depends(deps.get_db),
     id: UUID,
     user_in: schemas.UserUpdate,
-    current_user: models.User = Depends(deps.get_current_active_superuser),
+    current_user: schemas.User = Depends(deps.get_current_active_superuser),
 ) -> Any:
     """Update user (admin only)"""
     user = crud.user.get(db, id=id)
@@ -81,7 +126,7 @@ def delete_user(
     *,
     db: Session = Depends(deps.get_db),
     id: UUID,
-    current_user: models.User = Depends(deps.get_current_active_superuser),
+    current_user: schemas.User = Depends(deps.get_current_active_superuser),
 ) -> Any:
     """Delete user (admin only)"""
     user = crud.user.get(db, id=id)
@@ -98,13 +143,9 @@ def update_current_user_settings(
     *,
     db: Session = Depends(deps.get_db),
     user_in: schemas.UserUpdate,
-    current_user: models.User = Depends(deps.get_current_active_user),
+    db_user: User = Depends(deps.get_current_user_row),
 ) -> Any:
     """Update current user settings (theme preference, etc.)"""
-    db_user = crud.user.get(db, id=current_user.id)
-    if not db_user:
-        raise HTTPException(status_code=404, detail="User not found")
-
     # Only allow updating theme_preference for now, not sensitive fields
     allowed_updates = schemas.UserUpdate(theme_preference=user_in.theme_preference)
 
@@ -0,0 +1,89 @@
+import argparse
+import logging
+from datetime import timedelta
+from uuid import UUID
+
+from app.core.config import settings
+from app.crud.archive import ARCHIVES, archive_deleted, purge, restore
+from app.database import SessionLocal
+from app.models.base import utcnow
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Move soft-deleted contacts and users to the archive tables, "
+        "restore them from there or purge them for good"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="archive rows soft-deleted long enough ago")
+    run.add_argument(
+        "--days",
+        type=int,
+        default=settings.ARCHIVE_AFTER_DAYS,
+        help="deleted at least this many days ago (default: ARCHIVE_AFTER_DAYS)",
+    )
+    run.add_argument("--batch-size", type=int, default=settings.ARCHIVE_BATCH_SIZE)
+
+    restore_parser = commands.add_parser(
+        "restore", help="put archived rows back as live rows"
+    )
+    restore_parser.add_argument("ids", type=UUID, nargs="+")
+
+    purge_parser = commands.add_parser(
+        "purge", help="delete archived rows for good, by id or by age"
+    )
+    selection = purge_parser.add_mutually_exclusive_group(required=True)
+    selection.add_argument("--ids", type=UUID, nargs="+")
+    selection.add_argument(
+        "--days", type=int, help="archived at least this many days ago"
+    )
+    purge_parser.add_argument(
+        "--batch-size", type=int, default=settings.ARCHIVE_BATCH_SIZE
+    )
+
+    for command in (run, restore_parser, purge_parser):
+        command.add_argument(
+            "--table",
+            choices=list(ARCHIVES),
+            action="append",
+            help="limit to this table (repeatable; default: all)",
+        )
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        for table in args.table or ARCHIVES:
+            if args.command == "run":
+                count = archive_deleted(
+                    db,
+                    table,
+                    before=utcnow() - timedelta(days=args.days),
+                    batch_size=args.batch_size,
+                )
+                logger.info(f"Archived {count} deleted {table}")
+            elif args.command == "restore":
+                count = restore(db, table, args.ids)
+                logger.info(f"Restored {count} {table}")
+            else:
+                count = purge(
+                    db,
+                    table,
+                    ids=args.ids,
+                    before=(
+                        utcnow() - timedelta(days=args.days)
+                        if args.days is not None
+                        else None
+                    ),
+                    batch_size=args.batch_size,
+                )
+                logger.info(f"Purged {count} archived {table}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
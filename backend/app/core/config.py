@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List, Literal
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -15,6 +15,17 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # Resolved principals are cached per process; a deactivation made through
+    # another worker can take up to the TTL to be seen here. 0 entries disables it
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    # bcrypt cost; hashes made with another cost are rehashed on the next login
+    BCRYPT_ROUNDS: int = 12
+    # Hashing runs on its own small pool; once workers + queue are busy, further
+    # logins get 503 with Retry-After instead of queueing behind each other
+    HASH_POOL_WORKERS: int = 2
+    HASH_POOL_MAX_QUEUE: int = 32
+    HASH_POOL_RETRY_AFTER_SECONDS: int = 1
 
     # Database
     POSTGRES_SERVER: str = "localhost"
@@ -22,6 +33,115 @@ class Settings(BaseSettings):
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str
     POSTGRES_DB: str
+    # "async" serves the core API from async routes on an asyncpg engine;
+    # "sync" keeps every route on psycopg2 in the worker thread pool
+    DB_MODE: Literal["sync", "async"] = "sync"
+    # Sync CRUD writes: "orm" (add/commit/refresh) or "returning" (one
+    # INSERT/UPDATE ... RETURNING per operation, no follow-up SELECT)
+    CRUD_WRITE_MODE: Literal["orm", "returning"] = "orm"
+    # Contact list pages: "orm" loads model instances and lets FastAPI validate
+    # and encode them, "core" selects plain column rows and serializes the page
+    # to JSON in a single pydantic-core pass
+    READ_MODE: Literal["orm", "core"] = "orm"
+
+    # Connection pool, per engine and worker process: at most
+    # DB_POOL_SIZE + DB_MAX_OVERFLOW connections; a checkout waiting longer than
+    # DB_POOL_TIMEOUT_SECONDS fails instead of queueing forever
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 10
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    # Connections opened by the startup warm-up (capped at DB_POOL_SIZE)
+    DB_POOL_MIN_CONNECTIONS: int = 2
+    # "always" pings on every checkout (one extra round trip each), "idle" only
+    # connections unused for DB_POOL_PING_IDLE_SECONDS, "never" relies on recycle
+    DB_POOL_PRE_PING: Literal["always", "idle", "never"] = "idle"
+    DB_POOL_PING_IDLE_SECONDS: int = 30
+    # Behind PgBouncer in transaction mode: no startup options, no session
+    # settings (timeouts use SET LOCAL per transaction) and no server-side
+    # prepared statement cache on asyncpg
+    DB_PGBOUNCER: bool = False
+    # Per-request limits: list/get/write routes get the short statement timeout,
+    # exports, imports and bulk operations the long one. CLIs and background
+    # jobs keep the server default. 0 disables a timeout
+    DB_STATEMENT_TIMEOUT_MS: int = 5000
+    DB_LONG_STATEMENT_TIMEOUT_MS: int = 300000
+    # Sessions left idle inside a transaction are closed by the server
+    DB_IDLE_IN_TRANSACTION_TIMEOUT_MS: int = 60000
+    # Streaming replicas (postgresql:// URLs) serving GET requests. A replica
+    # more than DB_REPLICA_MAX_LAG_SECONDS behind, or unreachable, is skipped
+    # until a later check passes; with none usable reads go to the primary.
+    # After a write the client reads from the primary for
+    # DB_READ_YOUR_WRITES_SECONDS (cookie, echoed X-Primary-Until header or, per
+    # worker, its bearer token), so it always sees its own changes
+    DB_REPLICA_URLS: List[str] = []
+    DB_REPLICA_MAX_LAG_SECONDS: float = 5
+    DB_REPLICA_CHECK_INTERVAL_SECONDS: float = 5
+    DB_READ_YOUR_WRITES_SECONDS: int = 10
+
+    # List totals: "exact" runs COUNT(*) per request, "estimated" uses planner
+    # row estimates, "cached" keeps exact counts per filter for a short TTL
+    COUNT_STRATEGY: Literal["exact", "estimated", "cached"] = "exact"
+    COUNT_ESTIMATE_MIN_ROWS: int = 10000
+    COUNT_CACHE_TTL_SECONDS: int = 30
+    COUNT_CACHE_MAX_ENTRIES: int = 1024
+
+    # Cached contact list pages, dropped on every contact write. "memory" is
+    # per worker (writes through other workers show up after the TTL), "redis"
+    # is shared (needs the redis package), "fake" is an in-process stand-in
+    # for redis, "none" disables the cache
+    RESULT_CACHE_BACKEND: Literal["none", "memory", "redis", "fake"] = "memory"
+    RESULT_CACHE_TTL_SECONDS: int = 15
+    RESULT_CACHE_MAX_ENTRIES: int = 512
+    RESULT_CACHE_TIMEOUT_SECONDS: float = 0.05
+    REDIS_URL: str = "redis://localhost:6379/0"
+
+    # Bulk import: rows validated and COPYed per transaction, failures listed
+    IMPORT_CHUNK_SIZE: int = 5000
+    IMPORT_MAX_ERRORS: int = 1000
+    # Export: rows fetched per server-side cursor round trip (and per chunk sent)
+    EXPORT_BATCH_SIZE: int = 2000
+    # Bulk update/delete: rows changed per UPDATE statement and transaction
+    BULK_CHUNK_SIZE: int = 5000
+    # Contact stats are kept by triggers; this job repairs any drifted counts
+    # (one worker at a time). Each run scans every contact, so it is opt-in:
+    # 0, the default, disables it; python -m app.reconcile_stats runs it once
+    STATS_RECONCILE_INTERVAL_SECONDS: int = 0
+    # Contacts and users soft-deleted ARCHIVE_AFTER_DAYS ago move to the archive
+    # tables, ARCHIVE_BATCH_SIZE rows per transaction, every
+    # ARCHIVE_INTERVAL_SECONDS (0, the default, disables the job: opt in, or run
+    # app.archive).
+    # Archived rows are deleted for good after ARCHIVE_PURGE_AFTER_DAYS (0 keeps them)
+    ARCHIVE_AFTER_DAYS: int = 30
+    ARCHIVE_BATCH_SIZE: int = 1000
+    ARCHIVE_INTERVAL_SECONDS: int = 0
+    ARCHIVE_PURGE_AFTER_DAYS: int = 0
+
+    # Prometheus metrics on /metrics: per-route latency and status, SQL
+    # statements, DB time and rows per request, pool checkout wait and occupancy.
+    # Off by default: it exposes internals. With METRICS_TOKEN set scrapers must
+    # send "Authorization: Bearer <token>"; without it, keep /metrics off the
+    # public network
+    METRICS_ENABLED: bool = False
+    METRICS_TOKEN: str = ""
+    # Development/staging SQL diagnostics. Statements slower than SLOW_QUERY_MS
+    # are logged with their parameters (secrets included) and, optionally, their
+    # EXPLAIN plan; 0 disables it
+    SLOW_QUERY_MS: float = 0
+    SLOW_QUERY_EXPLAIN: bool = True
+    # SQL statements allowed per request: "warn" logs overruns, "raise" fails the
+    # request. QUERY_BUDGETS overrides the default per route, keyed like
+    # "GET /api/contactos/"
+    QUERY_BUDGET_MODE: Literal["off", "warn", "raise"] = "off"
+    QUERY_BUDGET_DEFAULT: int = 10
+    QUERY_BUDGETS: Dict[str, int] = {}
+
+    # Before serving, open DB_POOL_MIN_CONNECTIONS and run the hot queries once
+    # so the first requests skip connecting and SQL/schema compilation
+    STARTUP_WARM_UP: bool = True
+    # Before serving, migrate to head and create the initial data unless the
+    # database already is there (one query; see app.prestart)
+    STARTUP_PRESTART: bool = False
 
     # CORS
     BACKEND_CORS_ORIGINS: List[str] = ["http://localhost:3000"]
@@ -36,5 +156,9 @@ class Settings(BaseSettings):
     def DATABASE_URL(self) -> str:
         return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_SERVER}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
 
+    @property
+    def ASYNC_DATABASE_URL(self) -> str:
+        return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_SERVER}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+
 
 settings = Settings()
@@ -0,0 +1,106 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+
+class HashPoolSaturated(Exception):
+    """Raised when the password hashing queue is full; the request should be retried."""
+
+    def __init__(self, retry_after: int):
+        super().__init__("Password hashing pool is saturated")
+        self.retry_after = retry_after
+
+
+class HashPool:
+    """Size-limited executor for bcrypt work, kept apart from the request threads.
+
+    bcrypt releases the GIL while hashing, so a small thread pool is enough to
+    cap how many CPU cores a login storm can take. At most ``workers + max_queue``
+    jobs are accepted at once; beyond that ``HashPoolSaturated`` is raised
+    immediately instead of letting requests pile up behind each other.
+    """
+
+    def __init__(self, *, workers: int, max_queue: int, retry_after: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.retry_after = retry_after
+        self.submitted = 0
+        self.rejected = 0
+        self.in_flight = 0
+        self._queue_wait_total = 0.0
+        self._queue_wait_max = 0.0
+        self._hash_time_total = 0.0
+        self._hash_time_max = 0.0
+        self._completed = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _submit(self, fn: Callable[..., T], *args: Any) -> "Future[T]":
+        with self._lock:
+            if self.in_flight >= self.workers + self.max_queue:
+                self.rejected += 1
+                raise HashPoolSaturated(self.retry_after)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="hash"
+                )
+            self.in_flight += 1
+            self.submitted += 1
+        return self._executor.submit(self._timed, time.perf_counter(), fn, *args)
+
+    def _timed(self, queued_at: float, fn: Callable[..., T], *args: Any) -> T:
+        started = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            finished = time.perf_counter()
+            self._record(started - queued_at, finished - started)
+
+    def _record(self, queue_wait: float, hash_time: float) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self._completed += 1
+            self._queue_wait_total += queue_wait
+            self._queue_wait_max = max(self._queue_wait_max, queue_wait)
+            self._hash_time_total += hash_time
+            self._hash_time_max = max(self._hash_time_max, hash_time)
+
+    def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run ``fn(*args)`` on the pool and wait for its result."""
+        return self._submit(fn, *args).result()
+
+    async def run_async(self, fn: Callable[..., T], *args: Any) -> T:
+        """``run`` for coroutines: awaits the pool without blocking the event loop."""
+        return await asyncio.wrap_future(self._submit(fn, *args))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            completed = self._completed
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "in_flight": self.in_flight,
+                "submitted": self.submitted,
+                "rejected": self.rejected,
+                "queue_wait_avg_ms": (
+                    self._queue_wait_total / completed * 1000 if completed else 0.0
+                ),
+                "queue_wait_max_ms": self._queue_wait_max * 1000,
+                "hash_time_avg_ms": (
+                    self._hash_time_total / completed * 1000 if completed else 0.0
+                ),
+                "hash_time_max_ms": self._hash_time_max * 1000,
+            }
+
+
+hash_pool = HashPool(
+    workers=settings.HASH_POOL_WORKERS,
+    max_queue=settings.HASH_POOL_MAX_QUEUE,
+    retry_after=settings.HASH_POOL_RETRY_AFTER_SECONDS,
+)
@@ -0,0 +1,254 @@
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+from prometheus_client import Counter, Gauge, Histogram
+from prometheus_client.core import REGISTRY, GaugeMetricFamily
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# Sub-millisecond resolution at the low end: most statements and many routes
+# finish well under 5 ms
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100)
+ROW_BUCKETS = (0, 1, 10, 50, 100, 500, 1000, 5000, 10000, 50000)
+
+REQUESTS = Counter(
+    "http_requests_total", "HTTP requests handled", ["method", "route", "status"]
+)
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Time from request start to the end of the response body",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+REQUEST_STATEMENTS = Histogram(
+    "http_request_db_statements",
+    "SQL statements executed per request",
+    ["method", "route"],
+    buckets=COUNT_BUCKETS,
+)
+REQUEST_DB_TIME = Histogram(
+    "http_request_db_duration_seconds",
+    "Time spent executing SQL per request",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+REQUEST_ROWS = Histogram(
+    "http_request_db_rows",
+    "Rows returned or affected by SQL per request",
+    ["method", "route"],
+    buckets=ROW_BUCKETS,
+)
+POOL_TIMEOUTS = Counter(
+    "db_pool_timeouts_total",
+    "Checkouts that gave up after DB_POOL_TIMEOUT_SECONDS",
+    ["engine"],
+)
+POOL_CHECKOUT = Histogram(
+    "db_pool_checkout_seconds",
+    "Wait for a pooled connection, including opening a new one",
+    ["engine"],
+    buckets=LATENCY_BUCKETS,
+)
+STARTUP_SECONDS = Gauge(
+    "app_startup_seconds",
+    "Duration of each startup phase; serving and first_request are counted "
+    "from process start",
+    ["phase"],
+)
+
+
+class RequestStats:
+    __slots__ = ("statements", "db_time", "rows")
+
+    def __init__(self) -> None:
+        self.statements = 0
+        self.db_time = 0.0
+        self.rows = 0
+
+
+# Copied into the threadpool (sync routes) and SQLAlchemy's greenlets (async
+# routes); the object is shared, so their statements add up on the request
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar(
+    "request_stats", default=None
+)
+
+
+class _TimedCheckout:
+    # Metrics label; database.configure_engine names each engine's pool
+    engine_name = "sync"
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.timeouts += 1
+            POOL_TIMEOUTS.labels(self.engine_name).inc()
+            raise
+        finally:
+            # Unlocked: a lost update under contention only skews the stats
+            wait = time.perf_counter() - started
+            self.checkouts += 1
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+            POOL_CHECKOUT.labels(self.engine_name).observe(wait)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.engine_name = self.engine_name
+        return pool
+
+
+class TimedQueuePool(_TimedCheckout, QueuePool):
+    """``QueuePool`` recording how long each checkout waited."""
+
+
+class TimedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    """``AsyncAdaptedQueuePool`` recording how long each checkout waited."""
+
+
+def pool_stats(pool: Any) -> Dict[str, Any]:
+    """Occupancy and checkout waits of a ``QueuePool``."""
+    size = pool.size()
+    limit = size + max(pool._max_overflow, 0)
+    checked_out = pool.checkedout()
+    stats = {
+        "size": size,
+        "max_connections": limit,
+        "checked_out": checked_out,
+        "checked_in": pool.checkedin(),
+        # overflow() counts down from -size while the pool fills up
+        "overflow": max(pool.overflow(), 0),
+        "saturation": checked_out / limit if limit else 0.0,
+    }
+    if isinstance(pool, _TimedCheckout):
+        stats.update(
+            checkouts=pool.checkouts,
+            timeouts=pool.timeouts,
+            wait_avg_ms=(
+                pool.wait_total / pool.checkouts * 1000 if pool.checkouts else 0.0
+            ),
+            wait_max_ms=pool.wait_max * 1000,
+        )
+    return stats
+
+
+class PoolCollector:
+    """Current pool occupancy of every instrumented engine, read at scrape time."""
+
+    GAUGES = {
+        "size": ("db_pool_size", "Configured pool size"),
+        "max_connections": ("db_pool_max_connections", "Pool size plus overflow"),
+        "checked_out": ("db_pool_checked_out", "Connections in use"),
+        "checked_in": ("db_pool_checked_in", "Idle connections in the pool"),
+        "overflow": ("db_pool_overflow", "Connections opened beyond the pool size"),
+        "saturation": (
+            "db_pool_saturation",
+            "Share of the maximum connections in use (1 = checkouts start waiting)",
+        ),
+    }
+
+    def __init__(self) -> None:
+        self.engines: Dict[str, Engine] = {}
+
+    def collect(self):
+        gauges = {
+            key: GaugeMetricFamily(name, documentation, labels=["engine"])
+            for key, (name, documentation) in self.GAUGES.items()
+        }
+        for name, engine in self.engines.items():
+            stats = pool_stats(engine.pool)
+            for key, gauge in gauges.items():
+                gauge.add_metric([name], stats[key])
+        return gauges.values()
+
+
+pool_collector = PoolCollector()
+REGISTRY.register(pool_collector)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context.metrics_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - context.metrics_started
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.db_time += elapsed
+        stats.rows += max(cursor.rowcount, 0)
+
+
+def instrument_engine(engine: Engine, name: str) -> None:
+    """Count statements, DB time and rows of ``engine`` towards the current request."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    pool_collector.engines[name] = engine
+
+
+def _route_label(scope: Dict[str, Any]) -> str:
+    # Route templates, never raw paths, so ids do not explode label cardinality
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    """Records latency, status and SQL stats of every HTTP request."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        status = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            _request_stats.reset(token)
+            method = scope["method"]
+            route = _route_label(scope)
+            REQUESTS.labels(method, route, str(status)).inc()
+            REQUEST_LATENCY.labels(method, route).observe(elapsed)
+            REQUEST_STATEMENTS.labels(method, route).observe(stats.statements)
+            REQUEST_DB_TIME.labels(method, route).observe(stats.db_time)
+            REQUEST_ROWS.labels(method, route).observe(stats.rows)
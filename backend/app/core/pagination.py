@@ -0,0 +1,83 @@
+import base64
+import enum
+import json
+import uuid
+from datetime import date, datetime
+from typing import Any, NamedTuple, Type
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded or does not match the query."""
+
+
+class InvalidFieldError(ValueError):
+    """Raised when a listing is sorted or filtered by a field that does not allow it."""
+
+
+class Cursor(NamedTuple):
+    sort_field: str
+    sort_order: str
+    value: Any
+    id: uuid.UUID
+    backwards: bool
+
+
+def dump_cursor_value(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def load_cursor_value(value: Any, python_type: Type) -> Any:
+    """Turn a JSON cursor value back into the Python type of the sort column."""
+    if value is None:
+        return None
+    try:
+        if issubclass(python_type, enum.Enum):
+            return python_type(value)
+        if issubclass(python_type, datetime):
+            return datetime.fromisoformat(value)
+        if issubclass(python_type, date):
+            return date.fromisoformat(value)
+        if issubclass(python_type, uuid.UUID):
+            return uuid.UUID(value)
+    except (TypeError, ValueError) as exc:
+        raise InvalidCursorError("Malformed cursor value") from exc
+    return value
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    """Serialize a cursor into an opaque URL-safe token."""
+    payload = {
+        "s": cursor.sort_field,
+        "o": cursor.sort_order,
+        "v": dump_cursor_value(cursor.value),
+        "id": str(cursor.id),
+        "b": cursor.backwards,
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(token: str) -> Cursor:
+    """Decode a token produced by ``encode_cursor``.
+
+    The sort value is returned as it was stored in JSON; callers convert it with
+    ``load_cursor_value`` once they know the type of the sort column.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return Cursor(
+            sort_field=str(payload["s"]),
+            sort_order=str(payload["o"]),
+            value=payload["v"],
+            id=uuid.UUID(payload["id"]),
+            backwards=bool(payload["b"]),
+        )
+    except (ValueError, KeyError, TypeError) as exc:
+        raise InvalidCursorError("Malformed cursor") from exc
@@ -0,0 +1,166 @@
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logger = logging.getLogger("app.sql")
+
+# Statements EXPLAIN accepts; EXPLAIN without ANALYZE never runs them
+EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """Raised when a request runs more SQL statements than its route allows."""
+
+
+class _RequestQueries:
+    __slots__ = ("scope", "count")
+
+    def __init__(self, scope: Dict[str, Any]):
+        self.scope = scope
+        self.count = 0
+
+    @property
+    def route(self) -> Optional[str]:
+        # Set by the router once the request is matched
+        route = self.scope.get("route")
+        return f"{self.scope['method']} {route.path}" if route else None
+
+
+_request_queries: ContextVar[Optional[_RequestQueries]] = ContextVar(
+    "request_queries", default=None
+)
+
+
+def enabled() -> bool:
+    return settings.SLOW_QUERY_MS > 0 or settings.QUERY_BUDGET_MODE != "off"
+
+
+def budget_for(route: str) -> int:
+    """Statement budget of ``route`` (``"GET /api/contactos/"``)."""
+    return settings.QUERY_BUDGETS.get(route, settings.QUERY_BUDGET_DEFAULT)
+
+
+def _explain(conn, statement: str, parameters: Any) -> str:
+    """Plan of ``statement``, run on ``conn`` inside the request's transaction.
+
+    A failed statement aborts a Postgres transaction, so the EXPLAIN runs in a
+    savepoint that is rolled back on failure; the request's next statement
+    must not fail because its diagnostics did.
+    """
+    cursor = conn.connection.cursor()
+    try:
+        try:
+            cursor.execute("SAVEPOINT query_guard_explain")
+            savepoint = True
+        except Exception:
+            # Outside a transaction block, where a failed EXPLAIN aborts nothing
+            savepoint = False
+        try:
+            cursor.execute(f"EXPLAIN {statement}", parameters)
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+        except Exception as exc:
+            if savepoint:
+                cursor.execute("ROLLBACK TO SAVEPOINT query_guard_explain")
+            return f"EXPLAIN failed: {exc}"
+        if savepoint:
+            cursor.execute("RELEASE SAVEPOINT query_guard_explain")
+        return plan
+    finally:
+        cursor.close()
+
+
+def _log_slow(conn, statement: str, parameters: Any, elapsed: float) -> None:
+    request = _request_queries.get()
+    where = f" in {request.route}" if request and request.route else ""
+    message = (
+        f"Slow query ({elapsed * 1000:.1f} ms){where}: {statement}\n"
+        f"Parameters: {parameters!r}"
+    )
+    verb = (statement.split(None, 1) or [""])[0].upper()
+    if settings.SLOW_QUERY_EXPLAIN and verb in EXPLAINABLE:
+        message += f"\n{_explain(conn, statement, parameters)}"
+    logger.warning(message)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context.guard_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - context.guard_started
+    if settings.SLOW_QUERY_MS > 0 and elapsed * 1000 >= settings.SLOW_QUERY_MS:
+        if not executemany:
+            _log_slow(conn, statement, parameters, elapsed)
+
+    request = _request_queries.get()
+    if request is None:
+        return
+    request.count += 1
+    if settings.QUERY_BUDGET_MODE == "raise" and request.route:
+        budget = budget_for(request.route)
+        if request.count > budget:
+            raise QueryBudgetExceeded(
+                f"{request.route} ran {request.count} SQL statements, "
+                f"budget is {budget}"
+            )
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Log slow statements of ``engine`` and count them against request budgets."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryBudgetMiddleware:
+    """Counts each request's SQL statements against its route's budget.
+
+    In ``raise`` mode the statement over budget raises ``QueryBudgetExceeded``
+    (the request fails with a 500); in ``warn`` mode the request completes and
+    the overrun is logged.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = _RequestQueries(scope)
+        token = _request_queries.set(request)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_queries.reset(token)
+            if settings.QUERY_BUDGET_MODE == "warn" and request.route:
+                budget = budget_for(request.route)
+                if request.count > budget:
+                    logger.warning(
+                        f"{request.route} ran {request.count} SQL statements "
+                        f"(budget {budget})"
+                    )
+
+
+@contextmanager
+def count_queries(*engines: Engine) -> Iterator[List[str]]:
+    """Collect the statements run on ``engines``, from any thread, in the block."""
+    statements: List[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    for engine in engines:
+        event.listen(engine, "after_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        for engine in engines:
+            event.remove(engine, "after_cursor_execute", record)
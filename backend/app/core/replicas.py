@@ -0,0 +1,200 @@
+import asyncio
+import hashlib
+import itertools
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi import Request
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Caught up when everything received has been replayed (an idle primary sends
+# nothing, so replay timestamps alone would read as growing lag); 0 off a standby
+LAG_SQL = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE coalesce(
+            extract(epoch FROM now() - pg_last_xact_replay_timestamp()), 0
+        )
+    END
+    """)
+
+# Set on successful writes, while it lasts the client's reads stay on the primary.
+# The cookie only reaches same-origin clients; cross-origin ones (the SPA) echo
+# the header back, and the writer's token is also remembered in this process
+STICKY_COOKIE = "crm_primary_until"
+STICKY_HEADER = "X-Primary-Until"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# Digests of the bearer tokens that wrote within DB_READ_YOUR_WRITES_SECONDS
+recent_writers = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl=settings.DB_READ_YOUR_WRITES_SECONDS,
+)
+
+
+class Replica:
+    """A streaming replica and the session factories bound to it."""
+
+    def __init__(
+        self,
+        name: str,
+        engine: Engine,
+        session: Callable[[], Any],
+        async_session: Optional[Callable[[], Any]] = None,
+    ):
+        self.name = name
+        self.engine = engine
+        self.session = session
+        self.async_session = async_session
+        # Unusable until the first check has passed
+        self.healthy = False
+        self.lag: Optional[float] = None
+        self.error: Optional[str] = None
+        self.checked_at: Optional[float] = None
+
+
+class ReplicaSet:
+    """Replicas that GET requests may read from, with lag-aware health checks.
+
+    ``check`` marks a replica unhealthy when it cannot be reached or lags the
+    primary by more than ``max_lag`` seconds; ``pick`` round-robins over the
+    healthy ones and returns None (read from the primary) when there are none.
+    """
+
+    def __init__(self, replicas: List[Replica], *, max_lag: float):
+        self.replicas = replicas
+        self.max_lag = max_lag
+        self._next = itertools.count()
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self.replicas)
+
+    def check(self) -> None:
+        for replica in self.replicas:
+            try:
+                with replica.engine.connect() as conn:
+                    lag = float(conn.execute(LAG_SQL).scalar())
+                replica.lag, replica.error = lag, None
+                healthy = lag <= self.max_lag
+            except Exception as exc:
+                replica.lag, replica.error = None, str(exc).splitlines()[0]
+                healthy = False
+            if healthy != replica.healthy:
+                logger.warning(
+                    f"Replica {replica.name} is now "
+                    f"{'in' if healthy else 'out of'} rotation "
+                    f"(lag {replica.lag}, error {replica.error})"
+                )
+            replica.healthy = healthy
+            replica.checked_at = time.time()
+
+    def pick(self) -> Optional[Replica]:
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+        with self._lock:
+            position = next(self._next)
+        return healthy[position % len(healthy)]
+
+    def stats(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "name": replica.name,
+                "healthy": replica.healthy,
+                "lag_seconds": replica.lag,
+                "error": replica.error,
+                "checked_at": replica.checked_at,
+            }
+            for replica in self.replicas
+        ]
+
+
+async def monitor_replicas(replicas: ReplicaSet, interval: float) -> None:
+    """Re-check ``replicas`` every ``interval`` seconds (checks run in a thread)."""
+    while True:
+        await asyncio.to_thread(replicas.check)
+        await asyncio.sleep(interval)
+
+
+def _writer_key(authorization: str) -> str:
+    # Keyed by token rather than user: decoding it here would cost a JWT check
+    return hashlib.sha256(authorization.encode("latin-1")).hexdigest()
+
+
+def _pinned(value: Optional[str], now: float) -> bool:
+    # Bounded by the window (plus rounding), so a forged value cannot pin a
+    # client's reads to the primary for longer than a real write would
+    try:
+        until = float(value or 0)
+    except ValueError:
+        return False
+    return now < until <= now + settings.DB_READ_YOUR_WRITES_SECONDS + 1
+
+
+def reads_replica(db: Any) -> bool:
+    """Whether the (sync or async) session ``db`` reads from a replica.
+
+    Results read there may miss recent writes, so they must not be cached for
+    clients that read the primary (see ``database._replica``).
+    """
+    return db.info.get("replica") is not None
+
+
+def is_sticky(request: Request) -> bool:
+    """Whether the client wrote recently enough that it must read the primary."""
+    now = time.time()
+    if _pinned(request.cookies.get(STICKY_COOKIE), now):
+        return True
+    if _pinned(request.headers.get(STICKY_HEADER), now):
+        return True
+    authorization = request.headers.get("authorization")
+    return bool(authorization and recent_writers.get(_writer_key(authorization)))
+
+
+class ReadYourWritesMiddleware:
+    """Pins a client's reads to the primary for a short window after it writes.
+
+    Every successful request with an unsafe method marks the client for
+    ``DB_READ_YOUR_WRITES_SECONDS``: its bearer token is remembered in
+    ``recent_writers`` and the response carries the window's end both as
+    ``STICKY_COOKIE`` and as ``STICKY_HEADER`` (for clients to send back).
+    ``deps.get_db`` skips the replicas while any of them is valid, so the
+    client never reads a replica that is behind its write.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                window = settings.DB_READ_YOUR_WRITES_SECONDS
+                until = f"{time.time() + window:.0f}"
+                for name, value in scope["headers"]:
+                    if name == b"authorization":
+                        recent_writers.set(_writer_key(value.decode("latin-1")), True)
+                cookie = (
+                    f"{STICKY_COOKIE}={until}; Max-Age={window}; "
+                    "Path=/; HttpOnly; SameSite=Lax"
+                )
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"set-cookie", cookie.encode("latin-1")),
+                    (STICKY_HEADER.lower().encode("latin-1"), until.encode("latin-1")),
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,195 @@
+import hashlib
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+
+class MemoryBackend:
+    """Per-process backend: an LRU/TTL cache plus local generation counters."""
+
+    local = True
+    errors: Tuple[type, ...] = ()
+
+    def __init__(self, *, maxsize: int, ttl: float):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._cache.get(key)
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._cache.set(key, value, ttl)
+
+    def generation(self, namespace: str) -> int:
+        return self._generations.get(namespace, 0)
+
+    def bump(self, namespace: str) -> None:
+        with self._lock:
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+
+    def size(self) -> Optional[int]:
+        return len(self._cache)
+
+
+class RedisBackend:
+    """Shared backend on a Redis-compatible client (``get``/``set(ex=)``/``incr``).
+
+    Entries expire through the TTL and, under memory pressure, through the
+    server's eviction policy (configure ``maxmemory-policy allkeys-lru``).
+    Generations live on the server, so a write in any worker invalidates the
+    pages cached by all of them.
+    """
+
+    local = False
+
+    def __init__(self, client: Any, *, prefix: str = "crm:results", errors=()):
+        self.client = client
+        self.prefix = prefix
+        # Connection problems are treated as misses rather than failing requests
+        self.errors = errors
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(f"{self.prefix}:{key}")
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self.client.set(f"{self.prefix}:{key}", value, ex=max(1, int(ttl)))
+
+    def generation(self, namespace: str) -> int:
+        return int(self.client.get(f"{self.prefix}:generation:{namespace}") or 0)
+
+    def bump(self, namespace: str) -> None:
+        self.client.incr(f"{self.prefix}:generation:{namespace}")
+
+    def size(self) -> Optional[int]:
+        return None
+
+
+class FakeRedis:
+    """In-process stand-in for the Redis client calls used by ``RedisBackend``."""
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[Optional[float], bytes]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires is not None and expires <= time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: str, value: bytes, ex: Optional[int] = None) -> None:
+        expires = time.monotonic() + ex if ex else None
+        with self._lock:
+            self._data[key] = (expires, value)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            _, value = self._data.get(key, (None, b"0"))
+            value = str(int(value) + 1).encode()
+            self._data[key] = (None, value)
+            return int(value)
+
+
+class ResultCache:
+    """Serialized query results keyed by namespace, generation and a query key.
+
+    ``invalidate`` bumps the namespace generation, which makes every entry
+    stored under an older generation unreachable at once. Readers take the
+    generation before running their query (``lookup``) and store under it
+    (``store``), so a result computed while a write commits is never served
+    under the newer generation.
+    """
+
+    def __init__(self, backend: Any, *, ttl: float):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    @property
+    def local(self) -> bool:
+        """False when calls go over the network (and should stay off event loops)."""
+        return getattr(self.backend, "local", True)
+
+    def _count(self, field: str) -> None:
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def lookup(self, namespace: str, key: Hashable) -> Tuple[Optional[bytes], str]:
+        """Cached value for ``key`` (or None) and the slot to ``store`` it into."""
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()
+        try:
+            generation = self.backend.generation(namespace)
+            slot = f"{namespace}:{generation}:{digest}"
+            value = self.backend.get(slot)
+        except self.backend.errors:
+            self._count("errors")
+            return None, ""
+        self._count("hits" if value is not None else "misses")
+        return value, slot
+
+    def store(self, slot: str, value: bytes) -> None:
+        if not slot:
+            return
+        try:
+            self.backend.set(slot, value, self.ttl)
+        except self.backend.errors:
+            self._count("errors")
+
+    def invalidate(self, namespace: str) -> None:
+        if not self.enabled:
+            return
+        try:
+            self.backend.bump(namespace)
+        except self.backend.errors:
+            self._count("errors")
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "backend": settings.RESULT_CACHE_BACKEND,
+            "size": self.backend.size() if self.enabled else 0,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_ratio": self.hits / total if total else 0.0,
+        }
+
+
+def _build_backend() -> Any:
+    backend = settings.RESULT_CACHE_BACKEND
+    if backend == "memory":
+        return MemoryBackend(
+            maxsize=settings.RESULT_CACHE_MAX_ENTRIES,
+            ttl=settings.RESULT_CACHE_TTL_SECONDS,
+        )
+    if backend == "fake":
+        return RedisBackend(FakeRedis())
+    if backend == "redis":
+        # Optional dependency, only needed for a cache shared between workers
+        import redis
+
+        client = redis.Redis.from_url(
+            settings.REDIS_URL, socket_timeout=settings.RESULT_CACHE_TIMEOUT_SECONDS
+        )
+        return RedisBackend(client, errors=(redis.RedisError,))
+    return None
+
+
+result_cache = ResultCache(_build_backend(), ttl=settings.RESULT_CACHE_TTL_SECONDS)
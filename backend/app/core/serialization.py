@@ -0,0 +1,32 @@
+from functools import lru_cache
+from typing import Any, Mapping, Optional, Type
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+from app.schemas.common import CursorPaginatedResponse, PaginatedResponse
+
+
+# Built once per item schema: constructing the validator/serializer is the
+# expensive part
+@lru_cache(maxsize=None)
+def page_adapter(item_model: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(PaginatedResponse[item_model])
+
+
+@lru_cache(maxsize=None)
+def cursor_page_adapter(item_model: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(CursorPaginatedResponse[item_model])
+
+
+def json_response(
+    adapter: TypeAdapter, data: Any, headers: Optional[Mapping[str, str]] = None
+) -> Response:
+    """``data`` validated and encoded to JSON bytes by pydantic-core in one pass.
+
+    Returning the ``Response`` directly skips FastAPI's own ``response_model``
+    validation and ``jsonable_encoder`` walk; ``data`` may hold plain dicts or
+    ORM objects (validated here) or schema instances (taken as they are).
+    """
+    body = adapter.dump_json(adapter.validate_python(data), by_alias=True)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -1,4 +1,4 @@
-from .user import user
-from .contact import contact
+from .user import user, async_user
+from .contact import contact, async_contact
 
-__all__ = ["user", "contact"]
+__all__ = ["user", "contact", "async_user", "async_contact"]
@@ -0,0 +1,183 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import Table, bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.crud.base import invalidate_table
+from app.database import SessionLocal
+from app.models.archive import contacts_archive, users_archive
+from app.models.base import utcnow
+
+logger = logging.getLogger(__name__)
+
+# Live table -> its archive
+ARCHIVES: Dict[str, Table] = {"contacts": contacts_archive, "users": users_archive}
+
+_IDS = bindparam("ids", type_=ARRAY(PG_UUID(as_uuid=True)))
+
+
+def _columns(archive: Table) -> List[str]:
+    return [column.name for column in archive.columns if column.name != "archived_at"]
+
+
+def _archive_sql(table: str) -> str:
+    # SKIP LOCKED: rows being written are left for the next run, and
+    # concurrent runs (one per worker) split the batches instead of waiting
+    columns = ", ".join(_columns(ARCHIVES[table]))
+    return f"""
+        WITH moved AS (
+            DELETE FROM {table} WHERE id IN (
+                SELECT id FROM {table}
+                WHERE is_deleted AND updated_at < :before
+                LIMIT :limit
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING {columns}
+        )
+        INSERT INTO {ARCHIVES[table].name} ({columns}, archived_at)
+        SELECT {columns}, :now FROM moved
+        """
+
+
+def _restore_sql(table: str) -> str:
+    # Rows whose id or email is live again conflict and stay archived
+    columns = _columns(ARCHIVES[table])
+    values = ", ".join(":now" if name == "updated_at" else name for name in columns)
+    return f"""
+        WITH restored AS (
+            INSERT INTO {table} ({", ".join(columns)}, is_deleted)
+            SELECT {values}, false FROM {ARCHIVES[table].name}
+            WHERE id = ANY(:ids)
+            ON CONFLICT DO NOTHING
+            RETURNING id
+        )
+        DELETE FROM {ARCHIVES[table].name} WHERE id IN (SELECT id FROM restored)
+        """
+
+
+def _purge_sql(archive: str) -> str:
+    return f"""
+        DELETE FROM {archive} WHERE id IN (
+            SELECT id FROM {archive}
+            WHERE archived_at < :before
+            LIMIT :limit
+            FOR UPDATE SKIP LOCKED
+        )
+        """
+
+
+def archive_deleted(
+    db: Session, table: str, *, before: datetime, batch_size: Optional[int] = None
+) -> int:
+    """Move rows of ``table`` soft-deleted before ``before`` to its archive.
+
+    Soft deletes bump ``updated_at``, so it dates the deletion. Each batch of
+    ``batch_size`` rows is one ``DELETE ... RETURNING`` into an ``INSERT``,
+    committed on its own, so locks are held for one batch only. Freed heap and
+    index space is reused by new rows once vacuum has passed.
+    """
+    batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+    sql = text(_archive_sql(table))
+    moved = 0
+    while True:
+        count = db.execute(
+            sql, {"before": before, "limit": batch_size, "now": utcnow()}
+        ).rowcount
+        db.commit()
+        moved += count
+        if count < batch_size:
+            return moved
+
+
+def restore(db: Session, table: str, ids: Sequence[UUID]) -> int:
+    """Put archived rows of ``table`` back as live (undeleted) rows.
+
+    Returns how many were restored; the others were not archived or conflict
+    with a live row (same email) and stay where they are.
+    """
+    restored = db.execute(
+        text(_restore_sql(table)).bindparams(_IDS),
+        {"ids": list(ids), "now": utcnow()},
+    ).rowcount
+    db.commit()
+    if restored:
+        invalidate_table(table)
+    return restored
+
+
+def purge(
+    db: Session,
+    table: str,
+    *,
+    before: Optional[datetime] = None,
+    ids: Optional[Sequence[UUID]] = None,
+    batch_size: Optional[int] = None,
+) -> int:
+    """Delete archived rows of ``table`` for good, by id or archived before ``before``."""
+    archive = ARCHIVES[table].name
+    if ids is not None:
+        sql = text(f"DELETE FROM {archive} WHERE id = ANY(:ids)").bindparams(_IDS)
+        purged = db.execute(sql, {"ids": list(ids)}).rowcount
+        db.commit()
+        return purged
+    if before is None:
+        raise ValueError("purge needs ids or before")
+
+    batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+    sql = text(_purge_sql(archive))
+    purged = 0
+    while True:
+        count = db.execute(sql, {"before": before, "limit": batch_size}).rowcount
+        db.commit()
+        purged += count
+        if count < batch_size:
+            return purged
+
+
+def run_archival(db: Session) -> Dict[str, Dict[str, int]]:
+    """Archive and purge every table per the ARCHIVE_* settings."""
+    now = utcnow()
+    results = {}
+    for table in ARCHIVES:
+        result = {
+            "archived": archive_deleted(
+                db, table, before=now - timedelta(days=settings.ARCHIVE_AFTER_DAYS)
+            )
+        }
+        if settings.ARCHIVE_PURGE_AFTER_DAYS > 0:
+            result["purged"] = purge(
+                db,
+                table,
+                before=now - timedelta(days=settings.ARCHIVE_PURGE_AFTER_DAYS),
+            )
+        results[table] = result
+    return results
+
+
+def _archive_once() -> Dict[str, Dict[str, int]]:
+    db = SessionLocal()
+    try:
+        return run_archival(db)
+    finally:
+        db.close()
+
+
+async def archive_periodically(interval: int) -> None:
+    """Run ``run_archival`` every ``interval`` seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            results = await asyncio.to_thread(_archive_once)
+        except Exception:
+            logger.exception("Archival of deleted rows failed")
+            continue
+        for table, result in results.items():
+            if any(result.values()):
+                logger.info(f"Archival of {table}: {result}")
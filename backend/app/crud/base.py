@@ -1,7 +1,31 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from datetime import datetime
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import Select, Text, cast, func, insert, literal_column, select, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, load_only
+from app.crud.count import (
+    CountResult,
+    async_count_statement,
+    count_query,
+    invalidate_counts,
+)
+from app.core.config import settings
+from app.core.result_cache import result_cache
 from app.database import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
@@ -9,10 +33,108 @@ CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
 
-class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+def invalidate_table(table: str) -> None:
+    """Drop derived state (cached counts and result pages) after a write to ``table``."""
+    invalidate_counts(table)
+    result_cache.invalidate(table)
+
+
+class WindowSignature(NamedTuple):
+    """Cheap stand-in for the contents of a page of rows (see ``_signature_stmt``)."""
+
+    rows: int
+    last_modified: Optional[datetime]
+    ids_digest: str
+
+
+class _CRUDCommon(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+    """Behaviour shared by the sync and async CRUD classes."""
+
+    # Schema fields that are not columns, by the columns they are computed from
+    derived_fields: Dict[str, Tuple[str, ...]] = {}
+
     def __init__(self, model: Type[ModelType]):
         self.model = model
 
+    def _field_columns(self, fields: Sequence[str]) -> list:
+        """Model columns needed to serve the schema ``fields``."""
+        names: Dict[str, None] = {}
+        for field in fields:
+            names.update(dict.fromkeys(self.derived_fields.get(field, (field,))))
+        return [getattr(self.model, name) for name in names]
+
+    def _load_only(self, fields: Optional[Sequence[str]]) -> list:
+        """Loader options that keep every other column out of the SELECT."""
+        if fields is None:
+            return []
+        return [load_only(*self._field_columns(fields))]
+
+    def _create_data(self, obj_in: CreateSchemaType) -> Dict[str, Any]:
+        # Field names, not aliases: they must match the model's attributes
+        return jsonable_encoder(obj_in, by_alias=False)
+
+    def _update_data(
+        self, obj_in: Union[UpdateSchemaType, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        if isinstance(obj_in, dict):
+            return obj_in
+        return obj_in.dict(exclude_unset=True)
+
+    def _changes(self, db_obj: ModelType, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Columns in ``data`` whose value differs from ``db_obj``."""
+        columns = self.model.__table__.columns
+        return {
+            field: value
+            for field, value in data.items()
+            if field in columns and getattr(db_obj, field) != value
+        }
+
+    def _after_write(self, db_obj: ModelType) -> None:
+        """Drop derived state once a write has been committed."""
+        invalidate_table(self.model.__tablename__)
+
+    def _live(self) -> Select:
+        return select(self.model).where(self.model.is_deleted == False)
+
+    def _version_stmt(self, id: Any) -> Select:
+        return select(self.model.updated_at).where(
+            self.model.id == id, self.model.is_deleted == False
+        )
+
+    def _multi_window(self, *, skip: int, limit: int) -> Select:
+        return (
+            select(self.model.id, self.model.updated_at)
+            .where(self.model.is_deleted == False)
+            .offset(skip)
+            .limit(limit)
+        )
+
+    @staticmethod
+    def _signature_stmt(window: Select) -> Select:
+        """Row count, newest ``updated_at`` and a digest of the ids in ``window``.
+
+        ``window`` selects ``id`` and ``updated_at`` for one page. A write to a row
+        on the page moves the newest ``updated_at`` forward and rows entering or
+        leaving it change the digest, so no ORM objects are needed to tell
+        whether the page is unchanged.
+        """
+        page = window.subquery()
+        ids = func.string_agg(
+            cast(page.c.id, Text), aggregate_order_by(literal_column("','"), page.c.id)
+        )
+        return select(
+            func.count(), func.max(page.c.updated_at), func.coalesce(func.md5(ids), "")
+        )
+
+
+class CRUDBase(_CRUDCommon[ModelType, CreateSchemaType, UpdateSchemaType]):
+    """Sync CRUD. Writes follow ``CRUD_WRITE_MODE``:
+
+    ``orm`` adds or mutates the object, commits and refreshes it (an extra
+    SELECT); ``returning`` sends a single ``INSERT/UPDATE ... RETURNING`` and
+    builds the object from the returned row.
+    """
+
     def get(self, db: Session, id: Any) -> Optional[ModelType]:
         return (
             db.query(self.model)
@@ -20,47 +142,221 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             .first()
         )
 
-    def get_multi(
+    def get_version(self, db: Session, id: Any) -> Optional[datetime]:
+        """``updated_at`` of a live row, without loading it."""
+        return db.execute(self._version_stmt(id)).scalar_one_or_none()
+
+    def count(self, db: Session) -> CountResult:
+        query = db.query(self.model).filter(self.model.is_deleted == False)
+        return count_query(db, query, table=self.model.__tablename__)
+
+    def _signature(self, db: Session, window: Select) -> WindowSignature:
+        return WindowSignature(*db.execute(self._signature_stmt(window)).one())
+
+    def multi_signature(
         self, db: Session, *, skip: int = 0, limit: int = 100
-    ) -> tuple[List[ModelType], int]:
+    ) -> WindowSignature:
+        return self._signature(db, self._multi_window(skip=skip, limit=limit))
+
+    def get_multi(
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        total: Optional[CountResult] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> tuple[List[ModelType], CountResult]:
+        if total is None:
+            total = self.count(db)
         query = db.query(self.model).filter(self.model.is_deleted == False)
-        total = query.count()
+        query = query.options(*self._load_only(fields))
         items = query.offset(skip).limit(limit).all()
         return items, total
 
-    def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
-        obj_in_data = jsonable_encoder(obj_in)
-        db_obj = self.model(**obj_in_data)
-        db.add(db_obj)
+    def _returning(self, db: Session, stmt) -> Optional[ModelType]:
+        stmt = stmt.returning(self.model).execution_options(synchronize_session=False)
+        db_obj = db.execute(stmt).scalar_one_or_none()
+        if db_obj is not None:
+            # Detached, the object keeps the returned values instead of being
+            # expired by the commit and reloaded on first access
+            db.expunge(db_obj)
         db.commit()
-        db.refresh(db_obj)
         return db_obj
 
+    def _insert(self, db: Session, values: Dict[str, Any]) -> ModelType:
+        if settings.CRUD_WRITE_MODE == "returning":
+            db_obj = self._returning(db, insert(self.model).values(**values))
+        else:
+            db_obj = self.model(**values)
+            db.add(db_obj)
+            db.commit()
+            db.refresh(db_obj)
+        self._after_write(db_obj)
+        return db_obj
+
+    def _update_values(
+        self, db: Session, db_obj: ModelType, values: Dict[str, Any]
+    ) -> ModelType:
+        if not values:
+            return db_obj
+        if settings.CRUD_WRITE_MODE == "returning":
+            if db_obj in db:
+                # Otherwise the identity map hands back this (stale) instance
+                # instead of one built from the returned row
+                db.expunge(db_obj)
+            db_obj = self._returning(
+                db,
+                update(self.model).where(self.model.id == db_obj.id).values(**values),
+            )
+        else:
+            for field, value in values.items():
+                setattr(db_obj, field, value)
+            db.add(db_obj)
+            db.commit()
+            db.refresh(db_obj)
+        self._after_write(db_obj)
+        return db_obj
+
+    def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
+        return self._insert(db, self._create_data(obj_in))
+
     def update(
         self,
         db: Session,
         *,
         db_obj: ModelType,
-        obj_in: Union[UpdateSchemaType, Dict[str, Any]]
+        obj_in: Union[UpdateSchemaType, Dict[str, Any]],
     ) -> ModelType:
-        obj_data = jsonable_encoder(db_obj)
-        if isinstance(obj_in, dict):
-            update_data = obj_in
+        changes = self._changes(db_obj, self._update_data(obj_in))
+        return self._update_values(db, db_obj, changes)
+
+    def remove(self, db: Session, *, id: Any) -> Optional[ModelType]:
+        # Soft delete instead of hard delete
+        if settings.CRUD_WRITE_MODE == "returning":
+            obj = self._returning(
+                db,
+                update(self.model).where(self.model.id == id).values(is_deleted=True),
+            )
+            if obj is not None:
+                self._after_write(obj)
+            return obj
+        obj = db.query(self.model).get(id)
+        if obj is None:
+            return None
+        return self._update_values(db, obj, {"is_deleted": True})
+
+
+class AsyncCRUDBase(_CRUDCommon[ModelType, CreateSchemaType, UpdateSchemaType]):
+    """``CRUDBase`` for an ``AsyncSession`` (used when ``DB_MODE=async``).
+
+    Writes follow ``CRUD_WRITE_MODE`` exactly as in ``CRUDBase``.
+    """
+
+    async def get(self, db: AsyncSession, id: Any) -> Optional[ModelType]:
+        stmt = select(self.model).where(
+            self.model.id == id, self.model.is_deleted == False
+        )
+        return (await db.execute(stmt.limit(1))).scalars().first()
+
+    async def get_version(self, db: AsyncSession, id: Any) -> Optional[datetime]:
+        """``updated_at`` of a live row, without loading it."""
+        return (await db.execute(self._version_stmt(id))).scalar_one_or_none()
+
+    async def count(self, db: AsyncSession) -> CountResult:
+        return await async_count_statement(
+            db, self._live(), table=self.model.__tablename__
+        )
+
+    async def _signature(self, db: AsyncSession, window: Select) -> WindowSignature:
+        return WindowSignature(*(await db.execute(self._signature_stmt(window))).one())
+
+    async def multi_signature(
+        self, db: AsyncSession, *, skip: int = 0, limit: int = 100
+    ) -> WindowSignature:
+        return await self._signature(db, self._multi_window(skip=skip, limit=limit))
+
+    async def get_multi(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        total: Optional[CountResult] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> tuple[List[ModelType], CountResult]:
+        stmt = self._live().options(*self._load_only(fields))
+        if total is None:
+            total = await self.count(db)
+        items = (await db.execute(stmt.offset(skip).limit(limit))).scalars().all()
+        return list(items), total
+
+    async def _returning(self, db: AsyncSession, stmt) -> Optional[ModelType]:
+        stmt = stmt.returning(self.model).execution_options(synchronize_session=False)
+        db_obj = (await db.execute(stmt)).scalar_one_or_none()
+        if db_obj is not None:
+            # Detached, so the commit cannot expire it (reloading expired
+            # attributes is not possible outside the async session's greenlet)
+            db.expunge(db_obj)
+        await db.commit()
+        return db_obj
+
+    async def _insert(self, db: AsyncSession, values: Dict[str, Any]) -> ModelType:
+        if settings.CRUD_WRITE_MODE == "returning":
+            db_obj = await self._returning(db, insert(self.model).values(**values))
         else:
-            update_data = obj_in.dict(exclude_unset=True)
-        for field in obj_data:
-            if field in update_data:
-                setattr(db_obj, field, update_data[field])
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+            db_obj = self.model(**values)
+            db.add(db_obj)
+            await db.commit()
+            await db.refresh(db_obj)
+        self._after_write(db_obj)
         return db_obj
 
-    def remove(self, db: Session, *, id: Any) -> ModelType:
-        obj = db.query(self.model).get(id)
+    async def _update_values(
+        self, db: AsyncSession, db_obj: ModelType, values: Dict[str, Any]
+    ) -> ModelType:
+        if not values:
+            return db_obj
+        if settings.CRUD_WRITE_MODE == "returning":
+            if db_obj in db:
+                db.expunge(db_obj)
+            db_obj = await self._returning(
+                db,
+                update(self.model).where(self.model.id == db_obj.id).values(**values),
+            )
+        else:
+            for field, value in values.items():
+                setattr(db_obj, field, value)
+            db.add(db_obj)
+            await db.commit()
+            await db.refresh(db_obj)
+        self._after_write(db_obj)
+        return db_obj
+
+    async def create(self, db: AsyncSession, *, obj_in: CreateSchemaType) -> ModelType:
+        return await self._insert(db, self._create_data(obj_in))
+
+    async def update(
+        self,
+        db: AsyncSession,
+        *,
+        db_obj: ModelType,
+        obj_in: Union[UpdateSchemaType, Dict[str, Any]],
+    ) -> ModelType:
+        changes = self._changes(db_obj, self._update_data(obj_in))
+        return await self._update_values(db, db_obj, changes)
+
+    async def remove(self, db: AsyncSession, *, id: Any) -> Optional[ModelType]:
         # Soft delete instead of hard delete
-        obj.is_deleted = True
-        db.add(obj)
-        db.commit()
-        db.refresh(obj)
-        return obj
+        if settings.CRUD_WRITE_MODE == "returning":
+            obj = await self._returning(
+                db,
+                update(self.model).where(self.model.id == id).values(is_deleted=True),
+            )
+            if obj is not None:
+                self._after_write(obj)
+            return obj
+        obj = await db.get(self.model, id)
+        if obj is None:
+            return None
+        return await self._update_values(db, obj, {"is_deleted": True})
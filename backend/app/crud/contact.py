@@ -1,12 +1,465 @@
-from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, asc, desc
-from app.crud.base import CRUDBase
-from app.models.contact import Contact, ContactStatus
-from app.schemas.contact import ContactCreate, ContactUpdate
+import asyncio
+import hashlib
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+from uuid import UUID
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query, Session
+from sqlalchemy import (
+    Select,
+    func,
+    literal,
+    literal_column,
+    or_,
+    asc,
+    desc,
+    select,
+    tuple_,
+    union_all,
+    update,
+)
+from app.core.config import settings
+from app.core.replicas import reads_replica
+from app.core.result_cache import result_cache
+from app.core.pagination import (
+    Cursor,
+    InvalidCursorError,
+    InvalidFieldError,
+    decode_cursor,
+    encode_cursor,
+    load_cursor_value,
+)
+from app.crud.base import (
+    AsyncCRUDBase,
+    CRUDBase,
+    WindowSignature,
+    invalidate_table,
+)
+from app.crud.count import (
+    CountResult,
+    async_count_statement,
+    count_query,
+)
+from app.models.base import utcnow
+from app.models.contact import Contact, ContactStatus, search_document
+from app.schemas.common import sparse_model
+from app.schemas.contact import Contact as ContactSchema, ContactCreate, ContactUpdate
 
+DEFAULT_SORT_FIELD = "apellidos"
+# Listings only sort by columns with a partial ``(column, id)`` index over the
+# live rows (migration 006), so no sort falls back to sorting the whole table
+SORTABLE_FIELDS = (
+    "apellidos",
+    "nombres",
+    "nombre_completo",
+    "email",
+    "estado",
+    "ciudad",
+    "created_at",
+    "updated_at",
+)
+FILTERABLE_FIELDS = ("estado",)
+# Columns of the API representation, selected as plain rows in READ_MODE=core
+READ_FIELDS = tuple(ContactSchema.model_fields)
+
+T = TypeVar("T")
+SEARCH_CONFIG = literal_column("'es_unaccent'::regconfig")
+
+
+def _payload_digest(payload: bytes) -> str:
+    return hashlib.sha256(payload).hexdigest()[:32]
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class KeysetPlan(NamedTuple):
+    sort_field: str
+    sort_order: str
+    position: Optional[Cursor]
+    criteria: list
+    order_by: list
+
+
+class CachedPage(BaseModel, Generic[T]):
+    """A ``get_multi_filtered`` result as stored in the result cache."""
+
+    items: List[T]
+    total: int
+    exact: bool
+
+
+class ContactQueries:
+    """Statement building shared by the sync and async contact CRUD."""
+
+    def _page_key(
+        self,
+        *,
+        skip: int,
+        limit: int,
+        estados: Optional[List[ContactStatus]],
+        search: Optional[str],
+        sort_field: Optional[str],
+        sort_order: Optional[str],
+        fields: Optional[Sequence[str]],
+    ) -> tuple:
+        return (
+            self._filter_key(estados=estados, search=search),
+            sort_field,
+            sort_order,
+            skip,
+            limit,
+            tuple(fields or READ_FIELDS),
+        )
+
+    @staticmethod
+    def _item_schema(fields: Optional[Sequence[str]]) -> type:
+        return sparse_model(ContactSchema, tuple(fields or READ_FIELDS))
+
+    def _cached_page(
+        self, cached: bytes, fields: Optional[Sequence[str]]
+    ) -> tuple[list, CountResult, str]:
+        page = CachedPage[self._item_schema(fields)].model_validate_json(cached)
+        return page.items, CountResult(page.total, page.exact), _payload_digest(cached)
+
+    def _page_to_cache(
+        self, items: list, total: CountResult, fields: Optional[Sequence[str]]
+    ) -> tuple[list, bytes]:
+        schema = self._item_schema(fields)
+        page = CachedPage[schema](
+            items=[schema.model_validate(item) for item in items],
+            total=total.total,
+            exact=total.exact,
+        )
+        return page.items, page.model_dump_json().encode()
+
+    def _page_stmt(
+        self,
+        *,
+        skip: int,
+        limit: int,
+        estados: Optional[List[ContactStatus]],
+        search: Optional[str],
+        sort_field: Optional[str],
+        sort_order: Optional[str],
+        fields: Optional[Sequence[str]],
+    ) -> Select:
+        """Offset page statement: model rows, or bare columns in READ_MODE=core.
+
+        Either way only the columns behind ``fields`` are selected.
+        """
+        if settings.READ_MODE == "core":
+            stmt = select(*self._field_columns(fields or READ_FIELDS))
+        else:
+            stmt = select(Contact).options(*self._load_only(fields))
+        return (
+            stmt.where(*self._filter_criteria(estados=estados, search=search))
+            .order_by(
+                *self._order_by(
+                    sort_field=sort_field, sort_order=sort_order, search=search
+                )
+            )
+            .offset(skip)
+            .limit(limit)
+        )
+
+    @staticmethod
+    def _page_items(result: Any) -> list:
+        # Column rows become dicts keyed by schema field name: no ORM instances,
+        # identity map or attribute instrumentation involved
+        if settings.READ_MODE == "core":
+            return [row._asdict() for row in result]
+        return list(result.scalars())
+
+    def _keyset_options(self, plan: KeysetPlan, fields: Optional[Sequence[str]]):
+        # The sort column is needed to build the cursors even when not requested
+        if fields is None:
+            return []
+        return self._load_only((*fields, plan.sort_field))
+
+    def _filter_criteria(
+        self,
+        *,
+        estados: Optional[List[ContactStatus]] = None,
+        search: Optional[str] = None,
+    ) -> list:
+        criteria = [Contact.is_deleted == False]
+
+        if estados:
+            criteria.append(Contact.estado.in_(estados))
+
+        if search:
+            # Either branch is served by its own GIN index (see migration 004);
+            # Postgres combines them with a BitmapOr instead of scanning
+            pattern = func.f_unaccent(func.lower(f"%{_escape_like(search)}%"))
+            search_filter = or_(
+                Contact.search_vector.op("@@")(self._search_query(search)),
+                search_document.like(pattern, escape="\\"),
+            )
+            criteria.append(search_filter)
+
+        return criteria
+
+    @staticmethod
+    def _search_query(search: str):
+        return func.websearch_to_tsquery(SEARCH_CONFIG, search)
+
+    def _search_rank(self, search: str):
+        """Relevance of a row for ``search``: word matches first, then similarity."""
+        return func.ts_rank_cd(
+            Contact.search_vector, self._search_query(search)
+        ) + func.similarity(search_document, func.f_unaccent(func.lower(search)))
+
+    @staticmethod
+    def _filter_key(
+        *, estados: Optional[List[ContactStatus]], search: Optional[str]
+    ) -> tuple:
+        """Normalized, hashable form of the filters accepted by ``_filter_criteria``."""
+        return (
+            tuple(sorted({ContactStatus(e).value for e in estados or ()})),
+            (search or "").strip().lower(),
+        )
+
+    @staticmethod
+    def check_sort(sort_field: str) -> str:
+        if sort_field not in SORTABLE_FIELDS:
+            raise InvalidFieldError(
+                f"No se puede ordenar por '{sort_field}'; "
+                f"campos permitidos: {', '.join(SORTABLE_FIELDS)}"
+            )
+        return sort_field
+
+    @staticmethod
+    def check_filters(filter_fields: Iterable[str]) -> None:
+        for field in filter_fields:
+            if field not in FILTERABLE_FIELDS:
+                raise InvalidFieldError(
+                    f"No se puede filtrar por '{field}'; "
+                    f"campos permitidos: {', '.join(FILTERABLE_FIELDS)}"
+                )
+
+    def _order_by(
+        self,
+        *,
+        sort_field: Optional[str],
+        sort_order: Optional[str],
+        search: Optional[str],
+    ) -> list:
+        if sort_field:
+            sort_column = getattr(Contact, self.check_sort(sort_field))
+            # id breaks ties: pages are stable and follow the (column, id) index
+            if sort_order == "desc":
+                return [desc(sort_column), desc(Contact.id)]
+            return [asc(sort_column), asc(Contact.id)]
+        if search:
+            # Most relevant matches first when no explicit sort was requested
+            return [desc(self._search_rank(search)), asc(Contact.id)]
+        # Default sort by apellidos
+        return [asc(Contact.apellidos), asc(Contact.id)]
+
+    def _keyset_plan(
+        self,
+        *,
+        cursor: Optional[str],
+        sort_field: Optional[str],
+        sort_order: Optional[str],
+        limit: int,
+        estados: Optional[List[ContactStatus]],
+        search: Optional[str],
+    ) -> KeysetPlan:
+        """Resolve the seek condition and ordering for a keyset page.
+
+        Rows are ordered by the sort column (NULLs last when ascending, first when
+        descending, as Postgres does by default) with ``id`` as tie-breaker, so
+        every row has a unique position and the page boundary can be expressed as
+        a WHERE clause instead of an OFFSET.
+
+        The boundary is a row comparison, ``(column, id) > (value, id)``, which
+        Postgres uses as the start of a range scan on the ``(column, id)`` index.
+        Where the rest of the walk spans NULL and non-NULL values it is split in
+        one such range per segment, each limited to the page size, and the page
+        is taken from their union.
+        """
+        sort_field = self.check_sort(sort_field or DEFAULT_SORT_FIELD)
+        sort_order = "desc" if sort_order == "desc" else "asc"
+        column = Contact.__table__.columns[sort_field]
+        sort_column = getattr(Contact, sort_field)
+
+        position = None
+        if cursor:
+            position = decode_cursor(cursor)
+            if (position.sort_field, position.sort_order) != (sort_field, sort_order):
+                raise InvalidCursorError("Cursor does not match the requested sort")
+            position = position._replace(
+                value=load_cursor_value(position.value, column.type.python_type)
+            )
+
+        backwards = position.backwards if position else False
+        # Walking backwards is a forward walk over the reversed ordering
+        ascending = (sort_order == "asc") != backwards
+
+        if ascending:
+            order_by = [sort_column.asc().nulls_last(), Contact.id.asc()]
+        else:
+            order_by = [sort_column.desc().nulls_first(), Contact.id.desc()]
+
+        criteria = []
+        if position:
+            segments = self._keyset_segments(
+                sort_column,
+                position.value,
+                position.id,
+                ascending=ascending,
+                nullable=column.nullable,
+            )
+            if len(segments) == 1:
+                criteria = segments[0]
+            else:
+                filters = self._filter_criteria(estados=estados, search=search)
+                ids = union_all(
+                    *(
+                        select(Contact.id)
+                        .where(*filters, *segment)
+                        .order_by(*order_by)
+                        .limit(limit + 1)
+                        for segment in segments
+                    )
+                ).subquery()
+                criteria = [Contact.id.in_(select(ids.c.id))]
+        return KeysetPlan(sort_field, sort_order, position, criteria, order_by)
+
+    def _offset_window(
+        self,
+        *,
+        skip: int,
+        limit: int,
+        estados: Optional[List[ContactStatus]],
+        search: Optional[str],
+        sort_field: Optional[str],
+        sort_order: Optional[str],
+    ) -> Select:
+        """Ids and versions of the rows on an offset page."""
+        return (
+            select(Contact.id, Contact.updated_at)
+            .where(*self._filter_criteria(estados=estados, search=search))
+            .order_by(
+                *self._order_by(
+                    sort_field=sort_field, sort_order=sort_order, search=search
+                )
+            )
+            .offset(skip)
+            .limit(limit)
+        )
+
+    def _keyset_window(
+        self,
+        plan: KeysetPlan,
+        *,
+        limit: int,
+        estados: Optional[List[ContactStatus]],
+        search: Optional[str],
+    ) -> Select:
+        """Ids and versions of the rows on a keyset page (plus the look-ahead row)."""
+        return (
+            select(Contact.id, Contact.updated_at)
+            .where(*self._filter_criteria(estados=estados, search=search))
+            .where(*plan.criteria)
+            .order_by(*plan.order_by)
+            .limit(limit + 1)
+        )
+
+    @staticmethod
+    def _keyset_page(
+        rows: List[Contact], plan: KeysetPlan, limit: int
+    ) -> tuple[List[Contact], Optional[str], Optional[str]]:
+        """Trim the ``limit + 1`` rows fetched for ``plan`` and build its cursors."""
+        backwards = plan.position.backwards if plan.position else False
+        has_more = len(rows) > limit
+        items = list(rows[:limit])
+        if backwards:
+            items.reverse()
+
+        def make_cursor(row: Contact, towards_start: bool) -> str:
+            return encode_cursor(
+                Cursor(
+                    sort_field=plan.sort_field,
+                    sort_order=plan.sort_order,
+                    value=getattr(row, plan.sort_field),
+                    id=row.id,
+                    backwards=towards_start,
+                )
+            )
+
+        if backwards:
+            next_cursor = make_cursor(items[-1], False) if items else None
+            prev_cursor = make_cursor(items[0], True) if has_more else None
+        else:
+            next_cursor = make_cursor(items[-1], False) if has_more else None
+            prev_cursor = (
+                make_cursor(items[0], True) if items and plan.position else None
+            )
+        return items, next_cursor, prev_cursor
+
+    @staticmethod
+    def _keyset_segments(
+        column, value, row_id, *, ascending: bool, nullable: bool
+    ) -> List[list]:
+        """Rows strictly after ``(value, row_id)`` in the keyset ordering.
+
+        Returned as the criteria of each contiguous segment of the remaining
+        walk, in order: the row comparison skips NULLs, so these follow (when
+        ascending) or precede (when descending) the non-NULL values on their own.
+        """
+        bound = tuple_(value, row_id, types=(column.type, Contact.id.type))
+        if ascending:
+            # ORDER BY column ASC NULLS LAST, id ASC
+            if value is None:
+                return [[column.is_(None), Contact.id > row_id]]
+            after = [tuple_(column, Contact.id) > bound]
+            return [after, [column.is_(None)]] if nullable else [after]
+        # ORDER BY column DESC NULLS FIRST, id DESC
+        if value is None:
+            return [[column.is_(None), Contact.id < row_id], [column.isnot(None)]]
+        return [[tuple_(column, Contact.id) < bound]]
+
+
+class CRUDContact(ContactQueries, CRUDBase[Contact, ContactCreate, ContactUpdate]):
+    def _filtered_query(
+        self,
+        db: Session,
+        *,
+        estados: Optional[List[ContactStatus]] = None,
+        search: Optional[str] = None,
+    ) -> Query:
+        return db.query(Contact).filter(
+            *self._filter_criteria(estados=estados, search=search)
+        )
+
+    def count_filtered(
+        self,
+        db: Session,
+        *,
+        estados: Optional[List[ContactStatus]] = None,
+        search: Optional[str] = None,
+    ) -> CountResult:
+        return count_query(
+            db,
+            self._filtered_query(db, estados=estados, search=search),
+            table=Contact.__tablename__,
+            key=self._filter_key(estados=estados, search=search),
+        )
 
-class CRUDContact(CRUDBase[Contact, ContactCreate, ContactUpdate]):
     def get_multi_filtered(
         self,
         db: Session,
@@ -17,35 +470,427 @@ class CRUDContact(CRUDBase[Contact, ContactCreate, ContactUpdate]):
         search: Optional[str] = None,
         sort_field: Optional[str] = None,
         sort_order: Optional[str] = "asc",
-    ) -> tuple[List[Contact], int]:
-        query = db.query(Contact).filter(Contact.is_deleted == False)
+        total: Optional[CountResult] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> tuple[List[Contact], CountResult]:
+        """One offset page of contacts and the total for its filters.
 
-        if estados:
-            query = query.filter(Contact.estado.in_(estados))
+        With the result cache enabled, pages are served from and stored into it
+        and items are ``schemas.Contact`` snapshots instead of ORM objects; with
+        READ_MODE=core they are dicts of column values. ``fields`` (schema field
+        names) limits the columns read; items then only carry those.
+        """
+        page_args = dict(
+            skip=skip,
+            limit=limit,
+            estados=estados,
+            search=search,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            fields=fields,
+        )
+        if result_cache.enabled:
+            items, total, _ = self.get_cached_page(db, total=total, **page_args)
+            return items, total
 
-        if search:
-            search_filter = or_(
-                Contact.nombre_completo.ilike(f"%{search}%"),
-                Contact.email.ilike(f"%{search}%"),
-                Contact.telefono.ilike(f"%{search}%"),
-                Contact.cedula.ilike(f"%{search}%"),
+        if total is None:
+            total = self.count_filtered(db, estados=estados, search=search)
+        return self._page_items(db.execute(self._page_stmt(**page_args))), total
+
+    def get_cached_page(
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        estados: Optional[List[ContactStatus]] = None,
+        search: Optional[str] = None,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = "asc",
+        total: Optional[CountResult] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> tuple[list, CountResult, str]:
+        """``get_multi_filtered`` through the result cache, plus the page's digest.
+
+        The digest is taken over the cached payload, so it identifies exactly
+        what is served (whether just read from the database or a cached copy
+        that may lag it) and can back the listing's ETag without querying the
+        database on a hit. ``total`` only saves the count on a miss; a hit
+        returns the total stored with the page. Pages read from a replica are
+        served but not stored. Requires the result cache.
+        """
+        page_key = self._page_key(
+            skip=skip,
+            limit=limit,
+            estados=estados,
+            search=search,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            fields=fields,
+        )
+        cached, slot = result_cache.lookup(Contact.__tablename__, page_key)
+        if cached is not None:
+            return self._cached_page(cached, fields)
+
+        if total is None:
+            total = self.count_filtered(db, estados=estados, search=search)
+        stmt = self._page_stmt(
+            skip=skip,
+            limit=limit,
+            estados=estados,
+            search=search,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            fields=fields,
+        )
+        items, payload = self._page_to_cache(
+            self._page_items(db.execute(stmt)), total, fields
+        )
+        # A lagging replica's page would be served to the clients that just
+        # wrote (and read the primary) under the generation their write bumped
+        if not reads_replica(db):
+            result_cache.store(slot, payload)
+        return items, total, _payload_digest(payload)
+
+    def page_signature(
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        estados: Optional[List[ContactStatus]] = None,
+        search: Optional[str] = None,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = "asc",
+    ) -> WindowSignature:
+        """Signature of the page ``get_multi_filtered`` would return."""
+        window = self._offset_window(
+            skip=skip,
+            limit=limit,
+            estados=estados,
+            search=search,
+            sort_field=sort_field,
+            sort_order=sort_order,
+        )
+        return self._signature(db, window)
+
+    def keyset_signature(
+        self,
+        db: Session,
+        *,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        estados: Optional[List[ContactStatus]] = None,
+        search: Optional[str] = None,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = "asc",
+    ) -> WindowSignature:
+        """Signature of the page ``get_multi_keyset`` would return."""
+        plan = self._keyset_plan(
+            cursor=cursor,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            limit=limit,
+            estados=estados,
+            search=search,
+        )
+        window = self._keyset_window(plan, limit=limit, estados=estados, search=search)
+        return self._signature(db, window)
+
+    def get_multi_keyset(
+        self,
+        db: Session,
+        *,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        estados: Optional[List[ContactStatus]] = None,
+        search: Optional[str] = None,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = "asc",
+        fields: Optional[Sequence[str]] = None,
+    ) -> tuple[List[Contact], Optional[str], Optional[str]]:
+        """Page through contacts by seeking on ``(sort column, id)``.
+
+        Returns the page together with the cursors for the next and previous
+        pages (``None`` at either end).
+        """
+        plan = self._keyset_plan(
+            cursor=cursor,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            limit=limit,
+            estados=estados,
+            search=search,
+        )
+        rows = (
+            self._filtered_query(db, estados=estados, search=search)
+            .filter(*plan.criteria)
+            .options(*self._keyset_options(plan, fields))
+            .order_by(*plan.order_by)
+            .limit(limit + 1)
+            .all()
+        )
+        return self._keyset_page(rows, plan, limit)
+
+    def _bulk_apply(
+        self,
+        db: Session,
+        *,
+        ids: Optional[List[UUID]],
+        estados: Optional[List[ContactStatus]],
+        search: Optional[str],
+        values: Dict[str, Any],
+    ) -> int:
+        """Apply ``values`` to the selected contacts in set-based chunks.
+
+        Each chunk is a single ``UPDATE ... WHERE id IN (next ids) RETURNING id``
+        committed on its own, walking the selection in id order so the chunks
+        never overlap and locks are held for one chunk only.
+        """
+        criteria = self._filter_criteria(estados=estados, search=search)
+        if ids:
+            criteria.append(Contact.id.in_(ids))
+
+        affected = 0
+        last_id = None
+        while True:
+            chunk = select(Contact.id).where(*criteria)
+            if last_id is not None:
+                chunk = chunk.where(Contact.id > last_id)
+            chunk = chunk.order_by(Contact.id).limit(settings.BULK_CHUNK_SIZE)
+            stmt = (
+                update(Contact)
+                .where(Contact.id.in_(chunk.scalar_subquery()))
+                .values(**values, updated_at=utcnow())
+                .returning(Contact.id)
+                .execution_options(synchronize_session=False)
             )
-            query = query.filter(search_filter)
+            changed = db.execute(stmt).scalars().all()
+            db.commit()
+            if not changed:
+                break
+            invalidate_table(Contact.__tablename__)
+            affected += len(changed)
+            last_id = max(changed)
+            if len(changed) < settings.BULK_CHUNK_SIZE:
+                break
+        return affected
 
-        # Apply sorting
-        if sort_field and hasattr(Contact, sort_field):
-            sort_column = getattr(Contact, sort_field)
-            if sort_order == "desc":
-                query = query.order_by(desc(sort_column))
-            else:
-                query = query.order_by(asc(sort_column))
+    def bulk_update(
+        self,
+        db: Session,
+        *,
+        obj_in: ContactUpdate,
+        ids: Optional[List[UUID]] = None,
+        estados: Optional[List[ContactStatus]] = None,
+        search: Optional[str] = None,
+    ) -> int:
+        values: Dict[str, Any] = obj_in.model_dump(exclude_unset=True)
+        if "nombres" in values or "apellidos" in values:
+            # Same rule as a single update, evaluated per row by Postgres
+            nombres = (
+                literal(values["nombres"]) if "nombres" in values else Contact.nombres
+            )
+            apellidos = (
+                literal(values["apellidos"])
+                if "apellidos" in values
+                else Contact.apellidos
+            )
+            values["nombre_completo"] = nombres + " " + apellidos
+        return self._bulk_apply(
+            db, ids=ids, estados=estados, search=search, values=values
+        )
+
+    def bulk_remove(
+        self,
+        db: Session,
+        *,
+        ids: Optional[List[UUID]] = None,
+        estados: Optional[List[ContactStatus]] = None,
+        search: Optional[str] = None,
+    ) -> int:
+        # Soft delete instead of hard delete
+        return self._bulk_apply(
+            db, ids=ids, estados=estados, search=search, values={"is_deleted": True}
+        )
+
+
+class AsyncCRUDContact(
+    ContactQueries, AsyncCRUDBase[Contact, ContactCreate, ContactUpdate]
+):
+    async def count_filtered(
+        self,
+        db: AsyncSession,
+        *,
+        estados: Optional[List[ContactStatus]] = None,
+        search: Optional[str] = None,
+    ) -> CountResult:
+        return await async_count_statement(
+            db,
+            select(Contact).where(
+                *self._filter_criteria(estados=estados, search=search)
+            ),
+            table=Contact.__tablename__,
+            key=self._filter_key(estados=estados, search=search),
+        )
+
+    async def get_multi_filtered(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        estados: Optional[List[ContactStatus]] = None,
+        search: Optional[str] = None,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = "asc",
+        total: Optional[CountResult] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> tuple[List[Contact], CountResult]:
+        page_args = dict(
+            skip=skip,
+            limit=limit,
+            estados=estados,
+            search=search,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            fields=fields,
+        )
+        if result_cache.enabled:
+            items, total, _ = await self.get_cached_page(db, total=total, **page_args)
+            return items, total
+
+        if total is None:
+            total = await self.count_filtered(db, estados=estados, search=search)
+        return self._page_items(await db.execute(self._page_stmt(**page_args))), total
+
+    async def get_cached_page(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        estados: Optional[List[ContactStatus]] = None,
+        search: Optional[str] = None,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = "asc",
+        total: Optional[CountResult] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> tuple[list, CountResult, str]:
+        page_key = self._page_key(
+            skip=skip,
+            limit=limit,
+            estados=estados,
+            search=search,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            fields=fields,
+        )
+        if result_cache.local:
+            cached, slot = result_cache.lookup(Contact.__tablename__, page_key)
         else:
-            # Default sort by apellidos
-            query = query.order_by(asc(Contact.apellidos))
+            cached, slot = await asyncio.to_thread(
+                result_cache.lookup, Contact.__tablename__, page_key
+            )
+        if cached is not None:
+            return self._cached_page(cached, fields)
 
-        total = query.count()
-        items = query.offset(skip).limit(limit).all()
-        return items, total
+        if total is None:
+            total = await self.count_filtered(db, estados=estados, search=search)
+        stmt = self._page_stmt(
+            skip=skip,
+            limit=limit,
+            estados=estados,
+            search=search,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            fields=fields,
+        )
+        items, payload = self._page_to_cache(
+            self._page_items(await db.execute(stmt)), total, fields
+        )
+        if reads_replica(db):
+            return items, total, _payload_digest(payload)
+        if result_cache.local:
+            result_cache.store(slot, payload)
+        else:
+            await asyncio.to_thread(result_cache.store, slot, payload)
+        return items, total, _payload_digest(payload)
+
+    async def get_multi_keyset(
+        self,
+        db: AsyncSession,
+        *,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        estados: Optional[List[ContactStatus]] = None,
+        search: Optional[str] = None,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = "asc",
+        fields: Optional[Sequence[str]] = None,
+    ) -> tuple[List[Contact], Optional[str], Optional[str]]:
+        plan = self._keyset_plan(
+            cursor=cursor,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            limit=limit,
+            estados=estados,
+            search=search,
+        )
+        stmt = (
+            select(Contact)
+            .where(*self._filter_criteria(estados=estados, search=search))
+            .where(*plan.criteria)
+            .options(*self._keyset_options(plan, fields))
+            .order_by(*plan.order_by)
+            .limit(limit + 1)
+        )
+        rows = (await db.execute(stmt)).scalars().all()
+        return self._keyset_page(rows, plan, limit)
+
+    async def page_signature(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        estados: Optional[List[ContactStatus]] = None,
+        search: Optional[str] = None,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = "asc",
+    ) -> WindowSignature:
+        window = self._offset_window(
+            skip=skip,
+            limit=limit,
+            estados=estados,
+            search=search,
+            sort_field=sort_field,
+            sort_order=sort_order,
+        )
+        return await self._signature(db, window)
+
+    async def keyset_signature(
+        self,
+        db: AsyncSession,
+        *,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        estados: Optional[List[ContactStatus]] = None,
+        search: Optional[str] = None,
+        sort_field: Optional[str] = None,
+        sort_order: Optional[str] = "asc",
+    ) -> WindowSignature:
+        plan = self._keyset_plan(
+            cursor=cursor,
+            sort_field=sort_field,
+            sort_order=sort_order,
+            limit=limit,
+            estados=estados,
+            search=search,
+        )
+        window = self._keyset_window(plan, limit=limit, estados=estados, search=search)
+        return await self._signature(db, window)
 
 
 contact = CRUDContact(Contact)
+async_contact = AsyncCRUDContact(Contact)
@@ -0,0 +1,177 @@
+import csv
+import enum
+import io
+import json
+from datetime import datetime
+from typing import Any, Callable, Iterator, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.crud.contact import contact as crud_contact
+from app.database import SessionLocal
+from app.models.contact import Contact, ContactStatus
+from app.schemas.contact import Contact as ContactSchema
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+# Same keys as the API's contact JSON (e.g. "nombreCompleto", "createdAt")
+EXPORT_FIELDS = [
+    (name, field.alias or name) for name, field in ContactSchema.model_fields.items()
+]
+_COLUMNS = [getattr(Contact, name) for name, _ in EXPORT_FIELDS]
+_KEYS = [key for _, key in EXPORT_FIELDS]
+
+
+class ExportUnavailable(Exception):
+    """The requested export format needs an optional dependency."""
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def export_batches(
+    *,
+    session_factory: Callable[[], Session] = SessionLocal,
+    estados: Optional[List[ContactStatus]] = None,
+    search: Optional[str] = None,
+    sort_field: Optional[str] = None,
+    sort_order: Optional[str] = "asc",
+) -> Iterator[Sequence[Sequence[Any]]]:
+    """Rows matching the listing filters, fetched ``EXPORT_BATCH_SIZE`` at a time.
+
+    The rows come from a server-side cursor, so only one batch is held in memory.
+    The session is opened here from ``session_factory`` (the route's, see
+    ``deps.get_session_factory``) rather than taken from ``get_db``: the
+    response is streamed after the request's dependencies have been torn down.
+    """
+    db = session_factory()
+    try:
+        stmt = (
+            select(*_COLUMNS)
+            .where(*crud_contact._filter_criteria(estados=estados, search=search))
+            .order_by(
+                *crud_contact._order_by(
+                    sort_field=sort_field, sort_order=sort_order, search=search
+                )
+            )
+            .execution_options(yield_per=settings.EXPORT_BATCH_SIZE)
+        )
+        for batch in db.execute(stmt).partitions():
+            yield batch
+    finally:
+        db.close()
+
+
+def iter_csv(batches: Iterator[Sequence[Sequence[Any]]]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(_KEYS)
+    for batch in batches:
+        writer.writerows([_plain(value) for value in row] for row in batch)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+
+def iter_ndjson(batches: Iterator[Sequence[Sequence[Any]]]) -> Iterator[str]:
+    for batch in batches:
+        yield "".join(
+            json.dumps(dict(zip(_KEYS, map(_plain, row))), ensure_ascii=False) + "\n"
+            for row in batch
+        )
+
+
+class _Drain(io.RawIOBase):
+    """Write-only sink whose contents are handed out (and dropped) on demand."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def take(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _parquet_value(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def iter_parquet(batches: Iterator[Sequence[Sequence[Any]]]) -> Iterator[bytes]:
+    """One Parquet row group per batch, written out as soon as it is complete."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ExportUnavailable("Parquet export requires the pyarrow package")
+
+    timestamp_fields = {"created_at", "updated_at"}
+    schema = pa.schema(
+        [
+            (key, pa.timestamp("us") if name in timestamp_fields else pa.string())
+            for name, key in EXPORT_FIELDS
+        ]
+    )
+
+    def generate() -> Iterator[bytes]:
+        sink = _Drain()
+        with pq.ParquetWriter(sink, schema) as writer:
+            for batch in batches:
+                columns = zip(
+                    *[[_parquet_value(value) for value in row] for row in batch]
+                )
+                writer.write_table(
+                    pa.Table.from_arrays(
+                        [list(column) for column in columns], schema=schema
+                    )
+                )
+                yield sink.take()
+        yield sink.take()
+
+    return generate()
+
+
+def stream_export(
+    fmt: str, session_factory: Callable[[], Session] = SessionLocal, **filters: Any
+) -> Iterator:
+    """Serialized chunks of the contacts export in ``fmt`` (see ``EXPORT_FORMATS``)."""
+    if filters.get("sort_field"):
+        # Checked up front: the batches only start once the response is sent
+        crud_contact.check_sort(filters["sort_field"])
+    batches = export_batches(session_factory=session_factory, **filters)
+    if fmt == "parquet":
+        return iter_parquet(batches)
+    if fmt == "ndjson":
+        return iter_ndjson(batches)
+    return iter_csv(batches)
@@ -0,0 +1,196 @@
+import csv
+import io
+import json
+import uuid
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.crud.base import invalidate_table
+from app.models.contact import Contact
+from app.schemas.contact import (
+    ContactImport,
+    ContactImportError,
+    ContactImportReport,
+)
+
+IMPORT_COLUMNS = (
+    "nombres",
+    "apellidos",
+    "nombre_completo",
+    "email",
+    "telefono",
+    "estado",
+    "cedula",
+    "ciudad",
+    "pais",
+    "notas",
+)
+
+STAGING_TABLE = "contact_import_staging"
+
+_COLUMNS_SQL = ", ".join(IMPORT_COLUMNS)
+_STAGING_COLUMNS_SQL = ", ".join(f"{column} text" for column in IMPORT_COLUMNS)
+_SELECT_COLUMNS_SQL = _COLUMNS_SQL.replace("estado", "estado::contactstatus")
+_UPDATE_COLUMNS_SQL = ", ".join(
+    f"{column} = EXCLUDED.{column}" for column in IMPORT_COLUMNS if column != "email"
+)
+
+# Session-local and emptied on every commit, so each chunk starts clean
+_CREATE_STAGING_SQL = f"""
+CREATE TEMP TABLE IF NOT EXISTS {STAGING_TABLE} (
+    line integer NOT NULL,
+    id uuid NOT NULL,
+    {_STAGING_COLUMNS_SQL}
+) ON COMMIT DELETE ROWS
+"""
+
+_COPY_SQL = f"COPY {STAGING_TABLE} (line, id, {_COLUMNS_SQL}) FROM STDIN"
+
+# Emails are unique within a chunk (see ContactImporter.run: ON CONFLICT
+# cannot touch a row twice per statement); soft-deleted matches are brought back
+_MERGE_SQL = f"""
+INSERT INTO contacts (id, created_at, updated_at, is_deleted, {_COLUMNS_SQL})
+SELECT
+    id, timezone('utc', now()), timezone('utc', now()), false, {_SELECT_COLUMNS_SQL}
+FROM {STAGING_TABLE}
+ON CONFLICT (email) DO UPDATE SET
+    {_UPDATE_COLUMNS_SQL},
+    is_deleted = false,
+    updated_at = EXCLUDED.updated_at
+RETURNING (xmax = 0) AS created
+"""
+
+
+def _copy_value(value: Any) -> str:
+    """Render a value in COPY's text format."""
+    if value is None:
+        return "\\N"
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def _describe(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc']) or 'row'}: {error['msg']}"
+        for error in exc.errors()
+    )
+
+
+def iter_csv(stream: BinaryIO) -> Iterator[Tuple[int, Any]]:
+    """``(line, record)`` pairs of a CSV file with a header row."""
+    reader = csv.DictReader(io.TextIOWrapper(stream, encoding="utf-8-sig", newline=""))
+    for record in reader:
+        # Extra cells land under the None key; blank cells mean "not provided"
+        yield reader.line_num, {
+            key: value
+            for key, value in record.items()
+            if key is not None and value not in (None, "")
+        }
+
+
+def iter_ndjson(stream: BinaryIO) -> Iterator[Tuple[int, Any]]:
+    """``(line, record)`` pairs of a newline-delimited JSON file."""
+    for line, raw in enumerate(io.TextIOWrapper(stream, encoding="utf-8"), start=1):
+        if not raw.strip():
+            continue
+        try:
+            yield line, json.loads(raw)
+        except json.JSONDecodeError as exc:
+            yield line, exc
+
+
+class ContactImporter:
+    """Load contacts in bulk: validate in chunks, COPY to staging, upsert by email.
+
+    Every chunk of ``IMPORT_CHUNK_SIZE`` valid rows is committed on its own, so
+    memory stays flat for any file size and an interrupted import keeps the
+    chunks already merged (re-running it is safe: rows are upserted by email).
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.report = ContactImportReport()
+
+    def _fail(self, line: int, detail: str) -> None:
+        self.report.failed += 1
+        if len(self.report.errors) < settings.IMPORT_MAX_ERRORS:
+            self.report.errors.append(ContactImportError(line=line, detail=detail))
+        else:
+            self.report.errors_truncated = True
+
+    def _validate(self, line: int, record: Any) -> Optional[Dict[str, Any]]:
+        if isinstance(record, Exception):
+            self._fail(line, f"JSON inválido: {record}")
+            return None
+        if not isinstance(record, dict):
+            self._fail(line, "Se esperaba un objeto")
+            return None
+        try:
+            row = ContactImport.model_validate(record)
+        except ValidationError as exc:
+            self._fail(line, _describe(exc))
+            return None
+        data = row.model_dump()
+        if not data["nombre_completo"]:
+            data["nombre_completo"] = f"{row.nombres} {row.apellidos}"
+        # The contactstatus enum stores member names
+        data["estado"] = row.estado.name
+        return data
+
+    def _flush(self, chunk: Dict[str, Tuple[int, Dict[str, Any]]]) -> None:
+        buffer = io.StringIO()
+        for line, data in chunk.values():
+            values = [line, uuid.uuid4()] + [data[column] for column in IMPORT_COLUMNS]
+            buffer.write("\t".join(_copy_value(value) for value in values))
+            buffer.write("\n")
+        buffer.seek(0)
+
+        self.db.execute(text(_CREATE_STAGING_SQL))
+        cursor = self.db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(_COPY_SQL, buffer)
+        finally:
+            cursor.close()
+        created = self.db.execute(text(_MERGE_SQL)).scalars().all()
+        self.db.commit()
+        invalidate_table(Contact.__tablename__)
+
+        self.report.created += sum(created)
+        self.report.updated += len(created) - sum(created)
+
+    def run(self, records: Iterator[Tuple[int, Any]]) -> ContactImportReport:
+        # Keyed by email: a later row with the same email replaces the earlier
+        # one, which is reported as failed so every processed row is accounted for
+        chunk: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        for line, record in records:
+            self.report.processed += 1
+            data = self._validate(line, record)
+            if data is None:
+                continue
+            replaced = chunk.get(data["email"])
+            if replaced is not None:
+                self._fail(
+                    replaced[0], f"Reemplazada por la línea {line} (mismo email)"
+                )
+            chunk[data["email"]] = (line, data)
+            if len(chunk) >= settings.IMPORT_CHUNK_SIZE:
+                self._flush(chunk)
+                chunk = {}
+        if chunk:
+            self._flush(chunk)
+        return self.report
+
+
+def import_contacts(db: Session, stream: BinaryIO, *, fmt: str) -> ContactImportReport:
+    """Import a ``csv`` or ``ndjson`` byte stream into ``contacts``."""
+    records = iter_ndjson(stream) if fmt == "ndjson" else iter_csv(stream)
+    return ContactImporter(db).run(records)
@@ -0,0 +1,188 @@
+import io
+import random
+import unicodedata
+import uuid
+from datetime import datetime, timedelta
+from functools import lru_cache
+from multiprocessing import Pool
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from faker import Faker
+
+from app.crud.base import invalidate_table
+from app.crud.contact_import import IMPORT_COLUMNS, _copy_value
+from app.database import engine
+from app.models.contact import Contact, ContactStatus
+
+# Rows are generated in fixed blocks, each from its own RNG, so a block's
+# content depends only on the seed and its position: the same seed yields the
+# same contacts whatever the number of workers
+BLOCK_SIZE = 10_000
+
+DEFAULT_ESTADOS: Dict[str, float] = {
+    ContactStatus.PROSPECTO.value: 45,
+    ContactStatus.CALIFICADO.value: 25,
+    ContactStatus.CLIENTE.value: 20,
+    ContactStatus.INACTIVO.value: 10,
+}
+# An empty key stands for contacts without a city
+DEFAULT_CIUDADES: Dict[str, float] = {
+    "Bogotá": 30,
+    "Medellín": 15,
+    "Cali": 12,
+    "Barranquilla": 8,
+    "Cartagena": 5,
+    "Bucaramanga": 5,
+    "Pereira": 4,
+    "Manizales": 3,
+    "Santa Marta": 3,
+    "Cúcuta": 3,
+    "Ibagué": 3,
+    "Villavicencio": 3,
+    "": 6,
+}
+
+_COPY_SQL = (
+    f"COPY {Contact.__tablename__} "
+    f"(id, created_at, updated_at, is_deleted, {', '.join(IMPORT_COLUMNS)}) FROM STDIN"
+)
+
+
+class SeedConfig(NamedTuple):
+    seed: int
+    estados: Dict[str, float]
+    ciudades: Dict[str, float]
+    until: datetime
+    days: int = 730
+    notas_ratio: float = 0.3
+    email_domain: str = "seed.example.com"
+    # Shifts the row numbers (and so the emails) to append to an earlier run
+    start: int = 0
+
+
+class _Pools(NamedTuple):
+    nombres: List[str]
+    apellidos: List[str]
+    notas: List[str]
+
+
+def _slug(value: str) -> str:
+    folded = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode()
+    return "".join(char for char in folded.lower() if char.isalnum())
+
+
+@lru_cache(maxsize=8)
+def _pools(seed: int) -> _Pools:
+    # Faker is far too slow to call per row at this scale; draw from pools
+    # built once per process instead (sorted, as set order is not stable)
+    fake = Faker("es_CO")
+    fake.seed_instance(seed)
+    return _Pools(
+        nombres=sorted({fake.first_name() for _ in range(1000)}),
+        apellidos=sorted({fake.last_name() for _ in range(1000)}),
+        notas=[fake.sentence(nb_words=14) for _ in range(500)],
+    )
+
+
+def _weights(distribution: Dict[str, float]) -> Tuple[List[str], List[float]]:
+    keys = sorted(distribution)
+    return keys, [distribution[key] for key in keys]
+
+
+def generate_block(config: SeedConfig, block: int, count: int) -> Iterator[tuple]:
+    """Rows of block ``block`` in ``COPY`` column order, cut off at ``count``.
+
+    Row ``n`` gets the email ``<nombre>.<apellido>.<n>@<email_domain>``, so
+    emails are unique by construction within and across blocks.
+    """
+    pools = _pools(config.seed)
+    rng = random.Random(f"{config.seed}:{config.start}:{block}")
+    estados, estado_weights = _weights(config.estados)
+    ciudades, ciudad_weights = _weights(config.ciudades)
+    members = {status.value: status.name for status in ContactStatus}
+    window = config.days * 86400
+
+    first = block * BLOCK_SIZE
+    for number in range(first, min(first + BLOCK_SIZE, count)):
+        nombres = rng.choice(pools.nombres)
+        apellidos = f"{rng.choice(pools.apellidos)} {rng.choice(pools.apellidos)}"
+        created_at = config.until - timedelta(seconds=rng.randrange(window))
+        updated_at = created_at + timedelta(seconds=rng.randrange(window // 10 + 1))
+        row_number = config.start + number
+        yield (
+            uuid.UUID(int=rng.getrandbits(128), version=4),
+            created_at,
+            min(updated_at, config.until),
+            False,
+            nombres,
+            apellidos,
+            f"{nombres} {apellidos}",
+            f"{_slug(nombres)}.{_slug(apellidos.split()[0])}.{row_number}"
+            f"@{config.email_domain}",
+            f"3{rng.randrange(10**9):09d}",
+            # The contactstatus enum stores member names
+            members[rng.choices(estados, estado_weights)[0]],
+            str(rng.randrange(10**7, 10**10)),
+            rng.choices(ciudades, ciudad_weights)[0] or None,
+            "Colombia",
+            rng.choice(pools.notas) if rng.random() < config.notas_ratio else None,
+        )
+
+
+def load_block(args: Tuple[SeedConfig, int, int]) -> int:
+    """Generate one block and ``COPY`` it into ``contacts`` on its own transaction."""
+    config, block, count = args
+    buffer = io.StringIO()
+    rows = 0
+    for row in generate_block(config, block, count):
+        buffer.write("\t".join(_copy_value(value) for value in row))
+        buffer.write("\n")
+        rows += 1
+    buffer.seek(0)
+
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        try:
+            cursor.copy_expert(_COPY_SQL, buffer)
+        finally:
+            cursor.close()
+        connection.commit()
+    finally:
+        connection.close()
+    return rows
+
+
+def _init_worker() -> None:
+    # Connections inherited through fork belong to the parent
+    engine.dispose(close=False)
+
+
+def seed_contacts(
+    config: SeedConfig,
+    count: int,
+    *,
+    workers: int = 1,
+    progress: Optional[Callable[[int], None]] = None,
+) -> int:
+    """Insert ``count`` generated contacts, ``BLOCK_SIZE`` rows per ``COPY``.
+
+    Blocks are loaded by ``workers`` processes in parallel and committed one by
+    one; ``progress`` is called with the running total after each block.
+    """
+    tasks = [(config, block, count) for block in range(-(-count // BLOCK_SIZE))]
+    pool = Pool(workers, initializer=_init_worker) if workers > 1 else None
+    loaded = 0
+    try:
+        results = (
+            pool.imap_unordered(load_block, tasks) if pool else map(load_block, tasks)
+        )
+        for rows in results:
+            loaded += rows
+            if progress:
+                progress(loaded)
+    finally:
+        if pool:
+            pool.terminate()
+        invalidate_table(Contact.__tablename__)
+    return loaded
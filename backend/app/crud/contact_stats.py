@@ -0,0 +1,148 @@
+import asyncio
+import logging
+from datetime import date, timedelta
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.base import utcnow
+from app.models.contact import ContactStatus
+from app.schemas.contact import ContactStats
+
+logger = logging.getLogger(__name__)
+
+# pg_advisory lock key that keeps reconcile runs (workers and CLI) one at a time
+RECONCILE_LOCK_KEY = 72_015
+
+# Shards are summed per key; cities and countries are cut to the ``top``
+# largest, days start at ``since``
+_STATS_SQL = text("""
+    SELECT dimension, key, count FROM (
+        SELECT dimension, key, count, row_number() OVER (
+            PARTITION BY dimension ORDER BY count DESC, key
+        ) AS rank
+        FROM (
+            SELECT dimension, key, sum(count)::bigint AS count
+            FROM contact_stats
+            WHERE dimension <> 'created_day' OR key >= :since
+            GROUP BY dimension, key
+        ) AS summed
+        WHERE count > 0
+    ) AS ranked
+    WHERE dimension NOT IN ('ciudad', 'pais') OR rank <= :top
+    ORDER BY dimension, rank
+    """)
+
+# Recount from contacts and add the difference to each key that drifted. The
+# recount and the stored sums come from the statement's single snapshot, where
+# both reflect the same committed writes; writes committed since then moved
+# both alike, so adding the difference to the current value (ON CONFLICT sees
+# the latest row) is right without holding writers off during the scan
+_RECONCILE_SQL = text("""
+    WITH actual AS (
+        SELECT k.dimension, k.key, count(*) AS count
+        FROM contacts r,
+            contact_stats_keys(r.estado::text, r.ciudad, r.pais, r.created_at) k
+        WHERE NOT r.is_deleted
+        GROUP BY k.dimension, k.key
+    ), stored AS (
+        SELECT dimension, key, sum(count) AS count
+        FROM contact_stats
+        GROUP BY dimension, key
+    )
+    INSERT INTO contact_stats AS s (dimension, key, shard, count)
+    SELECT
+        coalesce(a.dimension, t.dimension),
+        coalesce(a.key, t.key),
+        0,
+        coalesce(a.count, 0) - coalesce(t.count, 0)
+    FROM actual a
+    FULL JOIN stored t ON t.dimension = a.dimension AND t.key = a.key
+    WHERE coalesce(a.count, 0) <> coalesce(t.count, 0)
+    ORDER BY 1, 2
+    ON CONFLICT (dimension, key, shard) DO UPDATE SET count = s.count + EXCLUDED.count
+    RETURNING 1
+    """)
+
+
+def _since(days: int) -> str:
+    return (utcnow().date() - timedelta(days=days - 1)).isoformat()
+
+
+def _build_stats(rows: Iterable[Any]) -> ContactStats:
+    stats = ContactStats(
+        total=0,
+        by_estado={status: 0 for status in ContactStatus},
+        by_ciudad={},
+        by_pais={},
+        created_per_day={},
+    )
+    for dimension, key, count in rows:
+        if dimension == "total":
+            stats.total = count
+        elif dimension == "estado":
+            # The contactstatus enum stores member names
+            stats.by_estado[ContactStatus[key]] = count
+        elif dimension == "ciudad":
+            stats.by_ciudad[key] = count
+        elif dimension == "pais":
+            stats.by_pais[key] = count
+        elif dimension == "created_day":
+            stats.created_per_day[date.fromisoformat(key)] = count
+    return stats
+
+
+def get_stats(db: Session, *, days: int = 30, top: int = 20) -> ContactStats:
+    """Contact counts from ``contact_stats``: cost independent of the contacts table."""
+    rows = db.execute(_STATS_SQL, {"since": _since(days), "top": top})
+    return _build_stats(rows)
+
+
+async def get_stats_async(
+    db: AsyncSession, *, days: int = 30, top: int = 20
+) -> ContactStats:
+    rows = await db.execute(_STATS_SQL, {"since": _since(days), "top": top})
+    return _build_stats(rows)
+
+
+def reconcile_stats(db: Session) -> Optional[int]:
+    """Fix the stats keys that drifted from ``contacts``; returns how many changed.
+
+    Returns None without doing anything while another run holds the advisory
+    lock. Contact writes are not blocked by the recount (a full scan): only the
+    corrected rows stay locked, from the correction to the commit right after.
+    """
+    locked = db.execute(
+        text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": RECONCILE_LOCK_KEY}
+    ).scalar()
+    if not locked:
+        db.rollback()
+        return None
+    corrected = len(db.execute(_RECONCILE_SQL).all())
+    db.execute(text("DELETE FROM contact_stats WHERE count = 0"))
+    db.commit()
+    return corrected
+
+
+def _reconcile_once() -> Optional[int]:
+    db = SessionLocal()
+    try:
+        return reconcile_stats(db)
+    finally:
+        db.close()
+
+
+async def reconcile_periodically(interval: int) -> None:
+    """Run ``reconcile_stats`` every ``interval`` seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            corrected = await asyncio.to_thread(_reconcile_once)
+        except Exception:
+            logger.exception("Contact stats reconcile failed")
+            continue
+        if corrected:
+            logger.warning(f"Contact stats: corrected {corrected} drifted counts")
@@ -0,0 +1,139 @@
+import json
+import threading
+from typing import Dict, Hashable, NamedTuple, Optional, Union
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.replicas import reads_replica
+
+
+class CountResult(NamedTuple):
+    total: int
+    exact: bool
+
+
+class Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON)`` wrapper so planner estimates keep bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+count_cache = TTLCache(
+    maxsize=settings.COUNT_CACHE_MAX_ENTRIES, ttl=settings.COUNT_CACHE_TTL_SECONDS
+)
+
+# Bumped on every write to a table; cached counts are keyed by generation so a
+# write makes every earlier entry for that table unreachable at once.
+_generations: Dict[str, int] = {}
+_generations_lock = threading.Lock()
+
+
+def invalidate_counts(table: str) -> None:
+    with _generations_lock:
+        _generations[table] = _generations.get(table, 0) + 1
+
+
+def _cache_key(table: str, key: Hashable) -> tuple:
+    return (table, _generations.get(table, 0), key)
+
+
+def _plan_rows(plan: Union[list, str]) -> int:
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def count_statement(stmt: Select) -> Select:
+    return select(func.count()).select_from(stmt.order_by(None).subquery())
+
+
+def exact_count(query: Query) -> CountResult:
+    return CountResult(query.order_by(None).count(), True)
+
+
+def estimated_count(db: Session, query: Query) -> CountResult:
+    """Row estimate from the planner, falling back to COUNT(*) for small results.
+
+    The estimate comes from ``pg_class.reltuples`` and column statistics, so it
+    is only as fresh as the last ANALYZE; below ``COUNT_ESTIMATE_MIN_ROWS`` an
+    exact count is cheap enough and far more useful for pagination.
+    """
+    plan = db.execute(Explain(query.order_by(None).statement)).scalar()
+    estimate = _plan_rows(plan)
+    if estimate < settings.COUNT_ESTIMATE_MIN_ROWS:
+        return exact_count(query)
+    return CountResult(estimate, False)
+
+
+def cached_count(query: Query, *, table: str, key: Hashable) -> CountResult:
+    cache_key = _cache_key(table, key)
+    total = count_cache.get(cache_key)
+    if total is not None:
+        return CountResult(total, False)
+    result = exact_count(query)
+    # Not from a replica: the count could miss writes its generation includes
+    if not reads_replica(query.session):
+        count_cache.set(cache_key, result.total)
+    return result
+
+
+def count_query(
+    db: Session,
+    query: Query,
+    *,
+    table: str,
+    key: Hashable = (),
+    strategy: Optional[str] = None,
+) -> CountResult:
+    """Count the rows matched by ``query`` using the configured strategy.
+
+    ``key`` must identify the filters applied to ``query`` (but not its sorting
+    or paging) so cached totals are shared between pages of the same listing.
+    """
+    strategy = strategy or settings.COUNT_STRATEGY
+    if strategy == "estimated":
+        return estimated_count(db, query)
+    if strategy == "cached":
+        return cached_count(query, table=table, key=key)
+    return exact_count(query)
+
+
+async def async_count_statement(
+    db: AsyncSession,
+    stmt: Select,
+    *,
+    table: str,
+    key: Hashable = (),
+    strategy: Optional[str] = None,
+) -> CountResult:
+    """``count_query`` for an ``AsyncSession`` and a 2.0-style ``select()``."""
+    strategy = strategy or settings.COUNT_STRATEGY
+    if strategy == "cached":
+        cache_key = _cache_key(table, key)
+        total = count_cache.get(cache_key)
+        if total is not None:
+            return CountResult(total, False)
+    elif strategy == "estimated":
+        plan = (await db.execute(Explain(stmt.order_by(None)))).scalar()
+        estimate = _plan_rows(plan)
+        if estimate >= settings.COUNT_ESTIMATE_MIN_ROWS:
+            return CountResult(estimate, False)
+
+    total = (await db.execute(count_statement(stmt))).scalar_one()
+    if strategy == "cached" and not reads_replica(db):
+        count_cache.set(cache_key, total)
+    return CountResult(total, True)
@@ -1,47 +1,86 @@
-from typing import Optional
-from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+from datetime import timedelta
 import secrets
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.crud.base import CRUDBase
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.hashing import hash_pool
+from app.crud.base import AsyncCRUDBase, CRUDBase
+from app.models.base import utcnow
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
-from app.core.security import get_password_hash, verify_password
+from app.core.security import (
+    get_password_hash,
+    verify_and_update_password,
+    verify_password,
+)
 
+# Authenticated principals (schemas.User snapshots) keyed by str(user id)
+principal_cache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
 
-class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
+
+class UserRules:
+    """Behaviour shared by the sync and async user CRUD."""
+
+    derived_fields = {"nombre_completo": ("nombres", "apellidos")}
+
+    def _after_write(self, db_obj: User) -> None:
+        super()._after_write(db_obj)
+        principal_cache.pop(str(db_obj.id))
+
+    def is_active(self, user: User) -> bool:
+        return user.is_active
+
+    def is_superuser(self, user: User) -> bool:
+        return user.is_superuser
+
+    @staticmethod
+    def _user_values(obj_in: UserCreate, hashed_password: str) -> Dict[str, Any]:
+        return {
+            "email": obj_in.email,
+            "hashed_password": hashed_password,
+            "nombres": obj_in.nombres,
+            "apellidos": obj_in.apellidos,
+            "is_active": obj_in.is_active,
+            "is_superuser": obj_in.is_superuser,
+        }
+
+    @staticmethod
+    def _reset_token_valid(user: Optional[User]) -> bool:
+        if not user or not user.reset_token_expires:
+            return False
+        return utcnow() <= user.reset_token_expires
+
+
+class CRUDUser(UserRules, CRUDBase[User, UserCreate, UserUpdate]):
     def get_by_email(self, db: Session, *, email: str) -> Optional[User]:
         return (
             db.query(User).filter(User.email == email, User.is_deleted == False).first()
         )
 
     def create(self, db: Session, *, obj_in: UserCreate) -> User:
-        db_obj = User(
-            email=obj_in.email,
-            hashed_password=get_password_hash(obj_in.password),
-            nombres=obj_in.nombres,
-            apellidos=obj_in.apellidos,
-            is_active=obj_in.is_active,
-            is_superuser=obj_in.is_superuser,
-        )
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
-        return db_obj
+        hashed_password = hash_pool.run(get_password_hash, obj_in.password)
+        return self._insert(db, self._user_values(obj_in, hashed_password))
 
     def authenticate(self, db: Session, *, email: str, password: str) -> Optional[User]:
         user = self.get_by_email(db, email=email)
         if not user:
             return None
-        if not verify_password(password, user.hashed_password):
+        valid, new_hash = hash_pool.run(
+            verify_and_update_password, password, user.hashed_password
+        )
+        if not valid:
             return None
+        if new_hash:
+            # Stored with an outdated bcrypt cost; upgrade it while we have the password
+            user = self._update_values(db, user, {"hashed_password": new_hash})
         return user
 
-    def is_active(self, user: User) -> bool:
-        return user.is_active
-
-    def is_superuser(self, user: User) -> bool:
-        return user.is_superuser
-
     def create_password_reset_token(self, db: Session, *, email: str) -> Optional[str]:
         user = self.get_by_email(db, email=email)
         if not user:
@@ -49,7 +88,7 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
 
         token = secrets.token_urlsafe(32)
         user.reset_token = token
-        user.reset_token_expires = datetime.now(timezone.utc) + timedelta(hours=1)
+        user.reset_token_expires = utcnow() + timedelta(hours=1)
         db.add(user)
         db.commit()
         return token
@@ -61,34 +100,113 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
             .first()
         )
 
-        if not user or not user.reset_token_expires:
-            return None
-
-        if datetime.now(timezone.utc) > user.reset_token_expires:
+        if not self._reset_token_valid(user):
             return None
 
         return user
 
     def reset_password(self, db: Session, *, user: User, new_password: str) -> User:
-        user.hashed_password = get_password_hash(new_password)
-        user.reset_token = None
-        user.reset_token_expires = None
-        db.add(user)
-        db.commit()
-        db.refresh(user)
-        return user
+        values = {
+            "hashed_password": hash_pool.run(get_password_hash, new_password),
+            "reset_token": None,
+            "reset_token_expires": None,
+        }
+        return self._update_values(db, user, values)
 
     def change_password(
         self, db: Session, *, user: User, current_password: str, new_password: str
     ) -> Optional[User]:
-        if not verify_password(current_password, user.hashed_password):
+        if not hash_pool.run(verify_password, current_password, user.hashed_password):
             return None
 
-        user.hashed_password = get_password_hash(new_password)
+        values = {"hashed_password": hash_pool.run(get_password_hash, new_password)}
+        return self._update_values(db, user, values)
+
+
+class AsyncCRUDUser(UserRules, AsyncCRUDBase[User, UserCreate, UserUpdate]):
+    """``CRUDUser`` for an ``AsyncSession``; bcrypt is awaited on the hash pool."""
+
+    async def get_by_email(self, db: AsyncSession, *, email: str) -> Optional[User]:
+        stmt = select(User).where(User.email == email, User.is_deleted == False)
+        return (await db.execute(stmt.limit(1))).scalars().first()
+
+    async def create(self, db: AsyncSession, *, obj_in: UserCreate) -> User:
+        hashed_password = await hash_pool.run_async(get_password_hash, obj_in.password)
+        return await self._insert(db, self._user_values(obj_in, hashed_password))
+
+    async def authenticate(
+        self, db: AsyncSession, *, email: str, password: str
+    ) -> Optional[User]:
+        user = await self.get_by_email(db, email=email)
+        if not user:
+            return None
+        valid, new_hash = await hash_pool.run_async(
+            verify_and_update_password, password, user.hashed_password
+        )
+        if not valid:
+            return None
+        if new_hash:
+            # Stored with an outdated bcrypt cost; upgrade it while we have the password
+            user = await self._update_values(db, user, {"hashed_password": new_hash})
+        return user
+
+    async def create_password_reset_token(
+        self, db: AsyncSession, *, email: str
+    ) -> Optional[str]:
+        user = await self.get_by_email(db, email=email)
+        if not user:
+            return None
+
+        token = secrets.token_urlsafe(32)
+        user.reset_token = token
+        user.reset_token_expires = utcnow() + timedelta(hours=1)
         db.add(user)
-        db.commit()
-        db.refresh(user)
+        await db.commit()
+        return token
+
+    async def verify_password_reset_token(
+        self, db: AsyncSession, *, token: str
+    ) -> Optional[User]:
+        stmt = select(User).where(User.reset_token == token, User.is_deleted == False)
+        user = (await db.execute(stmt.limit(1))).scalars().first()
+
+        if not self._reset_token_valid(user):
+            return None
+
         return user
 
+    async def reset_password(
+        self, db: AsyncSession, *, user: User, new_password: str
+    ) -> User:
+        values = {
+            "hashed_password": await hash_pool.run_async(
+                get_password_hash, new_password
+            ),
+            "reset_token": None,
+            "reset_token_expires": None,
+        }
+        return await self._update_values(db, user, values)
+
+    async def change_password(
+        self,
+        db: AsyncSession,
+        *,
+        user: User,
+        current_password: str,
+        new_password: str,
+    ) -> Optional[User]:
+        if not await hash_pool.run_async(
+            verify_password, current_password, user.hashed_password
+        ):
+            return None
+
+        values = {
+            "hashed_password": await hash_pool.run_async(
+                get_password_hash, new_password
+            )
+        }
+        return await self._update_values(db, user, values)
+
 
 user = CRUDUser(User)
+async_user = AsyncCRUDUser(User)
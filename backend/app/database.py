@@ -1,10 +1,169 @@
-from sqlalchemy import create_engine
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+from uuid import uuid4
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DisconnectionError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from app.core import query_guard
 from app.core.config import settings
+from app.core.metrics import TimedAsyncQueuePool, TimedQueuePool, instrument_engine
+from app.core.replicas import Replica, ReplicaSet
+
+# Set per request by the deps.*_statement_timeout dependencies; None (CLIs,
+# background jobs) leaves the server default
+statement_timeout: ContextVar[Optional[int]] = ContextVar(
+    "statement_timeout", default=None
+)
+
+
+def _pool_options() -> Dict[str, Any]:
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING == "always",
+    }
+
+
+def _on_checkin(dbapi_connection, connection_record) -> None:
+    connection_record.info["checked_in_at"] = time.monotonic()
+
+
+def _on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+    info = connection_record.info
+    if settings.DB_POOL_PRE_PING == "idle":
+        idle = time.monotonic() - info.get("checked_in_at", time.monotonic())
+        if idle >= settings.DB_POOL_PING_IDLE_SECONDS:
+            try:
+                connection_record.dialect.do_ping(dbapi_connection)
+            except Exception:
+                # The pool discards the connection and checks out another
+                raise DisconnectionError("connection failed the idle ping")
+
+    # Session-level, so it is only sent when the wanted value changes; in a
+    # transaction of its own, so a later rollback cannot undo it
+    wanted = statement_timeout.get()
+    if not settings.DB_PGBOUNCER and info.get("statement_timeout") != wanted:
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute(
+                "SET statement_timeout TO DEFAULT"
+                if wanted is None
+                else f"SET statement_timeout = {int(wanted)}"
+            )
+        finally:
+            cursor.close()
+        dbapi_connection.commit()
+        info["statement_timeout"] = wanted
+
+
+def _on_begin(conn) -> None:
+    # Behind a transaction pooler session settings would leak to other
+    # clients, so the timeout is set for each transaction instead
+    wanted = statement_timeout.get()
+    if wanted is not None:
+        conn.exec_driver_sql(f"SET LOCAL statement_timeout = {int(wanted)}")
 
-engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
+
+def configure_engine(engine: Engine, name: str) -> None:
+    engine.pool.engine_name = name
+    event.listen(engine, "checkin", _on_checkin)
+    event.listen(engine, "checkout", _on_checkout)
+    if settings.DB_PGBOUNCER:
+        event.listen(engine, "begin", _on_begin)
+    if settings.METRICS_ENABLED:
+        instrument_engine(engine, name)
+    if query_guard.enabled():
+        query_guard.instrument_engine(engine)
+
+
+def _connect_args(driver: str) -> Dict[str, Any]:
+    if settings.DB_PGBOUNCER:
+        # A transaction pooler rejects startup options, and server-side
+        # prepared statements break once queries move between server sessions
+        if driver == "asyncpg":
+            return {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            }
+        return {}
+    if not settings.DB_IDLE_IN_TRANSACTION_TIMEOUT_MS:
+        return {}
+    timeout = str(settings.DB_IDLE_IN_TRANSACTION_TIMEOUT_MS)
+    if driver == "asyncpg":
+        return {"server_settings": {"idle_in_transaction_session_timeout": timeout}}
+    return {"options": f"-c idle_in_transaction_session_timeout={timeout}"}
+
+
+engine = create_engine(
+    settings.DATABASE_URL,
+    poolclass=TimedQueuePool,
+    connect_args=_connect_args("psycopg2"),
+    **_pool_options(),
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+configure_engine(engine, "sync")
+
+# Only built in async mode so the sync deployment does not need asyncpg
+async_engine = None
+AsyncSessionLocal = None
+if settings.DB_MODE == "async":
+    async_engine = create_async_engine(
+        settings.ASYNC_DATABASE_URL,
+        poolclass=TimedAsyncQueuePool,
+        connect_args=_connect_args("asyncpg"),
+        **_pool_options(),
+    )
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False)
+    configure_engine(async_engine.sync_engine, "async")
+
+
+def _replica(number: int, url: str) -> Replica:
+    name = f"replica{number}"
+    replica_engine = create_engine(
+        url,
+        poolclass=TimedQueuePool,
+        connect_args=_connect_args("psycopg2"),
+        **_pool_options(),
+    )
+    configure_engine(replica_engine, name)
+    async_session = None
+    if settings.DB_MODE == "async":
+        replica_async_engine = create_async_engine(
+            url.replace("postgresql://", "postgresql+asyncpg://", 1),
+            poolclass=TimedAsyncQueuePool,
+            connect_args=_connect_args("asyncpg"),
+            **_pool_options(),
+        )
+        configure_engine(replica_async_engine.sync_engine, f"{name}-async")
+        async_session = async_sessionmaker(
+            replica_async_engine, autoflush=False, info={"replica": name}
+        )
+    return Replica(
+        name,
+        replica_engine,
+        sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            bind=replica_engine,
+            info={"replica": name},
+        ),
+        async_session,
+    )
+
+
+# Read-only copies of the primary for GET requests (see deps.get_db)
+replicas = ReplicaSet(
+    [_replica(number, url) for number, url in enumerate(settings.DB_REPLICA_URLS, 1)],
+    max_lag=settings.DB_REPLICA_MAX_LAG_SECONDS,
+)
 
 Base = declarative_base()
 
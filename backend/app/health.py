@@ -0,0 +1,197 @@
+import asyncio
+import logging
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from sqlalchemy import text
+
+from app import crud, schemas
+from app.core.config import settings
+from app.core.metrics import STARTUP_SECONDS, pool_stats
+from app.core.serialization import page_adapter
+from app.database import AsyncSessionLocal, SessionLocal, async_engine, engine, replicas
+from app.prestart import migration_heads
+
+logger = logging.getLogger(__name__)
+# uvicorn only configures its own loggers; this line must show in every log
+startup_logger = logging.getLogger("uvicorn.error")
+
+# Seconds per startup phase (prestart, warm_up) and, from process start, until
+# the app serves and until the first request is answered
+startup: Dict[str, float] = {}
+
+
+def process_uptime() -> Optional[float]:
+    """Seconds since this process started, interpreter start-up included.
+
+    Read from /proc (10 ms resolution); None where it is not available.
+    """
+    try:
+        with open("/proc/self/stat") as stat:
+            # Fields after the parenthesised command name, from field 3 on
+            started = int(stat.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as uptime:
+            since_boot = float(uptime.read().split()[0])
+    except (OSError, ValueError, IndexError):
+        return None
+    return since_boot - started / os.sysconf("SC_CLK_TCK")
+
+
+def record_startup(phase: str, seconds: Optional[float]) -> None:
+    if seconds is None:
+        return
+    startup[phase] = round(seconds, 3)
+    STARTUP_SECONDS.labels(phase).set(seconds)
+
+
+@contextmanager
+def startup_phase(phase: str) -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_startup(phase, time.perf_counter() - started)
+
+
+class StartupTimer:
+    """Records when the first request is answered, as time since process start.
+
+    This is the time-to-first-request a new instance adds to a deploy or a
+    scale-out; it is logged once and kept in ``startup``.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+        self.done = False
+
+    async def __call__(self, scope, receive, send) -> None:
+        if self.done or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message) -> None:
+            await send(message)
+            if (
+                not self.done
+                and message["type"] == "http.response.body"
+                and not message.get("more_body", False)
+            ):
+                self.done = True
+                record_startup("first_request", process_uptime())
+                startup_logger.info(f"Startup timings (seconds): {startup}")
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def readiness() -> Tuple[bool, Dict[str, Any]]:
+    """Whether this instance should get traffic, with the checks behind it.
+
+    Ready means the primary answers and its schema is at the migration head
+    this build expects. Replicas are reported but do not count: reads fall
+    back to the primary without them.
+    """
+    checks: Dict[str, Any] = {}
+    started = time.perf_counter()
+    try:
+        with engine.connect() as conn:
+            current = tuple(
+                sorted(
+                    conn.execute(text("SELECT version_num FROM alembic_version"))
+                    .scalars()
+                    .all()
+                )
+            )
+        checks["database"] = {
+            "ok": True,
+            "latency_ms": (time.perf_counter() - started) * 1000,
+        }
+    except Exception as exc:
+        current = None
+        checks["database"] = {"ok": False, "error": str(exc).splitlines()[0]}
+
+    heads = migration_heads()
+    checks["migrations"] = {
+        "ok": current == heads,
+        "current": list(current or ()),
+        "head": list(heads),
+    }
+    checks["pool"] = {"sync": pool_stats(engine.pool)}
+    if async_engine is not None:
+        checks["pool"]["async"] = pool_stats(async_engine.pool)
+    if replicas:
+        checks["replicas"] = replicas.stats()
+    checks["startup"] = startup
+    return checks["database"]["ok"] and checks["migrations"]["ok"], checks
+
+
+def _open_connections(count: int) -> None:
+    connections = [engine.connect() for _ in range(count)]
+    for connection in connections:
+        connection.close()
+
+
+def warm_up() -> None:
+    """Open the minimum pool connections and run the hot paths once.
+
+    The first real requests then skip connecting, SQL compilation and pydantic
+    schema builds. Failures are logged, not raised: readiness reports a
+    database that is not there.
+    """
+    started = time.perf_counter()
+    try:
+        _open_connections(min(settings.DB_POOL_MIN_CONNECTIONS, settings.DB_POOL_SIZE))
+        db = SessionLocal()
+        try:
+            fields = schemas.CONTACT_LIST_FIELDS
+            items, total = crud.contact.get_multi_filtered(
+                db, skip=0, limit=10, fields=fields
+            )
+            adapter = page_adapter(schemas.sparse_model(schemas.Contact, fields))
+            adapter.dump_json(
+                adapter.validate_python(
+                    {
+                        "items": items,
+                        "total": total.total,
+                        "total_exact": total.exact,
+                        "page": 0,
+                        "size": 10,
+                    }
+                )
+            )
+            user = crud.user.get_by_email(db, email=settings.FIRST_SUPERUSER_EMAIL)
+            if user:
+                crud.user.get(db, id=user.id)
+        finally:
+            db.close()
+    except Exception:
+        logger.exception("Warm-up failed")
+        return
+    logger.info(f"Warm-up done in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+
+async def warm_up_async() -> None:
+    """``warm_up`` for async mode: also warms the asyncpg pool and async CRUD."""
+    await asyncio.to_thread(warm_up)
+    started = time.perf_counter()
+    try:
+        count = min(settings.DB_POOL_MIN_CONNECTIONS, settings.DB_POOL_SIZE)
+        connections = [await async_engine.connect() for _ in range(count)]
+        for connection in connections:
+            await connection.close()
+        async with AsyncSessionLocal() as db:
+            await crud.async_contact.get_multi_filtered(
+                db, skip=0, limit=10, fields=schemas.CONTACT_LIST_FIELDS
+            )
+            user = await crud.async_user.get_by_email(
+                db, email=settings.FIRST_SUPERUSER_EMAIL
+            )
+            if user:
+                await crud.async_user.get(db, id=user.id)
+    except Exception:
+        logger.exception("Async warm-up failed")
+        return
+    logger.info(
+        f"Async warm-up done in {(time.perf_counter() - started) * 1000:.0f} ms"
+    )
@@ -0,0 +1,40 @@
+import argparse
+import logging
+from app.crud.contact_import import import_contacts
+from app.database import SessionLocal
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Bulk import contacts from a CSV or NDJSON file"
+    )
+    parser.add_argument("path", help="CSV (with header row) or NDJSON file")
+    parser.add_argument(
+        "--format",
+        choices=["csv", "ndjson"],
+        help="defaults to the file extension (.ndjson/.jsonl, otherwise csv)",
+    )
+    args = parser.parse_args()
+    fmt = args.format or (
+        "ndjson" if args.path.lower().endswith((".ndjson", ".jsonl")) else "csv"
+    )
+
+    logger.info(f"Importing contacts from {args.path}")
+    db = SessionLocal()
+    try:
+        with open(args.path, "rb") as stream:
+            report = import_contacts(db, stream, fmt=fmt)
+    finally:
+        db.close()
+    logger.info(
+        f"Processed {report.processed}: {report.created} created, "
+        f"{report.updated} updated, {report.failed} failed"
+    )
+    print(report.model_dump_json(indent=2))
+
+
+if __name__ == "__main__":
+    main()
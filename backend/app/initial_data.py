@@ -1,15 +1,19 @@
 import logging
+from datetime import datetime
 from sqlalchemy.orm import Session
 from app import crud, schemas
 from app.database import SessionLocal
 from app.core.config import settings
-from faker import Faker
+from app.crud.contact_seed import (
+    DEFAULT_CIUDADES,
+    DEFAULT_ESTADOS,
+    SeedConfig,
+    seed_contacts,
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-fake = Faker("es_ES")
-
 
 def init_db(db: Session) -> None:
     # Create first superuser
@@ -31,22 +35,15 @@ def init_db(db: Session) -> None:
     existing_contacts = crud.contact.get_multi(db, skip=0, limit=1)
     if not existing_contacts[0]:  # No contacts exist
         logger.info("Creating sample contacts...")
-        estados = ["prospecto", "calificado", "cliente", "inactivo"]
-
-        for i in range(20):
-            contact_in = schemas.ContactCreate(
-                nombres=fake.first_name(),
-                apellidos=f"{fake.last_name()} {fake.last_name()}",
-                nombre_completo=fake.name(),
-                email=fake.email(),
-                telefono=fake.phone_number(),
-                estado=fake.random_element(estados),
-                cedula=fake.bothify(text="##########"),
-                ciudad=fake.city(),
-                pais="Colombia",
-                notas=fake.text(max_nb_chars=200),
-            )
-            crud.contact.create(db, obj_in=contact_in)
+        # Same generator as app.seed_contacts, so emails are unique by construction
+        config = SeedConfig(
+            seed=0,
+            estados=DEFAULT_ESTADOS,
+            ciudades=DEFAULT_CIUDADES,
+            until=datetime.utcnow().replace(microsecond=0),
+            email_domain="example.com",
+        )
+        seed_contacts(config, 20)
 
         logger.info("Created 20 sample contacts")
     else:
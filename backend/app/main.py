@@ -1,11 +1,79 @@
-from fastapi import FastAPI
+import asyncio
+import secrets
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI, Header, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from app.api import deps, health
 from app.api.v1.api import api_router
 from app.core.config import settings
+from app.core.hashing import HashPoolSaturated
+from app.core.metrics import MetricsMiddleware
+from app.core.query_guard import QueryBudgetMiddleware
+from app.core.replicas import (
+    STICKY_HEADER,
+    ReadYourWritesMiddleware,
+    monitor_replicas,
+)
+from app.core.pagination import InvalidFieldError
+from app.crud.archive import archive_periodically
+from app.crud.contact_stats import reconcile_periodically
+from app.database import replicas
+from app.health import (
+    StartupTimer,
+    process_uptime,
+    record_startup,
+    startup_phase,
+    warm_up,
+    warm_up_async,
+)
+from app.prestart import prestart
+
+# SQLSTATE of a statement cancelled by statement_timeout
+QUERY_CANCELED = "57014"
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.STARTUP_PRESTART:
+        with startup_phase("prestart"):
+            await asyncio.to_thread(prestart)
+    tasks = []
+    if settings.STATS_RECONCILE_INTERVAL_SECONDS > 0:
+        tasks.append(
+            asyncio.create_task(
+                reconcile_periodically(settings.STATS_RECONCILE_INTERVAL_SECONDS)
+            )
+        )
+    if settings.ARCHIVE_INTERVAL_SECONDS > 0:
+        tasks.append(
+            asyncio.create_task(archive_periodically(settings.ARCHIVE_INTERVAL_SECONDS))
+        )
+    if replicas:
+        tasks.append(
+            asyncio.create_task(
+                monitor_replicas(replicas, settings.DB_REPLICA_CHECK_INTERVAL_SECONDS)
+            )
+        )
+    if settings.STARTUP_WARM_UP:
+        with startup_phase("warm_up"):
+            if settings.DB_MODE == "async":
+                await warm_up_async()
+            else:
+                await asyncio.to_thread(warm_up)
+    record_startup("serving", process_uptime())
+    yield
+    for task in tasks:
+        task.cancel()
+
 
 app = FastAPI(
     title=settings.APP_NAME,
     openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
+    lifespan=lifespan,
 )
 
 # CORS
@@ -15,10 +83,58 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[STICKY_HEADER],
 )
 
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+if settings.QUERY_BUDGET_MODE != "off":
+    app.add_middleware(QueryBudgetMiddleware)
+if replicas:
+    app.add_middleware(ReadYourWritesMiddleware)
+app.add_middleware(StartupTimer)
+
+
+@app.exception_handler(HashPoolSaturated)
+async def hash_pool_saturated_handler(request: Request, exc: HashPoolSaturated):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Servicio ocupado, intenta de nuevo en unos segundos"},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+@app.exception_handler(PoolTimeoutError)
+async def pool_timeout_handler(request: Request, exc: PoolTimeoutError):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Servicio ocupado, intenta de nuevo en unos segundos"},
+        headers={"Retry-After": "1"},
+    )
+
+
+@app.exception_handler(DBAPIError)
+async def statement_timeout_handler(request: Request, exc: DBAPIError):
+    if getattr(exc.orig, "pgcode", None) != QUERY_CANCELED:
+        raise exc
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "La consulta tardó demasiado, intenta acotarla"},
+    )
+
+
+@app.exception_handler(InvalidFieldError)
+async def invalid_field_handler(request: Request, exc: InvalidFieldError):
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
+
+
 # Include API router
-app.include_router(api_router, prefix=settings.API_V1_PREFIX)
+app.include_router(health.router, tags=["health"])
+app.include_router(
+    api_router,
+    prefix=settings.API_V1_PREFIX,
+    dependencies=[Depends(deps.short_statement_timeout)],
+)
 
 
 @app.get("/")
@@ -26,6 +142,13 @@ def read_root():
     return {"message": f"Welcome to {settings.APP_NAME}"}
 
 
-@app.get("/health")
-def health_check():
-    return {"status": "ok"}
+if settings.METRICS_ENABLED:
+
+    @app.get("/metrics", include_in_schema=False)
+    def metrics(authorization: str = Header("")):
+        expected = f"Bearer {settings.METRICS_TOKEN}".encode()
+        if settings.METRICS_TOKEN and not secrets.compare_digest(
+            authorization.encode(), expected
+        ):
+            raise HTTPException(status_code=401, detail="No autorizado")
+        return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -1,4 +1,13 @@
 from .user import User
 from .contact import Contact, ContactStatus
+from .contact_stats import contact_stats
+from .archive import contacts_archive, users_archive
 
-__all__ = ["User", "Contact", "ContactStatus"]
+__all__ = [
+    "User",
+    "Contact",
+    "ContactStatus",
+    "contact_stats",
+    "contacts_archive",
+    "users_archive",
+]
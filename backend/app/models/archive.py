@@ -0,0 +1,59 @@
+from sqlalchemy import Boolean, Column, DateTime, Enum, String, Table, text
+from sqlalchemy.dialects.postgresql import UUID
+from app.database import Base
+from app.models.contact import ContactStatus
+
+# Soft-deleted contacts and users moved out of the live tables by
+# app.crud.archive (see migration 007). Same columns minus is_deleted, the
+# derived search_vector and the user's reset token, plus archived_at; no
+# indexes beyond the id and archived_at, as nothing reads them by anything else
+
+
+def _base_columns() -> list:
+    return [
+        Column("id", UUID(as_uuid=True), primary_key=True),
+        Column("created_at", DateTime, nullable=False),
+        Column("updated_at", DateTime, nullable=False),
+    ]
+
+
+def _archived_at() -> Column:
+    return Column(
+        "archived_at",
+        DateTime,
+        nullable=False,
+        index=True,
+        server_default=text("timezone('utc', now())"),
+    )
+
+
+contacts_archive = Table(
+    "contacts_archive",
+    Base.metadata,
+    *_base_columns(),
+    Column("nombres", String, nullable=False),
+    Column("apellidos", String, nullable=False),
+    Column("nombre_completo", String, nullable=False),
+    Column("email", String, nullable=False),
+    Column("telefono", String, nullable=False),
+    Column("estado", Enum(ContactStatus), nullable=False),
+    Column("cedula", String),
+    Column("ciudad", String),
+    Column("pais", String),
+    Column("notas", String),
+    _archived_at(),
+)
+
+users_archive = Table(
+    "users_archive",
+    Base.metadata,
+    *_base_columns(),
+    Column("email", String, nullable=False),
+    Column("hashed_password", String, nullable=False),
+    Column("nombres", String, nullable=False),
+    Column("apellidos", String, nullable=False),
+    Column("is_active", Boolean, nullable=False),
+    Column("is_superuser", Boolean, nullable=False),
+    Column("theme_preference", String, nullable=False),
+    _archived_at(),
+)
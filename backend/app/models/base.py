@@ -5,17 +5,19 @@ import uuid
 from app.database import Base
 
 
+def utcnow() -> datetime:
+    """Current UTC time as a naive datetime, matching the TIMESTAMP columns.
+
+    asyncpg refuses aware datetimes for ``timestamp without time zone`` and
+    psycopg2 would shift them by the session time zone, so store naive UTC.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 class BaseModel(Base):
     __abstract__ = True
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    created_at = Column(
-        DateTime, default=lambda: datetime.now(timezone.utc), nullable=False
-    )
-    updated_at = Column(
-        DateTime,
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
-        nullable=False,
-    )
+    created_at = Column(DateTime, default=utcnow, nullable=False)
+    updated_at = Column(DateTime, default=utcnow, onupdate=utcnow, nullable=False)
     is_deleted = Column(Boolean, default=False, nullable=False, index=True)
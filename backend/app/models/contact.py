@@ -1,7 +1,15 @@
-from sqlalchemy import Column, String, Enum
+from sqlalchemy import Column, FetchedValue, String, Enum, literal_column
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred
 import enum
 from app.models.base import BaseModel
 
+# Must match migration 004 verbatim for the trigram index to apply
+SEARCH_DOCUMENT_SQL = (
+    "f_unaccent(lower(nombre_completo || ' ' || email || ' ' || telefono"
+    " || ' ' || coalesce(cedula, '')))"
+)
+
 
 class ContactStatus(str, enum.Enum):
     PROSPECTO = "prospecto"
@@ -25,3 +33,12 @@ class Contact(BaseModel):
     ciudad = Column(String, nullable=True, index=True)
     pais = Column(String, nullable=True, default="Colombia")
     notas = Column(String, nullable=True)
+    # Maintained by a trigger (migration 004); only used for filtering and
+    # ranking, never loaded or written by the application
+    search_vector = deferred(
+        Column(TSVECTOR, server_default=FetchedValue(), server_onupdate=FetchedValue())
+    )
+
+
+# Accent-folded, lower-cased text covered by the trigram index
+search_document = literal_column(SEARCH_DOCUMENT_SQL)
@@ -0,0 +1,16 @@
+from sqlalchemy import BigInteger, Column, SmallInteger, String, Table
+from app.database import Base
+
+# Live contacts per (dimension, key), e.g. ("estado", "CLIENTE") or
+# ("created_day", "2026-10-17"). Kept current by statement-level triggers on
+# contacts (see migration 005); NULL cities and countries are counted under "".
+# Each key is split over shards, one per writing backend, so concurrent writes
+# do not queue on a single row (migration 008): a key's count is the shards' sum
+contact_stats = Table(
+    "contact_stats",
+    Base.metadata,
+    Column("dimension", String, primary_key=True),
+    Column("key", String, primary_key=True),
+    Column("shard", SmallInteger, primary_key=True, server_default="0"),
+    Column("count", BigInteger, nullable=False, server_default="0"),
+)
@@ -0,0 +1,108 @@
+import logging
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Tuple
+
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
+
+from app.core.config import settings
+from app.database import SessionLocal, engine
+
+logger = logging.getLogger(__name__)
+
+# pg_advisory lock key that lets a single instance migrate and seed at a time
+PRESTART_LOCK_KEY = 72_016
+PRESTART_POLL_SECONDS = 0.5
+
+ALEMBIC_DIR = Path(__file__).resolve().parent.parent / "alembic"
+
+# One round trip for the whole state; fails on a database never migrated
+_STATE_SQL = text("""
+    SELECT
+        (SELECT array_agg(version_num ORDER BY version_num) FROM alembic_version),
+        EXISTS (SELECT 1 FROM users WHERE email = :email AND is_superuser)
+    """)
+
+
+def alembic_config() -> Config:
+    # No ini file: env.py would otherwise run fileConfig on it and replace the
+    # server's logging; the database URL comes from settings there
+    config = Config()
+    config.set_main_option("script_location", str(ALEMBIC_DIR))
+    return config
+
+
+@lru_cache(maxsize=1)
+def migration_heads() -> Tuple[str, ...]:
+    """Head revisions of the migration scripts shipped with this build."""
+    return tuple(sorted(ScriptDirectory.from_config(alembic_config()).get_heads()))
+
+
+def _state(conn) -> Tuple[Tuple[str, ...], bool]:
+    try:
+        revisions, superuser = conn.execute(
+            _STATE_SQL, {"email": settings.FIRST_SUPERUSER_EMAIL}
+        ).one()
+    except ProgrammingError:
+        return (), False
+    return tuple(revisions or ()), superuser
+
+
+def prestart() -> bool:
+    """Migrate to head and create the initial data, unless already done.
+
+    The common case, a restart or another replica of an up-to-date deployment,
+    costs one query. Otherwise the instance takes ``PRESTART_LOCK_KEY`` and
+    checks again: replicas starting together wait for the first one instead of
+    all migrating, then find nothing left to do. Returns whether anything ran.
+    """
+    started = time.perf_counter()
+    # Autocommit: an open transaction here, even one only waiting for the
+    # lock, would block CREATE INDEX CONCURRENTLY in the migrations forever
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        revisions, superuser = _state(conn)
+        if revisions == migration_heads() and superuser:
+            logger.info(
+                f"Database at {', '.join(revisions)}, nothing to do "
+                f"({(time.perf_counter() - started) * 1000:.0f} ms)"
+            )
+            return False
+
+        # Session lock, so DATABASE_URL must not go through a transaction pooler
+        while not conn.execute(
+            text("SELECT pg_try_advisory_lock(:key)"), {"key": PRESTART_LOCK_KEY}
+        ).scalar():
+            time.sleep(PRESTART_POLL_SECONDS)
+        try:
+            revisions, superuser = _state(conn)
+            if revisions != migration_heads():
+                logger.info(f"Migrating from {list(revisions)} to head")
+                command.upgrade(alembic_config(), "head")
+            if not superuser:
+                from app.initial_data import init_db
+
+                db = SessionLocal()
+                try:
+                    init_db(db)
+                finally:
+                    db.close()
+        finally:
+            conn.execute(
+                text("SELECT pg_advisory_unlock(:key)"), {"key": PRESTART_LOCK_KEY}
+            )
+    logger.info(f"Prestart done in {(time.perf_counter() - started) * 1000:.0f} ms")
+    return True
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    prestart()
+
+
+if __name__ == "__main__":
+    main()
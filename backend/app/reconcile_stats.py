@@ -0,0 +1,23 @@
+import logging
+from app.crud.contact_stats import reconcile_stats
+from app.database import SessionLocal
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    logger.info("Reconciling contact stats")
+    db = SessionLocal()
+    try:
+        corrected = reconcile_stats(db)
+    finally:
+        db.close()
+    if corrected is None:
+        logger.info("Another reconcile is running, nothing done")
+    else:
+        logger.info(f"Corrected {corrected} drifted counts")
+
+
+if __name__ == "__main__":
+    main()
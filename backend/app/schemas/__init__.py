@@ -7,8 +7,26 @@ from .auth import (
     PasswordChange,
 )
 from .user import User, UserCreate, UserUpdate, UserInDB
-from .contact import Contact, ContactCreate, ContactUpdate, ContactInDB
-from .common import PaginatedResponse
+from .contact import (
+    Contact,
+    ContactCreate,
+    ContactUpdate,
+    ContactInDB,
+    ContactImport,
+    ContactImportError,
+    ContactImportReport,
+    ContactSelection,
+    ContactBulkUpdate,
+    ContactBulkResult,
+    ContactStats,
+    CONTACT_LIST_FIELDS,
+)
+from .common import (
+    PaginatedResponse,
+    CursorPaginatedResponse,
+    select_fields,
+    sparse_model,
+)
 
 __all__ = [
     "Token",
@@ -25,5 +43,16 @@ __all__ = [
     "ContactCreate",
     "ContactUpdate",
     "ContactInDB",
+    "ContactImport",
+    "ContactImportError",
+    "ContactImportReport",
+    "ContactSelection",
+    "ContactBulkUpdate",
+    "ContactBulkResult",
+    "ContactStats",
+    "CONTACT_LIST_FIELDS",
     "PaginatedResponse",
+    "CursorPaginatedResponse",
+    "select_fields",
+    "sparse_model",
 ]
@@ -1,5 +1,6 @@
-from typing import Generic, List, TypeVar
-from pydantic import BaseModel
+from functools import lru_cache
+from typing import Generic, List, Optional, Sequence, Tuple, Type, TypeVar
+from pydantic import BaseModel, create_model
 
 T = TypeVar("T")
 
@@ -7,5 +8,60 @@ T = TypeVar("T")
 class PaginatedResponse(BaseModel, Generic[T]):
     items: List[T]
     total: int
+    # False when ``total`` is a planner estimate or a cached count that may lag
+    total_exact: bool = True
     page: int
     size: int
+
+
+class CursorPaginatedResponse(BaseModel, Generic[T]):
+    items: List[T]
+    size: int
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+
+def select_fields(
+    model: Type[BaseModel],
+    fields: Optional[str],
+    *,
+    default: Optional[Sequence[str]] = None,
+) -> Tuple[str, ...]:
+    """Field names of ``model`` picked by a ``fields=`` query value.
+
+    ``fields`` is a comma separated list of API names (aliases such as
+    ``nombreCompleto`` or plain field names); ``id`` is always included. Without
+    it, ``default`` (or every field) is used. Unknown names raise ``ValueError``.
+    """
+    if fields is None:
+        return tuple(default or model.model_fields)
+    names = {}
+    for name, info in model.model_fields.items():
+        names[name] = name
+        if info.alias:
+            names[info.alias] = name
+    selected = {"id"} if "id" in model.model_fields else set()
+    for part in fields.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if part not in names:
+            raise ValueError(f"Campo desconocido: {part}")
+        selected.add(names[part])
+    return tuple(name for name in model.model_fields if name in selected)
+
+
+@lru_cache(maxsize=None)
+def sparse_model(model: Type[BaseModel], fields: Tuple[str, ...]) -> Type[BaseModel]:
+    """``model`` trimmed to ``fields``, keeping their aliases and the model config."""
+    if fields == tuple(model.model_fields):
+        return model
+    return create_model(
+        f"{model.__name__}Fields",
+        __config__=model.model_config,
+        **{
+            name: (info.annotation, info)
+            for name, info in model.model_fields.items()
+            if name in fields
+        },
+    )
@@ -1,8 +1,8 @@
-from typing import Optional
-from pydantic import BaseModel, EmailStr, Field
-from datetime import datetime
+from typing import Dict, List, Optional
+from pydantic import BaseModel, EmailStr, Field, model_validator
+from datetime import date, datetime
 from uuid import UUID
-from app.models.contact import ContactStatus
+from app.models.contact import Contact as ContactModel, ContactStatus
 
 
 class ContactBase(BaseModel):
@@ -25,6 +25,27 @@ class ContactCreate(ContactBase):
     pass
 
 
+class ContactImport(ContactBase):
+    """One row of a bulk import; ``nombreCompleto`` is derived when omitted."""
+
+    nombre_completo: Optional[str] = Field(None, alias="nombreCompleto")
+
+
+class ContactImportError(BaseModel):
+    line: int
+    detail: str
+
+
+class ContactImportReport(BaseModel):
+    processed: int = 0
+    created: int = 0
+    updated: int = 0
+    failed: int = 0
+    errors: List[ContactImportError] = []
+    # True when more rows failed than are listed in ``errors``
+    errors_truncated: bool = False
+
+
 class ContactUpdate(BaseModel):
     nombres: Optional[str] = None
     apellidos: Optional[str] = None
@@ -41,6 +62,57 @@ class ContactUpdate(BaseModel):
         populate_by_name = True
 
 
+class ContactSelection(BaseModel):
+    """Contacts targeted by a bulk operation: explicit ids and/or listing filters."""
+
+    ids: Optional[List[UUID]] = None
+    estado: Optional[List[ContactStatus]] = None
+    q: Optional[str] = Field(None, min_length=1, max_length=200)
+
+    @model_validator(mode="after")
+    def check_not_empty(self) -> "ContactSelection":
+        # Guard against touching every contact because of a missing field
+        if not (self.ids or self.estado or self.q):
+            raise ValueError("Indica ids o al menos un filtro (estado, q)")
+        return self
+
+
+class ContactBulkUpdate(ContactSelection):
+    patch: ContactUpdate
+
+    @model_validator(mode="after")
+    def check_patch(self) -> "ContactBulkUpdate":
+        fields = self.patch.model_fields_set
+        if not fields:
+            raise ValueError("El patch no tiene campos")
+        if "email" in fields:
+            raise ValueError("El email no se puede cambiar en bloque")
+        for name in fields:
+            if (
+                getattr(self.patch, name) is None
+                and not ContactModel.__table__.columns[name].nullable
+            ):
+                raise ValueError(f"{name} no puede ser nulo")
+        return self
+
+
+class ContactBulkResult(BaseModel):
+    affected: int
+
+
+class ContactStats(BaseModel):
+    """Live contact counts; missing cities and countries are listed under ""."""
+
+    total: int
+    by_estado: Dict[ContactStatus, int] = Field(alias="byEstado")
+    by_ciudad: Dict[str, int] = Field(alias="byCiudad")
+    by_pais: Dict[str, int] = Field(alias="byPais")
+    created_per_day: Dict[date, int] = Field(alias="createdPerDay")
+
+    class Config:
+        populate_by_name = True
+
+
 class ContactInDB(ContactBase):
     id: UUID
     created_at: datetime = Field(alias="createdAt")
@@ -54,3 +126,7 @@ class ContactInDB(ContactBase):
 
 class Contact(ContactInDB):
     pass
+
+
+# Lists leave out the free-text notes unless they are asked for with fields=
+CONTACT_LIST_FIELDS = tuple(name for name in Contact.model_fields if name != "notas")
@@ -0,0 +1,59 @@
+"""Compare two ``benchmarks.suite`` result files and flag regressions.
+
+    cd backend && python -m benchmarks.compare before.json after.json --threshold 0.15
+
+Compares medians benchmark by benchmark. Exits with status 1 when any
+benchmark got slower than ``--threshold`` (a fraction, 0.15 = 15%) and by more
+than ``--min-delta-ms``, which keeps noise on sub-millisecond paths from
+failing the comparison.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("candidate", type=Path)
+    parser.add_argument("--threshold", type=float, default=0.15)
+    parser.add_argument("--min-delta-ms", type=float, default=0.05)
+    args = parser.parse_args()
+
+    baseline = json.loads(args.baseline.read_text())
+    candidate = json.loads(args.candidate.read_text())
+    print(
+        f"baseline {baseline['meta'].get('commit')} -> "
+        f"candidate {candidate['meta'].get('commit')}"
+    )
+
+    regressions = 0
+    for name, result in candidate["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            print(f"  new       {name}: {result['median_ms']:.3f} ms")
+            continue
+        delta = result["median_ms"] - before["median_ms"]
+        ratio = delta / before["median_ms"] if before["median_ms"] else 0.0
+        if ratio > args.threshold and delta > args.min_delta_ms:
+            regressions += 1
+            label = "SLOWER"
+        elif -ratio > args.threshold and -delta > args.min_delta_ms:
+            label = "faster"
+        else:
+            continue
+        print(
+            f"  {label:<9} {name}: {before['median_ms']:.3f} -> "
+            f"{result['median_ms']:.3f} ms ({ratio:+.0%})"
+        )
+    for name in baseline["results"].keys() - candidate["results"].keys():
+        print(f"  missing   {name}")
+
+    print(f"{regressions} regression(s) above {args.threshold:.0%}")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Round trips and latency of CRUDBase writes per ``CRUD_WRITE_MODE``.
+
+Runs create, update and remove on throwaway contacts against the configured
+database and reports, per operation and mode, the round trips (statements plus
+the BEGIN and COMMIT psycopg2 sends on their own) and the median/p95 latency.
+
+    cd backend && python -m benchmarks.crud_write_modes --iterations 200
+"""
+
+import argparse
+import statistics
+import time
+import uuid
+from typing import Callable, Dict, List
+
+from sqlalchemy import delete, event
+
+from app import crud, schemas
+from app.core.config import settings
+from app.database import SessionLocal, engine
+from app.models.contact import Contact
+
+EMAIL_DOMAIN = "benchmark.example.com"
+
+
+class RoundTrips:
+    """Counts statements, BEGINs and COMMITs sent through ``engine``."""
+
+    def __init__(self):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._statement)
+        event.listen(engine, "begin", self._statement)
+        event.listen(engine, "commit", self._statement)
+
+    def _statement(self, *args) -> None:
+        self.count += 1
+
+
+def measure(operation: Callable[[], object], trips: RoundTrips) -> tuple[float, int]:
+    before = trips.count
+    started = time.perf_counter()
+    operation()
+    return time.perf_counter() - started, trips.count - before
+
+
+def run_mode(mode: str, iterations: int, trips: RoundTrips) -> Dict[str, Dict]:
+    settings.CRUD_WRITE_MODE = mode
+    timings: Dict[str, List[float]] = {"create": [], "update": [], "remove": []}
+    round_trips: Dict[str, List[int]] = {"create": [], "update": [], "remove": []}
+    db = SessionLocal()
+    try:
+        for i in range(iterations):
+            contact_in = schemas.ContactCreate(
+                nombres="Bench",
+                apellidos=f"{mode} {i}",
+                nombre_completo=f"Bench {mode} {i}",
+                email=f"{mode}-{i}-{uuid.uuid4().hex[:8]}@{EMAIL_DOMAIN}",
+                telefono="3000000000",
+            )
+            created = {}
+
+            def create():
+                created["obj"] = crud.contact.create(db, obj_in=contact_in)
+                # Serializing the response reads every attribute
+                schemas.Contact.model_validate(created["obj"])
+
+            elapsed, trips_used = measure(create, trips)
+            timings["create"].append(elapsed)
+            round_trips["create"].append(trips_used)
+
+            def update():
+                obj = crud.contact.update(
+                    db,
+                    db_obj=created["obj"],
+                    obj_in=schemas.ContactUpdate(ciudad=f"Ciudad {i}"),
+                )
+                schemas.Contact.model_validate(obj)
+
+            elapsed, trips_used = measure(update, trips)
+            timings["update"].append(elapsed)
+            round_trips["update"].append(trips_used)
+
+            def remove():
+                obj = crud.contact.remove(db, id=created["obj"].id)
+                schemas.Contact.model_validate(obj)
+
+            elapsed, trips_used = measure(remove, trips)
+            timings["remove"].append(elapsed)
+            round_trips["remove"].append(trips_used)
+    finally:
+        db.execute(delete(Contact).where(Contact.email.like(f"%@{EMAIL_DOMAIN}")))
+        db.commit()
+        db.close()
+
+    return {
+        operation: {
+            "round_trips": statistics.median(round_trips[operation]),
+            "median_ms": statistics.median(values) * 1000,
+            "p95_ms": sorted(values)[int(len(values) * 0.95) - 1] * 1000,
+        }
+        for operation, values in timings.items()
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    trips = RoundTrips()
+    results = {
+        mode: run_mode(mode, args.iterations, trips) for mode in ("orm", "returning")
+    }
+
+    print(
+        f"{'operation':<10}{'mode':<11}{'round trips':>12}{'median ms':>11}{'p95 ms':>9}"
+    )
+    for operation in ("create", "update", "remove"):
+        for mode, stats in results.items():
+            row = stats[operation]
+            print(
+                f"{operation:<10}{mode:<11}{row['round_trips']:>12}"
+                f"{row['median_ms']:>11.2f}{row['p95_ms']:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+"""Micro-benchmarks of the CRUD, auth and serialization hot paths.
+
+Needs the database configured through the usual settings (.env). A local
+stand-in is the compose service: ``docker compose up -d db`` then
+``alembic upgrade head``. The suite seeds ``--rows`` throwaway contacts (on
+EMAIL_DOMAIN, removed afterwards), so an empty database is fine.
+
+    cd backend && python -m benchmarks.suite --iterations 50
+    python -m benchmarks.suite --output before.json   # on the old commit
+    python -m benchmarks.suite --output after.json    # on the new commit
+    python -m benchmarks.compare before.json after.json
+
+Results are written as JSON (``benchmarks/results/<time>-<commit>.json`` by
+default) with one entry per benchmark: iterations and min/median/p95/mean in
+milliseconds, plus the commit and settings they were measured with. The result
+cache is disabled while measuring, so list timings are real queries.
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import delete, func, select, text
+
+from app import crud, schemas
+from app.api import deps
+from app.core import security
+from app.core.config import settings
+from app.core.result_cache import result_cache
+from app.core.serialization import page_adapter
+from app.crud.contact import SORTABLE_FIELDS
+from app.crud.contact_import import ContactImporter
+from app.crud.user import principal_cache
+from app.database import SessionLocal
+from app.models.contact import Contact, ContactStatus
+from app.models.user import User
+
+EMAIL_DOMAIN = "benchmark.example.com"
+RESULTS_DIR = Path(__file__).parent / "results"
+
+FILTERS: Dict[str, Dict[str, Any]] = {
+    "all": {},
+    "estado": {"estados": [ContactStatus.CLIENTE]},
+    "search": {"search": "gomez"},
+    "estado+search": {"estados": [ContactStatus.CLIENTE], "search": "gomez"},
+}
+SORTS: List[Tuple[Optional[str], str]] = [(None, "asc")] + [
+    (field, order) for field in SORTABLE_FIELDS for order in ("asc", "desc")
+]
+APELLIDOS = ["Gómez", "Pérez", "Díaz", "Ruiz", "López", "Martínez", "Rojas"]
+CIUDADES = ["Bogotá", "Medellín", "Cali", "Barranquilla", None]
+
+
+def timed(function: Callable[[], Any], iterations: int, warmup: int = 2) -> Dict:
+    for _ in range(min(warmup, iterations)):
+        function()
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        function()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {
+        "iterations": iterations,
+        "min_ms": samples[0],
+        "median_ms": statistics.median(samples),
+        "p95_ms": samples[max(0, int(len(samples) * 0.95) - 1)],
+        "mean_ms": statistics.fmean(samples),
+    }
+
+
+def seed_records(rows: int) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    generator = random.Random(42)
+    for line in range(rows):
+        yield line, {
+            "nombres": f"Bench{line}",
+            "apellidos": generator.choice(APELLIDOS),
+            "email": f"seed-{line}@{EMAIL_DOMAIN}",
+            "telefono": str(generator.randint(3000000000, 3999999999)),
+            "estado": generator.choice(list(ContactStatus)).value,
+            "ciudad": generator.choice(CIUDADES),
+        }
+
+
+def cleanup() -> None:
+    db = SessionLocal()
+    try:
+        db.execute(delete(Contact).where(Contact.email.like(f"%@{EMAIL_DOMAIN}")))
+        db.execute(delete(User).where(User.email.like(f"%@{EMAIL_DOMAIN}")))
+        db.commit()
+    finally:
+        db.close()
+
+
+def bench_lists(iterations: int) -> Dict[str, Dict]:
+    results = {}
+    db = SessionLocal()
+    try:
+        for filter_name, filters in FILTERS.items():
+            for sort_field, sort_order in SORTS:
+                case = f"{filter_name}|{sort_field or 'default'}|{sort_order}"
+                name = f"contact.get_multi_filtered[{case}]"
+                results[name] = timed(
+                    lambda: crud.contact.get_multi_filtered(
+                        db,
+                        skip=20,
+                        limit=20,
+                        sort_field=sort_field,
+                        sort_order=sort_order,
+                        **filters,
+                    ),
+                    iterations,
+                )
+                db.expunge_all()
+    finally:
+        db.close()
+    return results
+
+
+def bench_writes(iterations: int) -> Dict[str, Dict]:
+    db = SessionLocal()
+    created: List[Contact] = []
+    counter = iter(range(10**9))
+
+    def create() -> None:
+        contact_in = schemas.ContactCreate(
+            nombres="Bench",
+            apellidos="Write",
+            nombre_completo="Bench Write",
+            email=f"write-{next(counter)}-{uuid.uuid4().hex[:8]}@{EMAIL_DOMAIN}",
+            telefono="3000000000",
+        )
+        created.append(crud.contact.create(db, obj_in=contact_in))
+
+    def update() -> None:
+        db_obj = created[next(counter) % len(created)]
+        crud.contact.update(
+            db, db_obj=db_obj, obj_in=schemas.ContactUpdate(ciudad="Pasto")
+        )
+
+    def remove() -> None:
+        crud.contact.remove(db, id=created.pop().id)
+
+    try:
+        return {
+            "contact.create": timed(create, iterations, warmup=0),
+            "contact.update": timed(update, iterations),
+            "contact.remove": timed(remove, min(iterations, len(created)), warmup=0),
+        }
+    finally:
+        db.close()
+
+
+def bench_auth(iterations: int) -> Dict[str, Dict]:
+    db = SessionLocal()
+    try:
+        user = crud.user.create(
+            db,
+            obj_in=schemas.UserCreate(
+                email=f"user-{uuid.uuid4().hex[:8]}@{EMAIL_DOMAIN}",
+                password="benchmark-password",
+                nombres="Bench",
+                apellidos="User",
+            ),
+        )
+        token = security.create_access_token(user.id)
+        hashed = security.get_password_hash("benchmark-password")
+
+        def current_user_uncached() -> None:
+            principal_cache.clear()
+            deps.get_current_user(db=db, token=token)
+
+        # bcrypt is deliberately slow; a handful of runs is enough
+        bcrypt_iterations = max(3, iterations // 10)
+        return {
+            "auth.jwt_encode": timed(
+                lambda: security.create_access_token(user.id), iterations
+            ),
+            "auth.jwt_decode": timed(lambda: deps._token_subject(token), iterations),
+            "auth.get_current_user[cached]": timed(
+                lambda: deps.get_current_user(db=db, token=token), iterations
+            ),
+            "auth.get_current_user[uncached]": timed(current_user_uncached, iterations),
+            "auth.bcrypt_hash": timed(
+                lambda: security.get_password_hash("benchmark-password"),
+                bcrypt_iterations,
+                warmup=0,
+            ),
+            "auth.bcrypt_verify": timed(
+                lambda: security.verify_password("benchmark-password", hashed),
+                bcrypt_iterations,
+                warmup=0,
+            ),
+        }
+    finally:
+        principal_cache.clear()
+        db.close()
+
+
+def bench_serialization(iterations: int, size: int = 100) -> Dict[str, Dict]:
+    db = SessionLocal()
+    try:
+        stmt = select(Contact).where(Contact.is_deleted == False).limit(size)
+        items = list(db.execute(stmt).scalars())
+        rows = [schemas.Contact.model_validate(item).model_dump() for item in items]
+    finally:
+        db.close()
+    page_type = schemas.PaginatedResponse[schemas.Contact]
+
+    def page(data: List[Any]) -> Dict[str, Any]:
+        return {"items": data, "total": 10**5, "page": 0, "size": size}
+
+    def response_model_path() -> None:
+        # What FastAPI does with a returned dict and response_model
+        validated = page_type.model_validate(page(items))
+        json.dumps(jsonable_encoder(validated.model_dump(by_alias=True)))
+
+    adapter = page_adapter(schemas.Contact)
+    return {
+        f"serialize.paginated_contacts[response_model|{size}]": timed(
+            response_model_path, iterations
+        ),
+        f"serialize.paginated_contacts[adapter_orm|{size}]": timed(
+            lambda: adapter.dump_json(adapter.validate_python(page(items))),
+            iterations,
+        ),
+        f"serialize.paginated_contacts[adapter_rows|{size}]": timed(
+            lambda: adapter.dump_json(adapter.validate_python(page(rows))),
+            iterations,
+        ),
+    }
+
+
+def metadata(rows: int) -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    db = SessionLocal()
+    try:
+        server_version = db.execute(text("SHOW server_version")).scalar()
+        contacts = db.execute(
+            select(func.count()).select_from(Contact).where(Contact.is_deleted == False)
+        ).scalar()
+    finally:
+        db.close()
+    return {
+        "commit": commit,
+        "measured_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "postgres": server_version,
+        "seeded_rows": rows,
+        "live_contacts": contacts,
+        "settings": {
+            "CRUD_WRITE_MODE": settings.CRUD_WRITE_MODE,
+            "READ_MODE": settings.READ_MODE,
+            "COUNT_STRATEGY": settings.COUNT_STRATEGY,
+            "BCRYPT_ROUNDS": settings.BCRYPT_ROUNDS,
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--output", type=Path)
+    parser.add_argument(
+        "--only",
+        choices=["lists", "writes", "auth", "serialization"],
+        action="append",
+        help="run only these groups (repeatable)",
+    )
+    args = parser.parse_args()
+    groups = {
+        "lists": bench_lists,
+        "writes": bench_writes,
+        "auth": bench_auth,
+        "serialization": bench_serialization,
+    }
+
+    result_cache.backend = None
+    cleanup()
+    db = SessionLocal()
+    try:
+        ContactImporter(db).run(seed_records(args.rows))
+        db.execute(text("ANALYZE contacts"))
+        db.commit()
+    finally:
+        db.close()
+
+    results: Dict[str, Dict] = {}
+    try:
+        meta = metadata(args.rows)
+        for name, bench in groups.items():
+            if args.only and name not in args.only:
+                continue
+            for key, value in bench(args.iterations).items():
+                results[key] = value
+                print(f"{key:<72}{value['median_ms']:>10.3f} ms")
+    finally:
+        cleanup()
+
+    output = args.output or RESULTS_DIR / (
+        f"{meta['measured_at'].replace(':', '')}-{meta['commit'] or 'nocommit'}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({"meta": meta, "results": results}, indent=2))
+    print(f"Saved {len(results)} results to {output}")
+
+
+if __name__ == "__main__":
+    main()
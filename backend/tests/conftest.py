@@ -0,0 +1,79 @@
+from contextlib import contextmanager
+from typing import Iterator, List
+
+import pytest
+from pydantic import ValidationError
+
+# The app is imported inside the fixtures: importing it reads the settings and
+# builds the engines, which needs the database environment (.env or variables).
+# Without it, tests that need the app are skipped instead of failing collection
+
+
+@pytest.fixture(scope="session")
+def engines() -> list:
+    """The app's engines, or a skip when the database is not configured/reachable."""
+    try:
+        from app.database import async_engine, engine
+    except ValidationError as exc:
+        pytest.skip(f"settings incomplete: {exc.error_count()} missing values")
+    try:
+        with engine.connect():
+            pass
+    except Exception as exc:
+        pytest.skip(f"database unreachable: {str(exc).splitlines()[0]}")
+    return [engine] + ([async_engine.sync_engine] if async_engine is not None else [])
+
+
+@pytest.fixture(scope="session")
+def client(engines):
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    # One event loop for the whole session (asyncpg connections are bound to
+    # the loop that opened them), with the lifespan run as in production
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def superuser_headers(engines) -> dict:
+    from app import crud
+    from app.core.config import settings
+    from app.core.security import create_access_token
+    from app.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        user = crud.user.get_by_email(db, email=settings.FIRST_SUPERUSER_EMAIL)
+    finally:
+        db.close()
+    if user is None:
+        pytest.skip("no superuser: run python -m app.initial_data")
+    return {"Authorization": f"Bearer {create_access_token(user.id)}"}
+
+
+@pytest.fixture
+def assert_max_queries(engines):
+    """Fail when the block runs more SQL statements than ``limit``.
+
+        def test_list(client, assert_max_queries):
+            with assert_max_queries(3):
+                client.get("/api/contactos/")
+
+    Statements are counted on the app engines from any thread, so requests made
+    through ``TestClient`` count too. Warm the principal cache first when the
+    auth lookup should not be part of the count.
+    """
+    from app.core.query_guard import count_queries
+
+    @contextmanager
+    def check(limit: int) -> Iterator[List[str]]:
+        with count_queries(*engines) as statements:
+            yield statements
+        assert len(statements) <= limit, (
+            f"{len(statements)} SQL statements, expected at most {limit}:\n"
+            + "\n".join(statements)
+        )
+
+    return check
@@ -0,0 +1,107 @@
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from starlette.requests import Request
+
+from app.core.conditional import (
+    http_date,
+    is_not_modified,
+    make_etag,
+    not_modified,
+    resource_etag,
+)
+
+ETAG = make_etag("filter_estado=cliente", 42)
+OTHER = make_etag("filter_estado=cliente", 43)
+MODIFIED = datetime(2026, 10, 17, 12, 30, 5, 987654)
+
+
+def _request(**headers: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "headers": [
+                (name.replace("_", "-").encode(), value.encode())
+                for name, value in headers.items()
+            ],
+        }
+    )
+
+
+def test_etag_is_stable_and_strong():
+    assert make_etag("a", 1) == make_etag("a", 1)
+    assert ETAG.startswith('"') and ETAG.endswith('"')
+    assert not ETAG.startswith("W/")
+    assert make_etag("a", 1) != make_etag("a", 2)
+    assert make_etag("a", 1) != make_etag(1, "a")
+
+
+def test_resource_etag_follows_updated_at():
+    row_id = uuid.uuid4()
+    assert resource_etag(row_id, MODIFIED) == resource_etag(row_id, MODIFIED)
+    assert resource_etag(row_id, MODIFIED) != resource_etag(
+        row_id, MODIFIED + timedelta(microseconds=1)
+    )
+
+
+@pytest.mark.parametrize(
+    "if_none_match,matches",
+    [
+        (ETAG, True),
+        ("*", True),
+        (" * ", True),
+        (f"W/{ETAG}", True),
+        (f"{OTHER}, {ETAG}", True),
+        (f"{OTHER},W/{ETAG}", True),
+        (OTHER, False),
+        (f"W/{OTHER}", False),
+        (ETAG.strip('"'), False),
+        ("", False),
+    ],
+)
+def test_if_none_match(if_none_match, matches):
+    assert is_not_modified(_request(if_none_match=if_none_match), ETAG) is matches
+
+
+def test_if_modified_since_ignored_with_if_none_match():
+    fresh = http_date(MODIFIED)
+    stale = http_date(MODIFIED - timedelta(days=1))
+    request = _request(if_none_match=OTHER, if_modified_since=fresh)
+    assert not is_not_modified(request, ETAG, MODIFIED)
+    request = _request(if_none_match=ETAG, if_modified_since=stale)
+    assert is_not_modified(request, ETAG, MODIFIED)
+
+
+@pytest.mark.parametrize(
+    "if_modified_since,matches",
+    [
+        # HTTP dates drop the microseconds the row's timestamp has
+        (http_date(MODIFIED), True),
+        (http_date(MODIFIED + timedelta(hours=1)), True),
+        (http_date(MODIFIED - timedelta(seconds=1)), False),
+        ("not a date", False),
+        # No time zone
+        ("Sat, 17 Oct 2026 12:30:05", False),
+    ],
+)
+def test_if_modified_since(if_modified_since, matches):
+    request = _request(if_modified_since=if_modified_since)
+    assert is_not_modified(request, ETAG, MODIFIED) is matches
+
+
+def test_no_validators():
+    assert not is_not_modified(_request(), ETAG, MODIFIED)
+    # Without a Last-Modified there is nothing to compare the date with
+    request = _request(if_modified_since=http_date(MODIFIED))
+    assert not is_not_modified(request, ETAG)
+
+
+def test_not_modified_response():
+    response = not_modified(ETAG, MODIFIED)
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == ETAG
+    assert response.headers["last-modified"] == "Sat, 17 Oct 2026 12:30:05 GMT"
+    assert response.headers["cache-control"] == "private, no-cache"
@@ -0,0 +1,51 @@
+import json
+from uuid import uuid4
+
+
+def _row(email: str, nombres: str) -> str:
+    return json.dumps(
+        {
+            "nombres": nombres,
+            "apellidos": "Importado",
+            "email": email,
+            "telefono": "3000000000",
+        }
+    )
+
+
+def test_import_report_accounts_for_every_row(client, superuser_headers):
+    first = f"import-{uuid4().hex}@test.example.com"
+    second = f"import-{uuid4().hex}@test.example.com"
+    lines = [
+        _row(first, "Primera"),
+        _row(second, "Segunda"),
+        "{no es json",
+        _row(first, "Repetida"),
+    ]
+    response = client.post(
+        "/api/contactos/import",
+        files={"file": ("contactos.ndjson", "\n".join(lines).encode())},
+        headers=superuser_headers,
+    )
+    assert response.status_code == 200, response.text
+    report = response.json()
+    try:
+        assert report["processed"] == 4
+        assert (report["created"], report["updated"], report["failed"]) == (2, 0, 2)
+        assert report["processed"] == (
+            report["created"] + report["updated"] + report["failed"]
+        )
+        errors = {error["line"]: error["detail"] for error in report["errors"]}
+        assert errors.keys() == {1, 3}
+        assert "línea 4" in errors[1]
+
+        listed = client.get(
+            "/api/contactos/", params={"q": first}, headers=superuser_headers
+        ).json()["items"]
+        assert [item["nombres"] for item in listed] == ["Repetida"]
+    finally:
+        for email in (first, second):
+            for item in client.get(
+                "/api/contactos/", params={"q": email}, headers=superuser_headers
+            ).json()["items"]:
+                client.delete(f"/api/contactos/{item['id']}", headers=superuser_headers)
@@ -0,0 +1,216 @@
+import base64
+import json
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from pydantic import ValidationError
+
+from app.core.pagination import (
+    Cursor,
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    load_cursor_value,
+)
+
+# No database here: keyset criteria are evaluated in Python against rows
+# ordered the way Postgres orders them (NULLs last ascending, first descending)
+
+
+@pytest.fixture(scope="module")
+def crud_contact():
+    try:
+        from app.crud.contact import contact
+    except ValidationError as exc:
+        pytest.skip(f"settings incomplete: {exc.error_count()} missing values")
+    return contact
+
+
+def _token(payload) -> str:
+    raw = json.dumps(payload).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def test_cursor_round_trip():
+    cursor = Cursor(
+        sort_field="created_at",
+        sort_order="desc",
+        value=datetime(2026, 10, 17, 12, 30, 5, 123456),
+        id=uuid.uuid4(),
+        backwards=True,
+    )
+    decoded = decode_cursor(encode_cursor(cursor))
+    assert decoded._replace(value=load_cursor_value(decoded.value, datetime)) == (
+        cursor
+    )
+
+
+def test_cursor_round_trip_null_value():
+    cursor = Cursor("ciudad", "asc", None, uuid.uuid4(), False)
+    decoded = decode_cursor(encode_cursor(cursor))
+    assert decoded == cursor
+    assert load_cursor_value(decoded.value, str) is None
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        "",
+        "not base64!",
+        base64.urlsafe_b64encode(b"not json").decode(),
+        _token(["s", "o"]),
+        _token({"s": "ciudad", "o": "asc", "v": "x", "b": False}),
+        _token({"s": "ciudad", "o": "asc", "v": "x", "id": "nope", "b": False}),
+    ],
+)
+def test_decode_rejects_bad_cursor(token):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(token)
+
+
+def test_load_rejects_bad_value():
+    with pytest.raises(InvalidCursorError):
+        load_cursor_value("yesterday", datetime)
+
+
+def test_cursor_for_another_sort_is_rejected(crud_contact):
+    token = encode_cursor(Cursor("ciudad", "asc", "bogota", uuid.uuid4(), False))
+    with pytest.raises(InvalidCursorError):
+        _plan(crud_contact, token, sort_order="desc")
+    with pytest.raises(InvalidCursorError):
+        crud_contact._keyset_plan(
+            cursor=token,
+            sort_field="apellidos",
+            sort_order="asc",
+            limit=2,
+            estados=None,
+            search=None,
+        )
+
+
+def _plan(crud_contact, cursor, *, sort_order, limit=2):
+    return crud_contact._keyset_plan(
+        cursor=cursor,
+        sort_field="ciudad",
+        sort_order=sort_order,
+        limit=limit,
+        estados=None,
+        search=None,
+    )
+
+
+def _value(element, row):
+    from sqlalchemy.sql.elements import BindParameter, Null, Tuple
+
+    if isinstance(element, Tuple):
+        return tuple(_value(clause, row) for clause in element.clauses)
+    if isinstance(element, BindParameter):
+        return element.value
+    if isinstance(element, Null):
+        return None
+    return getattr(row, element.key)
+
+
+def _matches(criterion, row) -> bool:
+    from sqlalchemy.sql import operators
+
+    left, right = _value(criterion.left, row), _value(criterion.right, row)
+    if criterion.operator is operators.is_:
+        return left is None
+    if criterion.operator is operators.is_not:
+        return left is not None
+    # Any NULL makes the comparison NULL, which filters the row out
+    if None in (left if isinstance(left, tuple) else (left,)):
+        return False
+    if criterion.operator is operators.gt:
+        return left > right
+    if criterion.operator is operators.lt:
+        return left < right
+    raise AssertionError(f"unexpected operator {criterion.operator}")
+
+
+def _ordered(rows, ascending: bool) -> list:
+    return sorted(
+        rows,
+        key=lambda row: (row.ciudad is None, row.ciudad or "", row.id),
+        reverse=not ascending,
+    )
+
+
+def _fetch(crud_contact, rows, plan, limit: int) -> list:
+    """What the page query returns for ``plan``: ``limit + 1`` rows."""
+    from app.models.contact import Contact
+
+    backwards = plan.position.backwards if plan.position else False
+    ascending = (plan.sort_order == "asc") != backwards
+    remaining = _ordered(rows, ascending)
+    if plan.position:
+        segments = crud_contact._keyset_segments(
+            Contact.ciudad,
+            plan.position.value,
+            plan.position.id,
+            ascending=ascending,
+            nullable=True,
+        )
+        remaining = [
+            row
+            for row in remaining
+            if any(all(_matches(c, row) for c in segment) for segment in segments)
+        ]
+    return remaining[: limit + 1]
+
+
+@pytest.fixture
+def rows() -> list:
+    cities = ["bogota", None, "cali", "bogota", None, "medellin", "cali", None]
+    return [SimpleNamespace(id=uuid.uuid4(), ciudad=city) for city in cities]
+
+
+@pytest.mark.parametrize("sort_order", ["asc", "desc"])
+@pytest.mark.parametrize("limit", [1, 2, 3, 8])
+def test_walk_with_nulls(crud_contact, rows, sort_order, limit):
+    expected = [row.id for row in _ordered(rows, sort_order == "asc")]
+
+    pages, cursor = [], None
+    while True:
+        plan = _plan(crud_contact, cursor, sort_order=sort_order, limit=limit)
+        items, next_cursor, prev_cursor = crud_contact._keyset_page(
+            _fetch(crud_contact, rows, plan, limit), plan, limit
+        )
+        assert (prev_cursor is None) == (cursor is None)
+        pages.append([row.id for row in items])
+        if next_cursor is None:
+            break
+        cursor = next_cursor
+    assert [row_id for page in pages for row_id in page] == expected
+
+    # And back to the first page from the last one
+    cursor, back = prev_cursor, []
+    while cursor is not None:
+        plan = _plan(crud_contact, cursor, sort_order=sort_order, limit=limit)
+        items, _, cursor = crud_contact._keyset_page(
+            _fetch(crud_contact, rows, plan, limit), plan, limit
+        )
+        back.insert(0, [row.id for row in items])
+    assert back == pages[:-1]
+
+
+def test_null_segments_are_unioned(crud_contact):
+    from sqlalchemy.dialects import postgresql
+
+    # Past the last non-NULL city ascending, only the NULLs remain: one range
+    after_nulls = encode_cursor(Cursor("ciudad", "asc", None, uuid.uuid4(), False))
+    plan = _plan(crud_contact, after_nulls, sort_order="asc")
+    assert len(plan.criteria) == 2
+
+    # Before it, the walk spans non-NULL values then the NULLs: two ranges
+    cursor = encode_cursor(Cursor("ciudad", "asc", "bogota", uuid.uuid4(), False))
+    plan = _plan(crud_contact, cursor, sort_order="asc", limit=5)
+    [criterion] = plan.criteria
+    sql = str(criterion.compile(dialect=postgresql.dialect()))
+    assert sql.count("UNION ALL") == 1
+    assert "(contacts.ciudad, contacts.id) >" in sql
+    assert "contacts.ciudad IS NULL" in sql
+    assert sql.count("LIMIT") == 2
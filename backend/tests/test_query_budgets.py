@@ -0,0 +1,103 @@
+from uuid import uuid4
+
+import pytest
+
+# SQL statements each endpoint may run, with the principal already cached.
+# Raise a budget only on purpose: an extra statement per request is the kind of
+# regression (an N+1, a lazy load, a second count) these tests are here to catch
+READ_BUDGETS = [
+    ("/api/contactos/", {}, 3),
+    (
+        "/api/contactos/",
+        {"filter_estado": "cliente", "q": "maria", "sort": "apellidos"},
+        3,
+    ),
+    ("/api/contactos/", {"pagination": "cursor", "sort": "apellidos"}, 2),
+    ("/api/contactos/", {"fields": "nombreCompleto,email"}, 3),
+    ("/api/contactos/stats", {}, 1),
+    ("/api/auth/me", {}, 0),
+    ("/api/users/", {}, 3),
+]
+
+
+@pytest.fixture
+def headers(client, superuser_headers) -> dict:
+    # Resolves the bearer token once, so the counts below exclude the lookup
+    client.get("/api/auth/me", headers=superuser_headers)
+    return superuser_headers
+
+
+@pytest.fixture
+def contact(client, headers) -> dict:
+    response = client.post(
+        "/api/contactos/",
+        json={
+            "nombres": "Presupuesto",
+            "apellidos": "Consultas",
+            "nombreCompleto": "",
+            "email": f"budget-{uuid4().hex}@test.example.com",
+            "telefono": "3000000000",
+        },
+        headers=headers,
+    )
+    assert response.status_code == 200, response.text
+    created = response.json()
+    yield created
+    client.delete(f"/api/contactos/{created['id']}", headers=headers)
+
+
+@pytest.mark.parametrize("path,params,budget", READ_BUDGETS)
+def test_read_budget(client, headers, assert_max_queries, path, params, budget):
+    with assert_max_queries(budget):
+        response = client.get(path, params=params, headers=headers)
+    assert response.status_code == 200, response.text
+
+
+def test_read_contact_budget(client, headers, contact, assert_max_queries):
+    with assert_max_queries(2):
+        response = client.get(f"/api/contactos/{contact['id']}", headers=headers)
+    assert response.status_code == 200
+
+
+def test_create_contact_budget(client, headers, assert_max_queries):
+    with assert_max_queries(2):
+        response = client.post(
+            "/api/contactos/",
+            json={
+                "nombres": "Nuevo",
+                "apellidos": "Contacto",
+                "nombreCompleto": "",
+                "email": f"budget-{uuid4().hex}@test.example.com",
+                "telefono": "3000000000",
+            },
+            headers=headers,
+        )
+    assert response.status_code == 200, response.text
+    client.delete(f"/api/contactos/{response.json()['id']}", headers=headers)
+
+
+def test_update_contact_budget(client, headers, contact, assert_max_queries):
+    with assert_max_queries(3):
+        response = client.put(
+            f"/api/contactos/{contact['id']}", json={"notas": "x"}, headers=headers
+        )
+    assert response.status_code == 200, response.text
+
+
+def test_delete_contact_budget(client, headers, contact, assert_max_queries):
+    with assert_max_queries(3):
+        response = client.delete(f"/api/contactos/{contact['id']}", headers=headers)
+    assert response.status_code == 200, response.text
+
+
+def test_cached_page_revalidation_budget(client, headers, assert_max_queries):
+    from app.core.result_cache import result_cache
+
+    if not result_cache.enabled:
+        pytest.skip("result cache disabled")
+    etag = client.get("/api/contactos/", headers=headers).headers["etag"]
+    with assert_max_queries(0):
+        response = client.get(
+            "/api/contactos/", headers={**headers, "If-None-Match": etag}
+        )
+    assert response.status_code == 304
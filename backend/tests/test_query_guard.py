@@ -0,0 +1,50 @@
+from uuid import uuid4
+
+import pytest
+
+
+@pytest.fixture
+def failing_explain(engines, monkeypatch):
+    """Log every statement as slow, with an EXPLAIN that always fails."""
+    from sqlalchemy import event
+
+    from app.core import query_guard
+    from app.core.config import settings
+
+    explain = query_guard._explain
+    explained = []
+
+    def broken(conn, statement, parameters):
+        explained.append(explain(conn, f"{statement} no_such_clause", parameters))
+        return explained[-1]
+
+    monkeypatch.setattr(query_guard, "_explain", broken)
+    monkeypatch.setattr(settings, "SLOW_QUERY_MS", 0.001)
+    monkeypatch.setattr(settings, "SLOW_QUERY_EXPLAIN", True)
+    # The engines are only instrumented when the guard is enabled at startup
+    added = [
+        engine
+        for engine in engines
+        if not event.contains(
+            engine, "after_cursor_execute", query_guard._after_cursor_execute
+        )
+    ]
+    for engine in added:
+        query_guard.instrument_engine(engine)
+    yield explained
+    for engine in added:
+        event.remove(
+            engine, "before_cursor_execute", query_guard._before_cursor_execute
+        )
+        event.remove(engine, "after_cursor_execute", query_guard._after_cursor_execute)
+
+
+def test_failed_explain_keeps_transaction(client, superuser_headers, failing_explain):
+    # A search no page is cached for, so the count and the page are both read,
+    # in the same transaction
+    response = client.get(
+        "/api/contactos/", params={"q": uuid4().hex}, headers=superuser_headers
+    )
+    assert response.status_code == 200, response.text
+    assert failing_explain
+    assert all(plan.startswith("EXPLAIN failed") for plan in failing_explain)
@@ -0,0 +1,135 @@
+import json
+import time
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event, text
+
+
+@pytest.fixture
+def lagging_replica(engines, monkeypatch):
+    """Route replica reads to a snapshot of the primary taken before the test.
+
+    A transaction on the primary exports its snapshot and stays open; sessions
+    of the fake replica import it, so they miss every later write as a replica
+    lagging by the whole test would.
+    """
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+    from sqlalchemy.orm import sessionmaker
+
+    from app.api import deps
+    from app.core.replicas import Replica, ReplicaSet
+    from app.database import async_engine, engine
+
+    exporter = engine.connect().execution_options(isolation_level="REPEATABLE READ")
+    exporter.begin()
+    snapshot = exporter.execute(text("SELECT pg_export_snapshot()")).scalar()
+
+    def import_snapshot(conn) -> None:
+        conn.exec_driver_sql(f"SET TRANSACTION SNAPSHOT '{snapshot}'")
+
+    stale = engine.execution_options(isolation_level="REPEATABLE READ")
+    event.listen(stale, "begin", import_snapshot)
+    async_session = None
+    if async_engine is not None:
+        stale_async = async_engine.execution_options(isolation_level="REPEATABLE READ")
+        event.listen(stale_async.sync_engine, "begin", import_snapshot)
+        async_session = async_sessionmaker(
+            stale_async, autoflush=False, info={"replica": "lagging"}
+        )
+    replica = Replica(
+        "lagging",
+        stale,
+        sessionmaker(bind=stale, autoflush=False, info={"replica": "lagging"}),
+        async_session,
+    )
+    replica.healthy = True
+    monkeypatch.setattr(deps, "replicas", ReplicaSet([replica], max_lag=0))
+    yield replica
+    exporter.rollback()
+    exporter.close()
+
+
+@pytest.fixture
+def reader_headers(superuser_headers) -> dict:
+    """Another client of the same user, which has not written."""
+    from jose import jwt
+
+    from app.core.config import settings
+    from app.core.security import create_access_token
+
+    subject = jwt.get_unverified_claims(
+        superuser_headers["Authorization"].removeprefix("Bearer ")
+    )["sub"]
+    token = create_access_token(
+        subject, timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES + 1)
+    )
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def writer_headers(superuser_headers) -> dict:
+    """The writing client, echoing the header as the frontend does.
+
+    Echoed by hand because the middleware setting it is only mounted when
+    replicas are configured at startup.
+    """
+    from app.core.replicas import STICKY_HEADER
+
+    return {**superuser_headers, STICKY_HEADER: f"{time.time() + 5:.0f}"}
+
+
+@pytest.fixture
+def written(client, superuser_headers, lagging_replica) -> dict:
+    """A contact created after the replica's snapshot, so missing from it."""
+    marker = f"Rezago{uuid4().hex[:12]}"
+    client.cookies.clear()
+    response = client.post(
+        "/api/contactos/",
+        json={
+            "nombres": marker,
+            "apellidos": "Replica",
+            "nombreCompleto": "",
+            "email": f"{marker.lower()}@test.example.com",
+            "telefono": "3000000000",
+        },
+        headers=superuser_headers,
+    )
+    assert response.status_code == 200, response.text
+    client.cookies.clear()
+    yield {**response.json(), "marker": marker}
+    client.delete(f"/api/contactos/{response.json()['id']}", headers=superuser_headers)
+    client.cookies.clear()
+
+
+def test_sticky_read_after_replica_read(
+    client, reader_headers, writer_headers, written
+):
+    """A replica's page cached after a write must not reach the writer."""
+    from app.core.result_cache import result_cache
+
+    if not result_cache.enabled:
+        pytest.skip("result cache disabled")
+    params = {"q": written["marker"]}
+    stale = client.get("/api/contactos/", params=params, headers=reader_headers)
+    assert stale.status_code == 200, stale.text
+    assert stale.json()["total"] == 0
+
+    fresh = client.get("/api/contactos/", params=params, headers=writer_headers)
+    assert fresh.status_code == 200, fresh.text
+    assert [item["id"] for item in fresh.json()["items"]] == [written["id"]]
+    assert fresh.headers["etag"] != stale.headers["etag"]
+
+
+def test_export_follows_read_routing(client, reader_headers, writer_headers, written):
+    params = {"q": written["marker"], "format": "ndjson"}
+    stale = client.get("/api/contactos/export", params=params, headers=reader_headers)
+    assert stale.status_code == 200, stale.text
+    assert stale.text == ""
+
+    fresh = client.get("/api/contactos/export", params=params, headers=writer_headers)
+    assert fresh.status_code == 200, fresh.text
+    assert [json.loads(line)["id"] for line in fresh.text.splitlines()] == [
+        written["id"]
+    ]
@@ -29,15 +29,31 @@ const axiosInstance: AxiosInstance = axios.create({
   },
 });
 
+// After a write the API returns X-Primary-Until; sending it back until then
+// keeps our reads off read replicas that may not have our change yet
+const PRIMARY_UNTIL_HEADER = 'X-Primary-Until';
+let primaryUntil = 0;
+
 // Add auth token to requests
 axiosInstance.interceptors.request.use((config) => {
   const token = localStorage.getItem('token');
   if (token) {
     (config.headers as any).Authorization = `Bearer ${token}`;
   }
+  if (primaryUntil > Date.now() / 1000) {
+    (config.headers as any)[PRIMARY_UNTIL_HEADER] = String(primaryUntil);
+  }
   return config;
 });
 
+axiosInstance.interceptors.response.use((response) => {
+  const until = Number(response.headers[PRIMARY_UNTIL_HEADER.toLowerCase()]);
+  if (until) {
+    primaryUntil = until;
+  }
+  return response;
+});
+
 // Helper to convert camelCase to snake_case
 const camelToSnake = (str: string): string => {
   return str.replace(/[A-Z]/g, (letter) => `_${letter.toLowerCase()}`);